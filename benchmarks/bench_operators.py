@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Benchmark of Fuzzy Tools operators on synthetic scenes, without a user interface.
+#
+#   blender -b --factory-startup -P benchmarks/bench_operators.py -- --output results.json
+#   blender -b --factory-startup -P benchmarks/bench_operators.py -- --baseline baseline.json
+#   python benchmarks/bench_operators.py --scales small      (with the bpy module)
+#
+# Each scene scale has N cameras, M markers, K actions with P keys and H hair objects.
+# --save-baseline stores the results as baseline; with --baseline, cases that got slower
+# than the tolerance are listed and the exit code is 1.
+
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fuzzy_tools
+from fuzzy_tools.keyframes import key_values
+from fuzzy_tools.markers import check, rule_applied
+
+
+SCALES = {
+    'small': dict(cameras=5, markers=20, actions=10, keys=50, hair=2),
+    'medium': dict(cameras=25, markers=200, actions=100, keys=200, hair=10),
+    'large': dict(cameras=100, markers=1000, actions=500, keys=500, hair=40),
+}
+
+FRAME_END = 1000
+
+
+# ------------------------------------------------------------------------
+#    SYNTHETIC SCENES
+# ------------------------------------------------------------------------
+
+def cube_mesh(name):
+    mesh = bpy.data.meshes.new(name)
+    verts = [(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)]
+    faces = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1), (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+    mesh.from_pydata(verts, [], faces)
+    return mesh
+
+
+def build_scene(cameras, markers, actions, keys, hair):
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    scene.frame_start = 1
+    scene.frame_end = FRAME_END
+    link = scene.collection.objects.link
+
+    cams = []
+    for i in range(cameras):
+        cam = bpy.data.objects.new(f"CAM.{i + 1:03d}", bpy.data.cameras.new(f"CAM.{i + 1:03d}"))
+        cam.location = (i * 2.0, -25, 2.5)
+        link(cam)
+        cams.append(cam)
+    scene.camera = cams[0] if cams else None
+
+    # camera binds, motion blur markers and render rules
+    for i in range(markers):
+        frame = 1 + i * FRAME_END // max(markers, 1)
+        kind = i % 4
+        if kind == 0 and cams:
+            marker = scene.timeline_markers.new(f"F_{frame}", frame=frame)
+            marker.camera = cams[(i // 4) % len(cams)]
+        elif kind == 1:
+            scene.timeline_markers.new("mblur_on 0.5", frame=frame)
+        elif kind == 2:
+            scene.timeline_markers.new("mblur_off", frame=frame)
+        else:
+            scene.timeline_markers.new(f"fz samples={8 + i % 3 * 8} res={50 + i % 2 * 50}", frame=frame)
+
+    frames = [1 + j * FRAME_END // max(keys, 1) for j in range(keys)]
+    for i in range(actions):
+        ob = bpy.data.objects.new(f"Animated.{i:04d}", None)
+        link(ob)
+        if keys:
+            values = [(i + j) % 7 * 0.5 for j in range(keys)]
+            key_values(ob, 'location', frames, values, interpolation='BEZIER')
+
+    for i in range(hair):
+        ob = bpy.data.objects.new(f"Hair.{i:03d}", cube_mesh(f"Hair.{i:03d}"))
+        link(ob)
+        mod = ob.modifiers.new("Hair", 'PARTICLE_SYSTEM')
+        settings = mod.particle_system.settings
+        settings.type = 'HAIR'
+        settings.count = 100
+        if hasattr(bpy.data, 'hair_curves'):
+            curves = bpy.data.objects.new(f"Curves.{i:03d}", bpy.data.hair_curves.new(f"Curves.{i:03d}"))
+            link(curves)
+    return scene, cams
+
+
+# ------------------------------------------------------------------------
+#    CASES
+# ------------------------------------------------------------------------
+
+# each case builds what it needs untimed and returns the function to time
+
+def case_check(scene, cams):
+    def run():
+        rule_applied.clear()
+        for frame in range(scene.frame_start, scene.frame_end + 1):
+            scene.frame_current = frame
+            check(scene)
+    return run
+
+
+def case_keyframes_markers(scene, cams):
+    scene.frame_current = 10
+    return lambda: bpy.ops.transform.keyframes_markers(frame_shift=5)
+
+
+def case_hair_viewport(scene, cams):
+    return lambda: bpy.ops.object.hair_viewport(hide=True)
+
+
+def case_fuzzy_camera(scene, cams):
+    return lambda: bpy.ops.object.fuzzy_camera()
+
+
+def case_rename_camera_alphabet(scene, cams):
+    if len(cams) < 2:
+        return None
+    selected = cams[:min(len(cams), 26)]
+
+    def run():
+        with bpy.context.temp_override(selected_objects=selected, active_object=selected[0]):
+            bpy.ops.object.rename_camera_alphabet()
+    return run
+
+
+def case_build_all(scene, cams):
+    return lambda: bpy.ops.scene.build_all()
+
+
+# register again, after unregister in the untimed part
+def case_register(scene, cams):
+    fuzzy_tools.unregister()
+    return fuzzy_tools.register
+
+
+CASES = {
+    'check': case_check,
+    'keyframes_markers': case_keyframes_markers,
+    'hair_viewport': case_hair_viewport,
+    'fuzzy_camera': case_fuzzy_camera,
+    'rename_camera_alphabet': case_rename_camera_alphabet,
+    'build_all': case_build_all,
+    'register': case_register,
+}
+
+
+# run a case on a fresh scene each repeat. Returns timing stats or the error
+def time_case(case, scale, repeat):
+    times = []
+    for _ in range(repeat):
+        scene, cams = build_scene(**scale)
+        run = case(scene, cams)
+        if run is None:
+            return {'skipped': "needs at least two cameras"}
+        start = time.perf_counter()
+        try:
+            run()
+        except Exception as e:
+            return {'error': f"{type(e).__name__}: {e}"}
+        times.append(time.perf_counter() - start)
+    return {'median_s': round(statistics.median(times), 6), 'min_s': round(min(times), 6),
+            'runs': len(times)}
+
+
+# ------------------------------------------------------------------------
+#    BASELINE
+# ------------------------------------------------------------------------
+
+# cases slower than baseline by more than tolerance (fraction) and min_seconds,
+# and cases that ran in the baseline but fail or are skipped now. As (scale, name, change)
+def compare(results, baseline, tolerance, min_seconds):
+    regressions = []
+    for scale, cases in results['scales'].items():
+        for name, stats in cases.items():
+            old = baseline.get('scales', {}).get(scale, {}).get(name, {}).get('median_s')
+            new = stats.get('median_s')
+            if old is None:
+                continue
+            if new is None:
+                regressions.append((scale, name, f"{old * 1000:.2f} ms -> "
+                                                 f"{stats.get('error') or stats.get('skipped')}"))
+            elif new > old * (1 + tolerance) and new - old > min_seconds:
+                regressions.append((scale, name, f"{old * 1000:.2f} ms -> {new * 1000:.2f} ms"))
+    return regressions
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="bench_operators.py",
+                                     description="Time Fuzzy Tools operators on synthetic scenes")
+    parser.add_argument('--scales', default='small,medium',
+                        help=f"Comma separated scales: {', '.join(SCALES)}")
+    parser.add_argument('--cases', default=','.join(CASES),
+                        help="Comma separated cases (default: all)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per case, the median counts")
+    parser.add_argument('--output', help="Write results as JSON")
+    parser.add_argument('--baseline', help="Compare with this results JSON")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Write the results to --baseline instead of comparing")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed slowdown as fraction of the baseline")
+    parser.add_argument('--min-ms', type=float, default=2.0,
+                        help="Ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    fuzzy_tools.register()
+    results = {
+        'blender': bpy.app.version_string,
+        'fuzzy_tools': ".".join(map(str, fuzzy_tools.bl_info['version'])),
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'repeat': args.repeat,
+        'scales': {},
+    }
+    for scale in args.scales.split(','):
+        results['scales'][scale] = {}
+        for name in args.cases.split(','):
+            stats = time_case(CASES[name], SCALES[scale], args.repeat)
+            results['scales'][scale][name] = stats
+            if 'median_s' in stats:
+                print(f"{scale:<8} {name:<24} {stats['median_s'] * 1000:10.2f} ms", flush=True)
+            else:
+                print(f"{scale:<8} {name:<24} {stats.get('error') or stats.get('skipped')}", flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+    if args.baseline and args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=1)
+        print(f"Baseline saved to {args.baseline}")
+    elif args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance, args.min_ms / 1000)
+        for scale, name, change in regressions:
+            print(f"REGRESSION {scale} {name}: {change}")
+        if regressions:
+            return 1
+        print("No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
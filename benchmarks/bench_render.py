@@ -0,0 +1,207 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Render benchmark of the Fuzzy scene setup, without a user interface.
+#
+#   blender -b --factory-startup -P benchmarks/bench_render.py -- --output render.json
+#
+# Builds camera, floor, Fuzzy World, sun, rim light and test geometry, then renders a fixed
+# set of frames for each settings variant under Cycles CPU, and under EEVEE when this
+# Blender can open a (software) GL context. Prints time per frame and peak memory per variant.
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+import bpy
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fuzzy_tools
+from fuzzy_tools.common import is_next_version
+from fuzzy_tools.builders import BUILD_PROFILES, build_parts
+from fuzzy_tools.render_log import render_log_paused, render_log_state
+
+
+FRAMES = (1, 12, 24)
+
+# one setting differs from 'base' per variant
+VARIANTS = {
+    'base': {},
+    'motion_blur': {'motion_blur': True},
+    'floor_holdout': {'floor': 'HOLDOUT'},
+    'floor_ao': {'floor_ao': True},
+    'gradient': {'world': 'GRADIENT'},
+}
+
+BASE = {'motion_blur': False, 'floor': 'CATCHER', 'floor_ao': False, 'world': 'HDRI'}
+
+
+# ------------------------------------------------------------------------
+#    SCENE
+# ------------------------------------------------------------------------
+
+def eevee_engine():
+    engines = {item.identifier for item in bpy.types.RenderSettings.bl_rna.properties['engine'].enum_items}
+    return 'BLENDER_EEVEE_NEXT' if 'BLENDER_EEVEE_NEXT' in engines else 'BLENDER_EEVEE'
+
+
+def build_scene(engine, samples, percentage):
+    bpy.ops.wm.read_factory_settings(use_empty=True)
+    scene = bpy.context.scene
+    scene.frame_start, scene.frame_end = min(FRAMES), max(FRAMES)
+    parts = BUILD_PROFILES['all']
+    if engine == 'CYCLES':
+        parts = [part for part in parts if part != 'eevee']
+    build_parts(parts)
+    scene.camera = scene.camera or scene.objects.get('CAM.001')
+    # after building, 'eevee' switches the engine to EEVEE
+    scene.render.engine = engine
+    scene.render.resolution_percentage = percentage
+    scene.render.filepath = os.path.join(tempfile.gettempdir(), "fuzzy_bench_render", "")
+
+    if engine == 'CYCLES':
+        scene.cycles.device = 'CPU'
+        scene.cycles.samples = samples
+    else:
+        scene.eevee.taa_render_samples = samples
+
+    # test geometry: a subdivided monkey moving past a few spheres
+    bpy.ops.mesh.primitive_monkey_add(size=2, location=(-3, 0, 1))
+    monkey = bpy.context.active_object
+    monkey.modifiers.new("Subdivision", 'SUBSURF').render_levels = 2
+    monkey.keyframe_insert('location', frame=min(FRAMES))
+    monkey.location.x = 3
+    monkey.keyframe_insert('location', frame=max(FRAMES))
+    for i in range(5):
+        bpy.ops.mesh.primitive_uv_sphere_add(radius=0.6, location=(i * 1.5 - 3, 3, 0.6))
+    return scene
+
+
+def apply_variant(scene, settings):
+    if is_next_version():
+        version = scene.render
+    else:
+        version = scene.eevee
+    version.use_motion_blur = settings['motion_blur']
+
+    floor = scene.objects.get('FuzzyFloor')
+    mat = bpy.data.materials.get('floor_shadow')
+    nodes = mat.node_tree.nodes if mat and mat.node_tree else {}
+    holdout = settings['floor'] == 'HOLDOUT'
+    if floor:
+        floor.is_shadow_catcher = not holdout
+        floor.is_holdout = holdout
+    if nodes.get('Floor Alpha'):
+        nodes['Floor Alpha'].mute = holdout
+    if nodes.get('AO Factor'):
+        nodes['AO Factor'].mute = not settings['floor_ao']
+    if hasattr(scene.eevee, 'use_gtao'):
+        scene.eevee.use_gtao = settings['floor_ao']
+
+    world = scene.world
+    if world and world.node_tree:
+        hdri = world.node_tree.nodes.get('World HDRI')
+        if hdri and settings['world'] == 'GRADIENT':
+            hdri.image = None
+        elif hdri and hdri.image is None:
+            light = bpy.context.preferences.studio_lights.get('forest.exr')
+            if light:
+                hdri.image = bpy.data.images.load(light.path, check_existing=True)
+
+
+# ------------------------------------------------------------------------
+#    RENDER
+# ------------------------------------------------------------------------
+
+# seconds per frame and the peak memory the engine reported
+def render_frames(scene):
+    times = []
+    peak = 0.0
+    for frame in FRAMES:
+        scene.frame_set(frame)
+        start = time.perf_counter()
+        with render_log_paused():
+            bpy.ops.render.render()
+        times.append(time.perf_counter() - start)
+        peak = max(peak, render_log_state['peak'] or 0.0)
+    return times, peak
+
+
+# EEVEE aborts Blender without a GL context, so try it in another process first.
+# With the bpy module, that process is Python importing bpy
+def eevee_available():
+    expr = (f"import bpy; s = bpy.context.scene; s.render.engine = '{eevee_engine()}'; "
+            "s.render.resolution_percentage = 1; bpy.ops.render.render()")
+    if bpy.app.binary_path:
+        cmd = [bpy.app.binary_path, '-b', '--factory-startup', '--python-expr', expr]
+    else:
+        cmd = [sys.executable, '-c', expr]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, timeout=300)
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return proc.returncode == 0
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="bench_render.py",
+                                     description="Render time per Fuzzy setting")
+    parser.add_argument('--engines', default='cycles,eevee', help="Comma separated: cycles, eevee")
+    parser.add_argument('--variants', default=','.join(VARIANTS),
+                        help="Comma separated variants (default: all)")
+    parser.add_argument('--samples', type=int, default=16)
+    parser.add_argument('--percentage', type=int, default=50, help="Resolution percentage")
+    parser.add_argument('--output', help="Write results as JSON")
+    args = parser.parse_args(argv)
+
+    fuzzy_tools.register()
+    engines = []
+    for name in args.engines.split(','):
+        if name == 'cycles':
+            engines.append('CYCLES')
+        elif name == 'eevee':
+            if eevee_available():
+                engines.append(eevee_engine())
+            else:
+                print("EEVEE skipped: no GL context in this Blender")
+
+    results = {'blender': bpy.app.version_string, 'frames': list(FRAMES),
+               'samples': args.samples, 'percentage': args.percentage, 'engines': {}}
+    for engine in engines:
+        rows = results['engines'][engine] = {}
+        for variant in args.variants.split(','):
+            scene = build_scene(engine, args.samples, args.percentage)
+            apply_variant(scene, {**BASE, **VARIANTS[variant]})
+            try:
+                times, peak = render_frames(scene)
+            except RuntimeError as e:
+                rows[variant] = {'error': str(e)}
+                continue
+            rows[variant] = {'seconds_per_frame': round(sum(times) / len(times), 3),
+                             'frames': [round(t, 3) for t in times],
+                             'peak_mb': round(peak, 1) or None}
+
+    print(f"\n{'engine':<20} {'variant':<14} {'s/frame':>8} {'vs base':>8} {'peak MB':>8}")
+    for engine, rows in results['engines'].items():
+        base = rows.get('base', {}).get('seconds_per_frame')
+        for variant, row in rows.items():
+            if 'error' in row:
+                print(f"{engine:<20} {variant:<14} {row['error']}")
+                continue
+            seconds = row['seconds_per_frame']
+            ratio = f"{seconds / base:.2f}x" if base else "-"
+            peak = f"{row['peak_mb']:.0f}" if row['peak_mb'] else "-"
+            print(f"{engine:<20} {variant:<14} {seconds:8.2f} {ratio:>8} {peak:>8}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+    return 0
+
+
+if __name__ == "__main__":
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    sys.exit(main(argv))
@@ -0,0 +1,182 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+bl_info = {
+    "name" : "Fuzzy Tools",
+    "author" : "Sacha Goedegebure",
+    "version" : (3,1),
+    "blender" : (3,6,0),
+    "location" : "View3d > Sidebar > Fuzzy. Alt+M to move keyframes and markers",
+    "description" : "Tools for an efficient 1-person pipeline and multi-camera workflow",
+    "doc_url" : "https://github.com/sagotoons/fuzzytools/wiki",
+    "tracker_url" : "https://github.com/sagotoons/fuzzytools/issues",
+    "category" : "Interface",
+}
+
+
+import bpy
+
+import sys
+import time
+import importlib
+
+from bpy.props import PointerProperty
+
+
+# ------------------------------------------------------------------------
+#    REGISTRATION
+# ------------------------------------------------------------------------
+
+# Importing the package only reads bl_info. register() imports the modules,
+# numpy and other heavy imports load when a tool first uses them
+
+# modules in import order, each after the modules it imports from.
+# Their classes register in this order, so panels come last
+MODULES = (
+    'common',
+    'settings',
+    'markers',
+    'diagnostics',
+    'migration',
+    'hdri',
+    'floor',
+    'properties',
+    'nodes',
+    'builders',
+    'cameras',
+    'keyframes',
+    'analysis',
+    'jobs',
+    'render',
+    'render_log',
+    'calibrate',
+    'panels',
+)
+
+# (handler list, module, function) added by register() and removed by unregister()
+HANDLERS = (
+    ('load_post', 'migration', 'fuzzy_load_post'),
+    ('depsgraph_update_post', 'floor', 'floor_update'),
+    ('frame_change_post', 'floor', 'floor_update'),
+    ('frame_change_pre', 'analysis', 'auto_border_update'),
+    ('render_init', 'markers', 'auto_animate_scene'),
+    ('render_init', 'floor', 'floor_render_full'),
+    ('render_init', 'analysis', 'auto_border_render'),
+    ('render_complete', 'markers', 'disable_animate_scene'),
+    ('render_complete', 'floor', 'floor_render_lean'),
+    ('render_cancel', 'markers', 'disable_animate_scene'),
+    ('render_cancel', 'floor', 'floor_render_lean'),
+    ('render_complete', 'analysis', 'auto_border_update'),
+    ('render_cancel', 'analysis', 'auto_border_update'),
+    ('render_pre', 'render_log', 'render_log_pre'),
+    ('render_stats', 'render_log', 'render_log_stats'),
+    ('render_post', 'render_log', 'render_log_post'),
+    ('render_complete', 'render_log', 'render_log_done'),
+    ('render_cancel', 'render_log', 'render_log_done'),
+)
+
+# modules of an earlier load, reloaded by 'Reload Scripts' together with this file
+stale_modules = {name for name in sys.modules if name.startswith(__name__ + '.')}
+
+addon_keymaps = []
+classes = []
+
+
+# import the modules, or reload them after the package was reloaded
+def import_modules(timings):
+    modules = {}
+    for name in MODULES:
+        start = time.perf_counter()
+        full_name = f"{__name__}.{name}"
+        if full_name in stale_modules:
+            stale_modules.discard(full_name)
+            modules[name] = importlib.reload(sys.modules[full_name])
+        else:
+            modules[name] = importlib.import_module(full_name)
+        timings[f"import {name}"] = time.perf_counter() - start
+    return modules
+
+
+# the same function from any load of the add-on, also when wrapped by the
+# profiler. The single file add-on was module 'fuzzy_tools'
+def same_handler(handler, func):
+    handler = getattr(handler, '__wrapped__', handler)
+    func = getattr(func, '__wrapped__', func)
+    return (getattr(handler, '__qualname__', None) == func.__qualname__
+            and getattr(handler, '__module__', None) in {func.__module__, __name__})
+
+
+def remove_handler(handlers, func):
+    for handler in [handler for handler in handlers if same_handler(handler, func)]:
+        handlers.remove(handler)
+
+
+# append once, replacing copies left by an earlier load
+def add_handler(handlers, func):
+    remove_handler(handlers, func)
+    handlers.append(func)
+
+
+def register():
+    # already active, like the installed add-on when the command line
+    # in __main__.py or cli.py registers again in the same Blender
+    if classes and all(cls.is_registered for cls in classes):
+        return
+    start = time.perf_counter()
+    timings = {}
+    modules = import_modules(timings)
+    common = modules['common']
+
+    step = time.perf_counter()
+    classes[:] = [cls for module in modules.values() for cls in getattr(module, 'classes', ())]
+    common.profile_operators(classes)
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    addon = bpy.context.preferences.addons.get(__name__)
+    if addon and addon.preferences and addon.preferences.profile:
+        common.profile_state['enabled'] = True
+    bpy.types.Scene.fuzzy_props = PointerProperty(type=modules['properties'].FuzzyProperties)
+    timings['classes'] = time.perf_counter() - step
+
+    step = time.perf_counter()
+    modules['hdri'].hdri_previews_register()
+    for list_name, module, name in HANDLERS:
+        add_handler(getattr(bpy.app.handlers, list_name), getattr(modules[module], name))
+
+   # Add hotkey Alt+M for 'Move Keyframes and Markers'
+    wm = bpy.context.window_manager
+    kc = wm.keyconfigs.addon
+    if kc:
+        km = wm.keyconfigs.addon.keymaps.new(name='Window', space_type='EMPTY', region_type='WINDOW')
+        kmi = km.keymap_items.new(modules['keyframes'].TRANSFORM_OT_keyframes_markers.bl_idname,
+            type='M', value='PRESS', alt=True)
+        addon_keymaps.append((km, kmi))
+    timings['handlers'] = time.perf_counter() - step
+
+    timings['total'] = time.perf_counter() - start
+    common.register_timings.clear()
+    common.register_timings.update(timings)
+    if common.profile_state['enabled']:
+        print(f"Fuzzy Tools registered in {timings['total'] * 1000:.1f} ms")
+
+
+def unregister():
+    modules = {name: sys.modules[f"{__name__}.{name}"] for name in MODULES}
+    diagnostics = modules['diagnostics']
+    if diagnostics.frame_trace['enabled']:
+        diagnostics.stop_frame_trace()
+
+    for list_name, module, name in HANDLERS:
+        remove_handler(getattr(bpy.app.handlers, list_name), getattr(modules[module], name))
+    # 'check' of Update Marker Settings, when the toggle was on
+    remove_handler(bpy.app.handlers.frame_change_post, modules['markers'].check)
+
+    # Remove hotkey Alt+M
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
+
+    modules['hdri'].hdri_previews_unregister()
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
+    classes.clear()
+    del bpy.types.Scene.fuzzy_props
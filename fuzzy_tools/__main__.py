@@ -0,0 +1,20 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Command line of Fuzzy Tools in background Blender, see cli.py:
+#   blender -b -P fuzzy_tools/__main__.py -- migrate /path/to/shots --workers 8
+# Without arguments after '--' this registers the add-on
+
+import os
+import sys
+import importlib
+
+# Blender runs this file as a script, import it as the package it belongs to
+folder = os.path.dirname(os.path.abspath(__file__))
+if os.path.dirname(folder) not in sys.path:
+    sys.path.insert(0, os.path.dirname(folder))
+package = importlib.import_module(os.path.basename(folder))
+
+if "--" in sys.argv:
+    cli = importlib.import_module(package.__name__ + ".cli")
+    sys.exit(cli.main(sys.argv[sys.argv.index("--") + 1:]))
+package.register()
@@ -0,0 +1,503 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import json
+import time
+
+from bpy.app.handlers import persistent
+from bpy.props import BoolProperty, FloatProperty, IntProperty
+from bpy.types import Operator
+
+from .common import is_next_version, lazy_import, profiled
+from .markers import get_shots, motion_blur_schedule
+from .keyframes import action_fcurves, key_values, remove_fcurve
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Motion Blur Markers from Motion
+# ------------------------------------------------------------------------
+
+MOTION_TYPES = {'MESH', 'CURVE', 'CURVES', 'SURFACE', 'META', 'FONT', 'ARMATURE', 'GPENCIL', 'GREASEPENCIL'}
+
+
+# world points that show motion of an object: bounding box corners,
+# plus bone heads and tails of armatures
+def motion_points(ob, depsgraph):
+    mat = np.array(ob.matrix_world, dtype=np.float64)
+    if ob.type == 'ARMATURE' and ob.pose:
+        local = [p for bone in ob.pose.bones for p in (bone.head, bone.tail)]
+    else:
+        local = ob.evaluated_get(depsgraph).bound_box
+    local = np.array([v[:] for v in local], dtype=np.float64).reshape(-1, 3)
+    return local @ mat[:3, :3].T + mat[:3, 3]
+
+
+# render resolution in pixels
+def render_size(scene):
+    scale = scene.render.resolution_percentage / 100
+    return scene.render.resolution_x * scale, scene.render.resolution_y * scale
+
+
+# projection times view matrix of a camera for the render resolution
+def camera_clip_matrix(scene, cam, depsgraph):
+    res_x, res_y = render_size(scene)
+    proj = cam.calc_matrix_camera(depsgraph, x=int(res_x), y=int(res_y),
+                                  scale_x=scene.render.pixel_aspect_x,
+                                  scale_y=scene.render.pixel_aspect_y)
+    return np.array(proj, dtype=np.float64) @ np.array(cam.matrix_world.inverted(), dtype=np.float64)
+
+
+# world points of objects and camera matrices over frames, gathered in one pass:
+# points (F, P, 3), owner (P,) object index per point, hidden (F, O),
+# clip matrices (F, 4, 4) and the camera per frame.
+# cams maps frames to a camera, other frames use the active camera
+def sample_frames(scene, frames, objects, cams=None):
+    cams = cams or {}
+    points, hidden, matrices, frame_cams = [], [], [], []
+    owner = None
+    frame_current = scene.frame_current
+    try:
+        for frame in frames:
+            scene.frame_set(frame)
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            obs = [motion_points(ob, depsgraph) for ob in objects]
+            if owner is None:
+                owner = np.repeat(np.arange(len(objects)), [len(p) for p in obs])
+            points.append(np.concatenate(obs) if obs else np.zeros((0, 3)))
+            hidden.append([ob.hide_render for ob in objects])
+            cam = cams.get(frame, scene.camera)
+            matrices.append(camera_clip_matrix(scene, cam, depsgraph) if cam else np.eye(4))
+            frame_cams.append(cam)
+    finally:
+        scene.frame_set(frame_current)
+    if owner is None:
+        owner = np.zeros(0, dtype=int)
+    return (np.array(points).reshape(len(frames), -1, 3), owner,
+            np.array(hidden, dtype=bool).reshape(len(frames), -1), np.array(matrices), frame_cams)
+
+
+# (F, P, 4) clip space coordinates of (F, P, 3) points
+def clip_points(matrices, points):
+    homo = np.concatenate([points, np.ones(points.shape[:2] + (1,))], axis=2)
+    return np.einsum('fij,fpj->fpi', matrices, homo)
+
+
+# screen space motion in pixels per frame, the largest of all visible points.
+# Transforms of all frames are gathered first, then projected in one go.
+# Motion across a camera cut doesn't count
+def screen_motion(scene, frames):
+    frames = list(frames)
+    objects = [ob for ob in scene.objects if ob.type in MOTION_TYPES and ob.name != 'FuzzyFloor']
+    points, owner, hidden, matrices, cams = sample_frames(scene, frames, objects)
+
+    clip = clip_points(matrices, points)
+    w = clip[..., 3]
+    in_front = w > 1e-6
+    ndc = clip[..., :2] / np.where(in_front, w, 1.0)[..., None]
+    pixels = ndc * 0.5 * np.array(render_size(scene))
+    # points far outside the frame don't show
+    on_screen = in_front & (np.abs(ndc) < 1.5).all(axis=2) & ~hidden[:, owner]
+
+    motion = np.zeros(len(frames))
+    if len(frames) < 2 or not points.shape[1]:
+        return dict(zip(frames, motion))
+    step = np.linalg.norm(pixels[1:] - pixels[:-1], axis=2)
+    valid = on_screen[1:] & on_screen[:-1]
+    step = np.where(valid, step, 0.0).max(axis=1)
+    same_cam = np.array([cams[i] is not None and cams[i] == cams[i + 1] for i in range(len(frames) - 1)])
+    step = np.where(same_cam, step, 0.0)
+    # the shutter is open around the frame, so look both ways
+    motion[:-1] = step
+    motion[1:] = np.maximum(motion[1:], step)
+    return dict(zip(frames, motion))
+
+
+# on/off per frame. Gaps without motion shorter than min_frames stay on,
+# so markers don't flicker in short pauses
+def motion_blur_runs(motion, threshold, min_frames):
+    frames = sorted(motion)
+    state = [motion[f] >= threshold for f in frames]
+    i = 0
+    while i < len(state):
+        j = i
+        while j < len(state) and state[j] == state[i]:
+            j += 1
+        # gaps at the start or end of the range are kept
+        if not state[i] and j - i < min_frames and 0 < i and j < len(state):
+            state[i:j] = [True] * (j - i)
+        i = j
+    return dict(zip(frames, state))
+
+
+class MARKER_OT_motionblur_from_motion(Operator):
+    """Add 'mblur_on' and 'mblur_off' markers where camera or object motion is visible on screen.
+Replaces the motion blur markers in the frame range"""
+    bl_idname = "marker.motionblur_from_motion"
+    bl_label = "Motion Blur Markers from Motion"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    threshold: FloatProperty(
+        name="Threshold",
+        description="Blur length in pixels from which motion blur is enabled",
+        default=1.0,
+        min=0.0,
+        soft_max=10.0,
+        subtype='PIXEL'
+    )
+
+    min_frames: IntProperty(
+        name="Minimum Frames",
+        description="Shorter stretches without motion keep motion blur on",
+        default=4,
+        min=1
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        if is_next_version():
+            version = scene.render
+        else:
+            version = scene.eevee
+        shutter = round(version.motion_blur_shutter, 2)
+
+        start = time.perf_counter()
+        frames = range(scene.frame_start, scene.frame_end + 1)
+        motion = screen_motion(scene, frames)
+        # blur length is motion per frame times the shutter
+        blur = {frame: value * shutter for frame, value in motion.items()}
+        runs = motion_blur_runs(blur, self.threshold, self.min_frames)
+
+        markers = scene.timeline_markers
+        for m in [m for m in markers if m.name.startswith('mblur')
+                  and scene.frame_start <= m.frame <= scene.frame_end]:
+            markers.remove(m)
+
+        count = 0
+        previous = None
+        for frame in frames:
+            if runs[frame] != previous:
+                markers.new(f"mblur_on {shutter}" if runs[frame] else 'mblur_off', frame=frame)
+                previous = runs[frame]
+                count += 1
+
+        blurred = sum(runs.values())
+        print(f"Fuzzy Tools: motion measured in {time.perf_counter() - start:.2f} s, "
+              f"largest {max(motion.values(), default=0):.1f} px per frame")
+        self.report({'INFO'}, f"{count} markers added, motion blur on {blurred} of {len(runs)} frames")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Cull Shots
+# ------------------------------------------------------------------------
+
+def set_objects(scene):
+    coll = bpy.data.collections.get('Set')
+    if coll is None:
+        return []
+    return [ob for ob in coll.all_objects
+            if ob.type in MOTION_TYPES and ob.type != 'ARMATURE' and ob.name != 'FuzzyFloor'
+            and ob.name in scene.objects]
+
+
+# (frames, points, planes) whether clip space points are outside of each plane of the
+# frustum, widened by margin. For perspective cameras the apex of the side planes
+# moves distance back, so the frustum keeps points up to distance behind the camera
+def frustum_outside(clip, matrices, margin, distance):
+    x, y, w = clip[..., 0], clip[..., 1], clip[..., 3]
+    # w is the depth for perspective and 1 for orthographic cameras
+    apex = np.where(matrices[:, 3, 3] == 0, distance, 0.0)[:, None]
+    edge = (w + apex) * (1 + margin)
+    return np.stack([x > edge, x < -edge, y > edge, y < -edge, w < -distance], axis=2)
+
+
+# per shot, which objects are inside the frustum of its camera on any frame of the shot.
+# The frustum is widened by margin (fraction of the frame) and reaches distance behind
+# the camera, so objects that cast shadows or show in reflections stay.
+# Returns shots and a (shots, objects) array
+def shot_visibility(scene, objects, margin, distance):
+    shots = get_shots(scene)
+    if not objects:
+        return shots, np.ones((len(shots), 0), dtype=bool)
+    frames = [f for start, end, _ in shots for f in range(start, end + 1)]
+    cams = {f: cam for start, end, cam in shots for f in range(start, end + 1)}
+    points, owner, _, matrices, _ = sample_frames(scene, frames, objects, cams)
+
+    outside = frustum_outside(clip_points(matrices, points), matrices, margin, distance)
+    # an object is out when all its points are outside of the same plane
+    starts = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+    culled = np.logical_and.reduceat(outside, starts, axis=1).any(axis=2)
+
+    visible = np.zeros((len(shots), len(objects)), dtype=bool)
+    i = 0
+    for s, (start, end, _) in enumerate(shots):
+        count = end - start + 1
+        visible[s] = (~culled[i:i + count]).any(axis=0)
+        i += count
+    return shots, visible
+
+
+def clear_culling(scene):
+    count = 0
+    for ob in scene.objects:
+        if ob.get('fuzzy_cull'):
+            remove_fcurve(ob, 'hide_render')
+            ob.hide_render = False
+            del ob['fuzzy_cull']
+            count += 1
+    return count
+
+
+class RENDER_OT_fuzzy_cull_shots(Operator):
+    """Key 'Disable in Renders' on objects of collection 'Set' that are never seen
+by the camera of a shot. Run again after changing cameras or the set"""
+    bl_idname = "render.fuzzy_cull_shots"
+    bl_label = "Cull Shots"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    margin: FloatProperty(
+        name="Margin",
+        description="Widen the camera frustum by this fraction of the frame, for shadows and reflections",
+        default=0.25,
+        min=0.0,
+        soft_max=2.0,
+        subtype='FACTOR'
+    )
+
+    distance: FloatProperty(
+        name="Behind Camera",
+        description="Keep objects up to this distance behind the camera",
+        default=2.0,
+        min=0.0,
+        subtype='DISTANCE'
+    )
+
+    clear: BoolProperty(
+        name="Clear",
+        description="Remove culling keys and show all culled objects",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        cleared = clear_culling(scene)
+        if self.clear:
+            self.report({'INFO'}, f"Culling removed from {cleared} objects")
+            return {'FINISHED'}
+        if not get_shots(scene):
+            self.report({'ERROR'}, "No active camera or camera bound markers")
+            return {'CANCELLED'}
+
+        # leave objects with their own 'Disable in Renders' animation or already hidden
+        objects = []
+        for ob in set_objects(scene):
+            ad = ob.animation_data
+            if ob.hide_render or (ad and any(fc.data_path == 'hide_render' for fc in action_fcurves(ad))):
+                continue
+            objects.append(ob)
+
+        start = time.perf_counter()
+        shots, visible = shot_visibility(scene, objects, self.margin, self.distance)
+
+        culled = 0
+        for i, ob in enumerate(objects):
+            if visible[:, i].all():
+                continue
+            frames = [shot[0] for shot in shots] + [scene.frame_end + 1]
+            values = [float(not v) for v in visible[:, i]] + [0.0]
+            key_values(ob, 'hide_render', frames, values)
+            ob['fuzzy_cull'] = True
+            culled += 1
+        scene.frame_set(scene.frame_current)
+
+        hidden = int((~visible).sum())
+        print(f"Fuzzy Tools: {len(objects)} objects in {len(shots)} shots tested "
+              f"in {time.perf_counter() - start:.2f} s")
+        self.report({'INFO'}, f"{culled} objects culled, {hidden} hidden object shots")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Auto Render Border
+# ------------------------------------------------------------------------
+
+# render border settings aren't animatable, so the border per frame is kept in a
+# scene ID property as JSON and written by 'auto_border_update' on frame change:
+# {"start": first frame, "bounds": [[min x, min y, max x, max y], ...], "crop": use_crop_to_border before}
+BORDER_PROP = 'fuzzy_border'
+BORDER_KEYS = ('border_min_x', 'border_min_y', 'border_max_x', 'border_max_y')
+
+# (JSON text, parsed border) per scene, so frame changes don't parse the property again
+border_cache = {}
+
+
+def border_data(scene):
+    text = scene.get(BORDER_PROP)
+    if not isinstance(text, str):
+        return None
+    cached = border_cache.get(scene.name)
+    if cached is None or cached[0] != text:
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        if not data.get('bounds'):
+            return None
+        cached = border_cache[scene.name] = (text, data)
+    return cached[1]
+
+
+# border of a frame. Frames outside the range use the nearest one
+def border_values(data, frame):
+    bounds = data['bounds']
+    return bounds[min(max(frame - data['start'], 0), len(bounds) - 1)]
+
+
+def set_render_border(scene, values):
+    render = scene.render
+    for key, value in zip(BORDER_KEYS, values):
+        if abs(getattr(render, key) - value) > 1e-6:
+            setattr(render, key, value)
+
+
+def apply_auto_border(scene, frame):
+    data = border_data(scene)
+    if data:
+        set_render_border(scene, border_values(data, frame))
+
+
+# border of the current frame, for the viewport and after rendering
+@persistent
+@profiled
+def auto_border_update(scene, depsgraph=None):
+    if BORDER_PROP in scene:
+        apply_auto_border(scene, scene.frame_current)
+
+
+# Blender reads the render border once when a render starts, also for animations.
+# Renders get the border around all frames of the range, so no frame is cut off
+@persistent
+@profiled
+def auto_border_render(scene, _=None):
+    data = border_data(scene) if BORDER_PROP in scene else None
+    if data:
+        bounds = np.array([border_values(data, frame)
+                           for frame in range(scene.frame_start, scene.frame_end + 1)])
+        set_render_border(scene, [*bounds[:, :2].min(axis=0), *bounds[:, 2:].max(axis=0)])
+
+
+# render border (min x, min y, max x, max y) per frame around the moving objects,
+# as (F, 4) array in 0-1 frame coordinates. Frames with motion blur include
+# the frames before and after
+def moving_bounds(scene, frames, margin):
+    frames = list(frames)
+    objects = [ob for ob in scene.objects
+               if ob.type in MOTION_TYPES and ob.type != 'ARMATURE' and ob.name != 'FuzzyFloor']
+    points, owner, hidden, matrices, _ = sample_frames(scene, frames, objects)
+    if not len(owner):
+        return np.tile([0.5, 0.5, 0.5, 0.5], (len(frames), 1)), 0
+
+    # objects whose points move in the frame range
+    moves = np.ptp(points, axis=0).max(axis=1) > 1e-5
+    moving = np.zeros(len(objects), dtype=bool)
+    np.logical_or.at(moving, owner, moves)
+    use = moving[owner] & ~hidden[:, owner]
+
+    clip = clip_points(matrices, points)
+    w = clip[..., 3]
+    ndc = clip[..., :2] / np.where(w > 1e-6, w, 1.0)[..., None]
+    uv = (ndc + 1) / 2
+    lo = np.where(use[..., None], uv, np.inf).min(axis=1)
+    hi = np.where(use[..., None], uv, -np.inf).max(axis=1)
+    # a moving point behind the camera can reach anywhere in the frame
+    behind = (use & (w <= 1e-6)).any(axis=1)
+    lo[behind], hi[behind] = 0.0, 1.0
+
+    blur = motion_blur_schedule(scene, frames)
+    on = np.array([blur[f][0] for f in frames])
+    lo[1:][on[1:]] = np.minimum(lo[1:], lo[:-1])[on[1:]]
+    lo[:-1][on[:-1]] = np.minimum(lo[:-1], lo[1:])[on[:-1]]
+    hi[1:][on[1:]] = np.maximum(hi[1:], hi[:-1])[on[1:]]
+    hi[:-1][on[:-1]] = np.maximum(hi[:-1], hi[1:])[on[:-1]]
+
+    bounds = np.concatenate([lo - margin, hi + margin], axis=1)
+    # nothing moving in view: keep a tiny border in the middle
+    empty = ~np.isfinite(bounds).all(axis=1)
+    bounds = np.clip(bounds, 0.0, 1.0)
+    empty |= (bounds[:, 2] <= bounds[:, 0]) | (bounds[:, 3] <= bounds[:, 1])
+    bounds[empty] = [0.49, 0.49, 0.51, 0.51]
+    return bounds, int(moving.sum())
+
+
+def clear_auto_border(scene):
+    data = border_data(scene)
+    if BORDER_PROP not in scene:
+        return
+    if data:
+        scene.render.use_crop_to_border = data.get('crop', scene.render.use_crop_to_border)
+    del scene[BORDER_PROP]
+    border_cache.pop(scene.name, None)
+    scene.render.use_border = False
+
+
+class RENDER_OT_fuzzy_auto_border(Operator):
+    """Set the render border around objects that move, for each frame.
+Renders only the pixels of characters in transparent passes"""
+    bl_idname = "render.fuzzy_auto_border"
+    bl_label = "Auto Render Border"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    margin: FloatProperty(
+        name="Margin",
+        description="Space around the objects as fraction of the frame",
+        default=0.03,
+        min=0.0,
+        max=0.5,
+        subtype='FACTOR'
+    )
+
+    clear: BoolProperty(
+        name="Clear",
+        description="Remove the render border per frame and disable render border",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        clear_auto_border(scene)
+        if self.clear:
+            return {'FINISHED'}
+
+        start = time.perf_counter()
+        frames = list(range(scene.frame_start, scene.frame_end + 1))
+        bounds, moving = moving_bounds(scene, frames, self.margin)
+        if not moving:
+            self.report({'WARNING'}, "No moving objects found")
+            return {'CANCELLED'}
+
+        scene[BORDER_PROP] = json.dumps({
+            'start': frames[0],
+            'bounds': np.round(bounds, 5).tolist(),
+            'crop': scene.render.use_crop_to_border,
+        })
+        scene.render.use_border = True
+        scene.render.use_crop_to_border = False
+        apply_auto_border(scene, scene.frame_current)
+
+        area = (bounds[:, 2] - bounds[:, 0]) * (bounds[:, 3] - bounds[:, 1])
+        print(f"Fuzzy Tools: render border of {moving} moving objects "
+              f"in {time.perf_counter() - start:.2f} s")
+        self.report({'INFO'}, f"Render border set, {area.mean() * 100:.0f}% of the frame on average")
+        return {'FINISHED'}
+
+
+classes = [
+    MARKER_OT_motionblur_from_motion,
+    RENDER_OT_fuzzy_cull_shots,
+    RENDER_OT_fuzzy_auto_border,
+]
@@ -0,0 +1,630 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import time
+
+from bpy.props import BoolProperty, EnumProperty
+from bpy.types import Operator
+from math import radians
+
+from .common import is_next_version
+from .migration import fuzzy_scene_empty, stamp_new_scene
+from .settings import (CYCLES_PRESET_ITEMS,
+                       CYCLES_PRESETS,
+                       RENDER_PROFILE_ITEMS,
+                       RENDER_PROFILES,
+                       apply_scene_settings,
+                       )
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Build All
+# ------------------------------------------------------------------------
+
+# parts of the scene builder in build order: (part, operator)
+BUILD_PARTS = [
+    ('camera', "object.fuzzy_camera"),
+    ('floor', "mesh.fuzzy_floor"),
+    ('sky', "world.fuzzy_sky"),
+    ('sun', "object.fuzzy_sun"),
+    ('rimlight', "object.fuzzy_rimlight"),
+    ('eevee', "scene.fuzzy_eevee"),
+]
+
+# named sets of parts, used by Build All and the command line
+BUILD_PROFILES = {
+    'all': ('camera', 'floor', 'sky', 'sun', 'rimlight', 'eevee'),
+    'set': ('floor', 'sky', 'sun', 'rimlight', 'eevee'),
+    'lighting': ('sky', 'sun', 'rimlight'),
+    'camera': ('camera',),
+}
+
+
+# run builder operators for the given parts, in the scene's context if given.
+# Returns seconds per part
+def build_parts(parts, scene=None):
+    new = fuzzy_scene_empty(scene or bpy.context.scene)
+    timings = {}
+    for part, idname in BUILD_PARTS:
+        if part not in parts:
+            continue
+        category, name = idname.split('.')
+        op = getattr(getattr(bpy.ops, category), name)
+        start = time.perf_counter()
+        if scene is None:
+            op()
+        else:
+            with bpy.context.temp_override(scene=scene, view_layer=scene.view_layers[0]):
+                op()
+        timings[part] = time.perf_counter() - start
+    if new:
+        stamp_new_scene(scene or bpy.context.scene)
+    return timings
+
+
+class SCENE_OT_build_all(Operator):
+    """Place a camera, floor, sun light and rim light. Create a new Fuzzy World. Optimize Eevee settings.
+Replace existing floor and active world, if available.
+Delete the default cube, camera, and light"""
+    bl_idname = "scene.build_all"
+    bl_label = "Build All"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        build_parts(BUILD_PROFILES['all'])
+        
+        self.report({'INFO'}, "POP!")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Camera
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_fuzzy_camera(Operator):
+    """Place an optimized camera.
+Delete the default camera"""
+    bl_idname = "object.fuzzy_camera"
+    bl_label = "Build Camera"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        objects = scene.objects
+        objs = bpy.data.objects
+
+        # CAMERA PROPERTIES
+        loc_y = -25
+        loc_z = 2.5
+        rot_x = 90
+        lens = 85
+        clip_start = 1
+        clip_end = 250
+
+        # Delete default camera
+        if 'Camera' in objects:
+            objs.remove(objs["Camera"])
+
+        # Add new camera and set rotation
+        bpy.ops.object.camera_add(rotation=(radians(rot_x), 0, 0))
+        ob = context.active_object
+
+        # List all objects with "CAM." prefix
+        cams = [obj for obj in objs if obj.name.startswith("CAM.")]
+
+        if not cams:
+            ob.name = "CAM.001"
+            ob.location = (0, loc_y, loc_z)
+        else:
+            # Remove "CAM." from names to leave only numbers + letter
+            cams_ABC = [s[4:] for s in [obj.name for obj in cams]]
+            # Remove possible letter suffix
+            cams_no_ABC = [s[:3] for s in cams_ABC]
+            # Find the smallest available number
+            available_numbers = set(range(1, max(map(int, cams_no_ABC)) + 2))
+            used_numbers = set(map(int, cams_no_ABC))
+            i = min(available_numbers - used_numbers)
+            # Change name of camera with increasing number
+            ob.name = f"CAM.{i:03}"
+            # Place camera distance away from previous camera's origin
+            ob.location = (1.5*(-1 + i), loc_y, loc_z)
+
+        # create collection 'Cameras' if it doesn't exist yet
+        link_to_name = 'Cameras'
+        link_to = scene.collection.children.get(link_to_name)
+        if link_to is None:
+            link_to = bpy.data.collections.new(link_to_name)
+            scene.collection.children.link(link_to)
+
+        # link new camera to collection 'Cameras'
+        oldcoll = ob.users_collection[0]
+        if oldcoll.name == 'Scene Collection':
+            context.collection.objects.unlink(ob)
+        else:
+            oldcoll.objects.unlink(ob)        
+        bpy.data.collections['Cameras'].objects.link(ob)
+
+        ob.show_name = True
+        data = ob.data
+        data.name = ob.name
+
+        # optimize camera settings
+        data.show_limits = False
+        data.show_name = True
+        data.clip_start = clip_start
+        data.clip_end = clip_end
+        data.lens = lens
+        data.passepartout_alpha = 0.8
+        data.dof.focus_distance = abs(loc_y)
+
+        # make new camera active
+        objects = context.view_layer.objects
+        try:
+            if ob.name in objects:
+                objects.active = ob
+        except RuntimeError:
+            pass
+
+        self.report({'INFO'}, f"Camera '{ob.name}' added to scene")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Sun
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_fuzzy_sun(Operator):
+    """Place an optimized sun light.
+Delete the default light"""
+    bl_idname = "object.fuzzy_sun"
+    bl_label = "Build Sun"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        objects = scene.objects
+        objs = bpy.data.objects
+        
+        # list of current Sun lights
+        suns = [obj for obj in objects if obj.type == 'LIGHT' and obj.name.startswith('Sun')]
+
+        if 'Light' in objects:
+            objs.remove(objs["Light"])
+
+        # add sun light
+        bpy.ops.object.light_add(
+            type='SUN', align='WORLD', location=(20+len(suns), -10, 10))
+
+        # name new light 'Sun'
+        ob = context.active_object
+        if len(suns) == 0:
+            ob.name = "Sun"
+        else:
+            v = str(len(suns)).zfill(3)
+            ob.name = f"Sun.{v}"
+        ob.data.name = ob.name
+
+        # create collection 'Set' if it doesn't exist yet
+        link_to_name = 'Set'
+        try:
+            link_to = scene.collection.children[link_to_name]
+        except KeyError:
+            link_to = bpy.data.collections.new(link_to_name)
+            scene.collection.children.link(link_to)
+        # link new light to collection 'Set'
+        oldcoll = ob.users_collection[0].name
+        if oldcoll == 'Scene Collection':
+            context.collection.objects.unlink(ob)
+        else:
+            bpy.data.collections[oldcoll].objects.unlink(ob)        
+        bpy.data.collections['Set'].objects.link(ob)
+
+        # light rotation
+        ob.rotation_euler = (radians(50), 0, radians(40))
+        
+        # light settings
+        ob.data.energy = 1.5
+        ob.data.angle = radians(15)
+
+        ## EEVEE NEXT
+        if is_next_version():
+            ob.data.use_shadow_jitter = True
+        else:
+            ob.data.use_contact_shadow = True
+        
+        # make new Sun active
+        objects = context.view_layer.objects
+        try:
+            if ob.name in objects:
+                objects.active = ob
+        except RuntimeError:
+            pass
+
+        self.report({'INFO'}, f"'{ob.name}' added to scene")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Rim Light
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_fuzzy_rimlight(Operator):
+    """Place an optimized rim light"""
+    bl_idname = "object.fuzzy_rimlight"
+    bl_label = "Build Rim Light"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        objects = scene.objects
+        objs = bpy.data.objects
+
+        # list of current rim lights
+        rimlights = [obj for obj in objects if obj.type == 'LIGHT' and obj.name.startswith('RimLight')]
+   
+        # add sun light
+        bpy.ops.object.light_add(
+            type='SUN', align='WORLD', location=(-20-len(rimlights), 10, 10))
+
+        # name new light 'RimLight'
+        ob = context.active_object
+        if len(rimlights) == 0:
+            ob.name = "RimLight"
+        else:
+            v = str(len(rimlights)).zfill(3)
+            ob.name = f"RimLight.{v}"
+        ob.data.name = ob.name
+        
+        # create collection 'Set' if it doesn't exist yet
+        link_to_name = 'Set'
+        link_to = scene.collection.children.get(link_to_name)
+        if link_to is None:
+            link_to = bpy.data.collections.new(link_to_name)
+            scene.collection.children.link(link_to)
+
+        oldcoll = ob.users_collection[0].name
+        if oldcoll == 'Scene Collection':
+            context.collection.objects.unlink(ob)
+        else:
+            bpy.data.collections[oldcoll].objects.unlink(ob)
+        bpy.data.collections['Set'].objects.link(ob)
+        
+        # light rotation
+        ob.rotation_euler = (radians(70), 0, radians(-150))
+        
+        # light settings
+        ob.data.energy = 10
+        ob.data.specular_factor = 0.1
+        ob.data.angle = radians(10)
+
+        ## EEVEE NEXT
+        if is_next_version():
+            ob.data.use_shadow_jitter = True
+        else:
+            ob.data.use_contact_shadow = True
+
+        # make new Rim Light active
+        objects = context.view_layer.objects
+        try:
+            if ob.name in objects:
+                objects.active = ob
+        except RuntimeError:
+            pass
+
+        self.report({'INFO'}, f"'{ob.name}' added to scene")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - EEVEE optimizing
+# ------------------------------------------------------------------------
+
+class SCENE_OT_fuzzy_eevee(Operator):
+    """Set the render engine to EEVEE and optimize render settings.
+AO and Bloom for Legacy, Raytracing for Next, Color Management for both, and more"""
+    bl_idname = "scene.fuzzy_eevee"
+    bl_label = "Optimize Eevee"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        render = scene.render
+        eevee = scene.eevee
+        view = scene.view_settings
+        space = context.space_data
+
+        # EEVEE RENDER PROPERTIES
+        if is_next_version():
+            version = render
+            if bpy.app.version >= (5, 0, 0):
+                render.engine = 'BLENDER_EEVEE'
+            else:
+                render.engine = 'BLENDER_EEVEE_NEXT'
+        else:
+            render.engine = 'BLENDER_EEVEE'
+            version = eevee
+            
+        ## GENERAL
+        # depth of field
+        eevee.bokeh_max_size = 3
+        eevee.use_bokeh_jittered = True
+        # hair
+        render.hair_type = 'STRIP'
+        # color management
+        view.view_transform = 'Filmic'
+        view.exposure = 2.0
+        view.gamma = 0.5
+        # overlay, not available in background mode
+        if space is not None and space.type == 'VIEW_3D':
+            space.shading.use_scene_world = True
+            space.overlay.show_look_dev = True
+        
+        ## EEVEE LEGACY
+        if version == eevee:
+            # ambient occlusion
+            eevee.use_gtao = True
+            eevee.gtao_distance = 1.6
+            eevee.gtao_factor = 0.7
+            eevee.use_gtao_bent_normals = False
+            # bloom
+            eevee.use_bloom = True
+            eevee.bloom_threshold = 1.0
+            eevee.bloom_radius = 5
+            # screen space reflection
+            eevee.use_ssr_refraction = True
+            eevee.use_ssr_halfres = False
+            eevee.ssr_quality = 1
+            # motion blur
+            version.motion_blur_position = 'START' # other options will crash blender with animated motion blur
+            # shadow
+            eevee.shadow_cascade_size = '4096'
+            eevee.shadow_cube_size = '2048'
+            eevee.use_soft_shadows = True
+        
+        ## EEVEE NEXT
+        if version == render:
+            # shadows
+            eevee.use_shadows = True
+            eevee.use_shadow_jitter_viewport = True
+            # ray tracing
+            eevee.use_raytracing = True
+            eevee.ray_tracing_options.resolution_scale = '1'
+            eevee.ray_tracing_options.trace_max_roughness = 0.5
+            # fast GI
+            eevee.fast_gi_resolution = '1'
+
+        self.report({'INFO'}, "EEVEE settings optimized")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Cycles optimizing
+# ------------------------------------------------------------------------
+
+class SCENE_OT_fuzzy_cycles(Operator):
+    """Set the render engine to Cycles and optimize render settings for CPU.
+Adaptive sampling, denoising, light tree, bounces, persistent data and Color Management"""
+    bl_idname = "scene.fuzzy_cycles"
+    bl_label = "Optimize Cycles"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    preset: EnumProperty(
+        name="Preset",
+        items=CYCLES_PRESET_ITEMS,
+        default='FINAL',
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and hasattr(context.scene, 'cycles')
+
+    def execute(self, context):
+        scene = context.scene
+        render = scene.render
+        view = scene.view_settings
+
+        render.engine = 'CYCLES'
+        count = apply_scene_settings(scene, CYCLES_PRESETS[self.preset])
+
+        # match the color management of Optimize EEVEE
+        view.view_transform = 'Filmic'
+        view.exposure = 2.0
+        view.gamma = 0.5
+
+        name = self.preset.capitalize()
+        self.report({'INFO'}, f"Cycles settings optimized ({name}), {count} settings changed")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Render settings profile
+# ------------------------------------------------------------------------
+
+class SCENE_OT_fuzzy_render_profile(Operator):
+    """Apply a render settings profile to all scenes in the file.
+Samples, resolution, shadow and ray tracing quality"""
+    bl_idname = "scene.fuzzy_render_profile"
+    bl_label = "Apply Render Profile"
+    bl_options = {'UNDO'}
+
+    profile: EnumProperty(
+        name="Profile",
+        items=RENDER_PROFILE_ITEMS,
+        default='FINAL',
+    )
+
+    def execute(self, context):
+        settings = RENDER_PROFILES[self.profile]
+        count = 0
+        for scene in bpy.data.scenes:
+            count += apply_scene_settings(scene, settings)
+            scene.fuzzy_props.render_profile = self.profile
+
+        name = self.profile.capitalize()
+        self.report({'INFO'}, f"Profile '{name}' applied, {count} settings changed")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Show/hide all Hair in viewport
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_hair_viewport(Operator):
+    """Viewport hair visibility"""
+    bl_idname = "object.hair_viewport"
+    bl_label = "Show or Hide Hair"
+    bl_options = {'UNDO'}
+
+    hide: bpy.props.BoolProperty()
+    
+    def execute(self, context):
+        # particle system modifiers
+        for obj in bpy.data.objects:
+            # Check for particle system hair modifiers
+            for modifier in obj.modifiers:
+                if (modifier.type == 'PARTICLE_SYSTEM' and 
+                        modifier.particle_system.particles.data.settings.type == 'HAIR'):
+                    modifier.show_viewport = not self.hide
+
+            # Check for CURVES type objects
+            if obj.type == 'CURVES':
+                obj.hide_viewport = self.hide
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - add light parent for Sun, Rimlight and FloorNormal
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_light_parent(Operator):
+    """Add empty as parent for Sun, RimLight and FloorNormal"""
+    bl_idname = "object.light_parent"
+    bl_label = "Add Light Parent"
+    bl_options = {'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        objs = context.scene.objects
+        return context.mode == 'OBJECT' and 'LightParent' not in objs
+    
+    def execute(self, context):
+        objs = bpy.data.objects
+
+        # create empty
+        light_parent = objs.new('LightParent', None)
+        light_parent.empty_display_type = 'SPHERE'
+        light_parent.empty_display_size = 3
+        
+        # add empty to collection 'Set'
+        colls = bpy.data.collections
+        set = colls.get('Set')
+        if set:
+            coll = set
+        else:
+            coll = context.scene.collection
+        
+        coll.objects.link(light_parent)
+
+        sun = objs.get('Sun')
+        rim = objs.get('RimLight')
+        normal = objs.get('FloorNormal')
+
+        for item in [sun, rim, normal]:
+            if item:
+                item.parent = light_parent
+        
+        self.report({'INFO'}, f"'LightParent' added to collection {coll.name}")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - rotate LightParent or HDRI according to Active Camera
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_rotate_lighting(Operator):
+    """Match Z-rotation of lighting to active camera.
+If target is HDRI, rotation is applied to secondary rotation"""
+    bl_idname = "object.rotate_lighting"
+    bl_label = "Rotate Lighting"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+    
+    @classmethod
+    def poll(cls, context):
+        objs = context.scene.objects
+        return context.mode == 'OBJECT'
+    
+    hdri: BoolProperty(
+        name="Include HDRI",
+        description="Rotate HDRI",
+        options={'SKIP_SAVE', 'HIDDEN'}
+    )
+    
+    parent: BoolProperty(
+        name="Include LightParent",
+        description="Rotate LightParent",
+        options={'SKIP_SAVE', 'HIDDEN'}
+    )
+    
+    def execute(self, context):
+        scene = context.scene
+        fr = scene.frame_current
+
+        # active camera Z rotation
+        cam_rot = scene.camera.rotation_euler[2]
+
+        if self.parent:
+            # get LightParent and apply Z rotation
+            parent = scene.objects.get('LightParent')
+            if parent:
+                parent.rotation_euler[2] = cam_rot
+
+        if self.hdri:
+            # find HDRI and apply Z rotation
+            if scene.world.name == 'Fuzzy World':
+                nodes = scene.world.node_tree.nodes
+                HDRI = nodes.get("HDRI Delta Rot")
+                if HDRI:
+                    HDRI.inputs[2].default_value[2] = cam_rot * -1 + radians(90)
+        
+        if self.parent:
+            target = "LightParent"
+        elif self.hdri:
+            target = "HDRI"
+        self.report({'INFO'}, f"{target} rotated on Z-axis")
+        return {'FINISHED'}
+
+
+classes = [
+    SCENE_OT_build_all,
+    OBJECT_OT_fuzzy_camera,
+    OBJECT_OT_fuzzy_sun,
+    OBJECT_OT_fuzzy_rimlight,
+    SCENE_OT_fuzzy_eevee,
+    SCENE_OT_fuzzy_cycles,
+    SCENE_OT_fuzzy_render_profile,
+    OBJECT_OT_hair_viewport,
+    OBJECT_OT_light_parent,
+    OBJECT_OT_rotate_lighting,
+]
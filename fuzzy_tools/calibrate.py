@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import json
+import time
+
+from bpy.props import IntProperty
+from bpy.types import Operator
+
+from .settings import resolve_scene_setting, temporary_settings
+from .markers import apply_rules, get_shots, marker_rule, rule_applied
+from .render_log import render_log_paused
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Calibrate to Frame Budget
+# ------------------------------------------------------------------------
+
+# quality levels from high to low as marker rules: samples, adaptive threshold
+# and ray tracing resolution
+QUALITY_LEVELS = {
+    'CYCLES': [
+        "fz samples=1024 threshold=0.005 adaptive=on",
+        "fz samples=512 threshold=0.01 adaptive=on",
+        "fz samples=256 threshold=0.02 adaptive=on",
+        "fz samples=128 threshold=0.05 adaptive=on",
+        "fz samples=64 threshold=0.1 adaptive=on",
+        "fz samples=32 threshold=0.2 adaptive=on",
+    ],
+    'EEVEE': [
+        "fz samples=128 rtres=1",
+        "fz samples=64 rtres=2",
+        "fz samples=32 rtres=2",
+        "fz samples=16 rtres=4",
+        "fz samples=8 rtres=4",
+    ],
+}
+
+CALIBRATION_KEY = 'fuzzy_calibration'
+
+
+def quality_levels(scene):
+    if scene.render.engine == 'CYCLES':
+        return QUALITY_LEVELS['CYCLES']
+    return QUALITY_LEVELS['EEVEE']
+
+
+# frames spread over a shot
+def sample_frames_of_shot(start, end, count):
+    if count <= 1 or end == start:
+        return [(start + end) // 2]
+    step = (end - start) / (count - 1)
+    return sorted({round(start + i * step) for i in range(count)})
+
+
+# (owner, property, value) changes for temporary_settings from 'path': value settings
+def setting_changes(scene, settings):
+    changes = []
+    for path, value in settings.items():
+        resolved = resolve_scene_setting(scene, path)
+        if resolved is None:
+            continue
+        if isinstance(getattr(*resolved), str) and not isinstance(value, str):
+            value = str(value)
+        changes.append((*resolved, value))
+    return changes
+
+
+def render_seconds(scene, frames, level):
+    settings = marker_rule(level, {})
+    seconds = []
+    for frame in frames:
+        scene.frame_set(frame)
+        apply_rules(scene, frame, force=True)
+        with render_log_paused(), temporary_settings(setting_changes(scene, settings)):
+            start = time.perf_counter()
+            bpy.ops.render.render(scene=scene.name)
+            seconds.append(time.perf_counter() - start)
+    return sum(seconds) / len(seconds)
+
+
+# highest quality level that renders the sample frames of a shot within budget,
+# trying levels from high to low. Returns (level, seconds per frame)
+def calibrate_shot(scene, start, end, budget, count):
+    frames = sample_frames_of_shot(start, end, count)
+    levels = quality_levels(scene)
+    seconds = None
+    for level in levels:
+        seconds = render_seconds(scene, frames, level)
+        print(f"Fuzzy Tools: shot {start}-{end} '{level}' {seconds:.2f} s per frame")
+        if seconds <= budget:
+            return level, seconds
+    return levels[-1], seconds
+
+
+# remove the markers of the last calibration
+def clear_calibration(scene):
+    data = json.loads(scene.get(CALIBRATION_KEY, '{}'))
+    markers = scene.timeline_markers
+    for shot in data.get('shots', {}).values():
+        for m in markers:
+            if m.frame == shot['frame'] and m.name == shot['level']:
+                markers.remove(m)
+                break
+    if CALIBRATION_KEY in scene:
+        del scene[CALIBRATION_KEY]
+
+
+class SCENE_OT_fuzzy_calibrate(Operator):
+    """Render sample frames of each shot at decreasing quality until they fit the frame budget.
+The chosen quality is stored as a marker rule at the start of each shot"""
+    bl_idname = "scene.fuzzy_calibrate"
+    bl_label = "Calibrate to Budget"
+    bl_options = {'UNDO'}
+
+    frames_per_shot: IntProperty(
+        name="Frames per Shot",
+        description="Sample frames rendered per shot and quality level",
+        default=2,
+        min=1,
+        max=10
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        budget = scene.fuzzy_props.frame_budget
+        shots = get_shots(scene)
+        if not shots:
+            self.report({'ERROR'}, "No active camera or camera bound markers")
+            return {'CANCELLED'}
+
+        clear_calibration(scene)
+        frame_current = scene.frame_current
+        # the first render compiles shaders and loads textures, keep it out of the timings
+        scene.frame_set(shots[0][0])
+        with render_log_paused(), temporary_settings([(scene.render, 'resolution_percentage', 10)]):
+            bpy.ops.render.render(scene=scene.name)
+
+        start_time = time.perf_counter()
+        data = {'budget': budget, 'engine': scene.render.engine, 'shots': {}}
+        over = 0
+        try:
+            for start, end, cam in shots:
+                level, seconds = calibrate_shot(scene, start, end, budget, self.frames_per_shot)
+                data['shots'][str(start)] = {'frame': start, 'end': end, 'camera': cam.name,
+                                             'level': level, 'seconds': round(seconds, 3)}
+                over += seconds > budget
+        finally:
+            # shots calibrated so far keep their markers
+            for shot in data['shots'].values():
+                scene.timeline_markers.new(shot['level'], frame=shot['frame'])
+            scene[CALIBRATION_KEY] = json.dumps(data)
+            scene.frame_set(frame_current)
+            rule_applied.clear()
+
+        print(f"Fuzzy Tools: calibrated {len(shots)} shots in {time.perf_counter() - start_time:.0f} s")
+        if over:
+            self.report({'WARNING'}, f"{over} shots stay over {budget:g} s at the lowest quality")
+        else:
+            self.report({'INFO'}, f"{len(shots)} shots fit {budget:g} s per frame")
+        return {'FINISHED'}
+
+
+classes = [
+    SCENE_OT_fuzzy_calibrate,
+]
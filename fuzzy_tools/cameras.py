@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+from bpy.types import Operator
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Copy passepartout of Active Camera to all cameras
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_copy_passepartout(Operator):
+    """Copy the Passepartout Alpha of Active Camera to all cameras"""
+    bl_idname = "object.copy_passepartout"
+    bl_label = "Copy Passepartout"
+    bl_options = {'UNDO', 'INTERNAL'}
+
+    def execute(self, context):
+        scene = context.scene
+        active_cam = scene.camera
+        alpha = active_cam.data.passepartout_alpha
+
+        cams = bpy.data.cameras
+
+        for cam in cams:
+            cam.passepartout_alpha = alpha
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Set active Camera
+# ------------------------------------------------------------------------
+
+class VIEW3D_OT_set_active_camera(Operator):
+    """Set camera as the active camera for this scene"""
+    bl_idname = "view3d.set_active_camera"
+    bl_label = "Set active camera"
+    bl_options = {'UNDO'}
+ 
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'CAMERA'
+
+    def execute(self, context):
+        cam = context.active_object
+        
+        context.scene.camera = cam
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Camera Bind
+# ------------------------------------------------------------------------
+
+class MARKER_OT_camera_bind_new(Operator):
+    """Bind the selected camera to a marker on the current frame.
+Requires an animation editor to be open"""
+    bl_idname = "marker.camera_bind_new"
+    bl_label = "Bind Camera to Marker"
+    bl_options = {'UNDO'}
+ 
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.type == 'CAMERA'
+
+    def execute(self, context):
+        screen = context.window.screen
+        count = 0
+
+        for area in screen.areas:
+            if area.type == 'DOPESHEET_EDITOR':
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        with context.temp_override(
+                                window=context.window, 
+                                screen=screen, area=area, 
+                                region=region):
+                            bpy.ops.marker.camera_bind()
+                            count += 1
+                            break
+        if count == 0:
+            self.report({'WARNING'}, "Open Animation Editor required")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Rename Camera as variant
+# ------------------------------------------------------------------------
+
+class OBJECT_OT_rename_camera_alphabet(Operator):
+    """Rename selected cameras as alphabetic variants of active camera"""
+    bl_idname = "object.rename_camera_alphabet"
+    bl_label = "Rename as Variant"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        # Ensure at least two cameras are selected and they are all of type 'CAMERA'
+        if len(context.selected_objects) < 2:
+            return False
+        cameras_selected = all(obj.type == 'CAMERA' for obj in context.selected_objects)
+        return cameras_selected
+
+    def execute(self, context):
+        scene = context.scene
+        objs = bpy.data.objects
+
+        active_cam = context.active_object
+        selected_cams = context.selected_objects
+
+        # Use ord and chr to generate alphabet dynamically
+        ABC = [chr(i) for i in range(ord('A'), ord('Z') + 1)]
+
+        # Get all objects of type 'CAMERA'
+        cams = [obj for obj in objs if obj.type == 'CAMERA']
+
+        # Detect if active camera name ends with a capital letter and has no numbers before it
+        if active_cam.name[-1:].isupper():
+            if len(active_cam.name) > 1:
+                # Check the second last character
+                second_last_char = active_cam.name[-2]
+                if second_last_char.isupper() and not any(char.isdigit() for char in active_cam.name[:-1]):
+                    # If second last character is uppercase and no digits, trigger the error
+                    self.report({'ERROR'}, 
+                            'Naming convention not valid. Use number or single upper case as suffix')
+                    return {'CANCELLED'}
+
+        if active_cam in cams:
+            base_name = active_cam.name.rstrip('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+            last_char = active_cam.name[len(base_name):]
+
+            # If the last character is alphabetic, we will increment from that point
+            if last_char and last_char[-1:].isalpha():
+                base_name = active_cam.name[:-1]
+
+            for cam in selected_cams:
+                if cam != active_cam:
+                    for letter in ABC:
+                        name_ABC = f"{base_name}{letter}"
+                        # Check if the new name already exists among cameras
+                        if not any(existing_cam.name == name_ABC for existing_cam in cams):
+                            cam.name = name_ABC
+                            break  
+
+        return {'FINISHED'}
+
+
+classes = [
+    OBJECT_OT_copy_passepartout,
+    VIEW3D_OT_set_active_camera,
+    MARKER_OT_camera_bind_new,
+    OBJECT_OT_rename_camera_alphabet,
+]
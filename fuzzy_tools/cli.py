@@ -0,0 +1,341 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import os
+import json
+import time
+
+from .markers import get_shots
+from .migration import FUZZY_DATA_VERSION, file_data_version, migrate_file, migration_timings
+from .builders import BUILD_PARTS, BUILD_PROFILES, build_parts
+from .jobs import (blender_command,
+                   find_blend_files,
+                   print_progress,
+                   print_result,
+                   run_blender_jobs,
+                   write_report,
+                   )
+from .render import (PLATE_FORMATS,
+                     camera_variants,
+                     changed_frames,
+                     check_farm_result,
+                     clear_plates,
+                     farm_jobs,
+                     finished_hashes,
+                     link_outputs,
+                     manifest_path,
+                     render_cameras,
+                     render_plates,
+                     reuse_pairs,
+                     static_frame_plan,
+                     write_manifest,
+                     write_render_plan,
+                     )
+from . import register
+
+
+# ------------------------------------------------------------------------
+#    COMMAND LINE
+# ------------------------------------------------------------------------
+
+# Run with background Blender, arguments after '--' go to Fuzzy Tools:
+#   blender -b -P fuzzy_tools/__main__.py -- migrate /path/to/shots --workers 8
+# Each file is handled in its own background Blender process
+
+def cli_migrate(args):
+    files = find_blend_files(args.directory)
+    report_path = args.report or os.path.join(args.directory, "fuzzy_migration.json")
+
+    # files saved by an earlier run and not touched since are skipped without opening
+    previous = {}
+    if os.path.exists(report_path):
+        with open(report_path) as f:
+            for entry in json.load(f).get('files', []):
+                if entry.get('version') == FUZZY_DATA_VERSION and 'mtime' in entry:
+                    previous[os.path.abspath(entry['name'])] = entry
+
+    results = []
+    jobs = []
+    for path in files:
+        entry = previous.get(path)
+        if entry and entry['mtime'] == os.path.getmtime(path):
+            results.append(dict(entry, status='current', seconds=0.0, steps={}))
+            continue
+        cmd = blender_command('migrate-file', blend=path)
+        if args.no_save:
+            cmd.append('--no-save')
+        jobs.append((path, cmd, args.timeout))
+
+    print(f"Fuzzy Tools: migrating {len(jobs)} of {len(files)} files with {args.workers} processes")
+    start = time.perf_counter()
+    for result in run_blender_jobs(jobs, args.workers, print_progress):
+        if os.path.exists(result['name']) and not args.no_save:
+            result['mtime'] = os.path.getmtime(result['name'])
+        results.append(result)
+
+    results.sort(key=lambda r: r['name'])
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    write_report(report_path, {
+        'data_version': FUZZY_DATA_VERSION,
+        'seconds': round(time.perf_counter() - start, 3),
+        'counts': counts,
+        'files': results,
+    })
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    return 1 if counts.get('failed') else 0
+
+
+def cli_migrate_file(args):
+    result = {'name': bpy.data.filepath, 'status': 'failed'}
+    try:
+        register()
+        result['from_version'] = file_data_version()
+        if migrate_file(offline=True):
+            result['status'] = 'migrated'
+            result['steps'] = {name: round(t, 4) for name, t in migration_timings}
+            if not args.no_save:
+                bpy.ops.wm.save_mainfile()
+        else:
+            result['status'] = 'current'
+        # every step checked the file, so it holds current data also when
+        # no step changed anything and the stamp stayed behind
+        result['version'] = FUZZY_DATA_VERSION
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    print_result(result)
+    return 0 if result['status'] != 'failed' else 1
+
+
+def cli_build(args):
+    parts = set(BUILD_PROFILES[args.profile])
+    if args.parts:
+        parts = {part.strip() for part in args.parts.split(',')}
+        unknown = parts - {part for part, _ in BUILD_PARTS}
+        if unknown:
+            print(f"Unknown parts: {', '.join(sorted(unknown))}")
+            return 2
+
+    files = []
+    for path in args.files:
+        files += find_blend_files(path) if os.path.isdir(path) else [os.path.abspath(path)]
+
+    jobs = []
+    for path in files:
+        cmd_args = ['build-file', '--parts', ','.join(sorted(parts)), '--output', path]
+        for scene in args.scene or []:
+            cmd_args += ['--scene', scene]
+        if args.all_scenes:
+            cmd_args.append('--all-scenes')
+        # files that don't exist yet start from the factory startup file
+        blend = path if os.path.exists(path) else None
+        jobs.append((path, blender_command(*cmd_args, blend=blend), args.timeout))
+
+    print(f"Fuzzy Tools: building {', '.join(sorted(parts))} in {len(jobs)} files "
+          f"with {args.workers} processes")
+    start = time.perf_counter()
+    results = sorted(run_blender_jobs(jobs, args.workers, print_progress), key=lambda r: r['name'])
+
+    counts = {}
+    for result in results:
+        counts[result['status']] = counts.get(result['status'], 0) + 1
+    if args.report:
+        write_report(args.report, {
+            'parts': sorted(parts),
+            'seconds': round(time.perf_counter() - start, 3),
+            'counts': counts,
+            'files': results,
+        })
+    print(", ".join(f"{count} {status}" for status, count in sorted(counts.items())))
+    return 1 if counts.get('failed') else 0
+
+
+def cli_build_file(args):
+    result = {'name': args.output, 'status': 'failed', 'scenes': {}}
+    try:
+        register()
+        if args.all_scenes:
+            scenes = list(bpy.data.scenes)
+        elif args.scene:
+            scenes = [bpy.data.scenes[name] for name in args.scene]
+        else:
+            scenes = [bpy.context.scene]
+
+        parts = args.parts.split(',')
+        for scene in scenes:
+            timings = build_parts(parts, scene)
+            result['scenes'][scene.name] = {part: round(t, 4) for part, t in timings.items()}
+
+        if os.path.abspath(bpy.data.filepath) == os.path.abspath(args.output):
+            bpy.ops.wm.save_mainfile()
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+            bpy.ops.wm.save_as_mainfile(filepath=args.output)
+        result['status'] = 'built'
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    print_result(result)
+    return 0 if result['status'] != 'failed' else 1
+
+
+def cli_render_cameras(args):
+    result = {'name': bpy.data.filepath, 'status': 'failed'}
+    try:
+        register()
+        scene = bpy.data.scenes[args.scene] if args.scene else bpy.context.scene
+        objects = scene.objects
+        if args.cameras:
+            cams = [objects[name] for name in args.cameras.split(',')]
+        elif args.variants:
+            cams = camera_variants(objects[args.variants], objects)
+        else:
+            cams = [ob for ob in objects if ob.type == 'CAMERA' and ob.name.startswith('CAM.')]
+        cams.sort(key=lambda ob: ob.name)
+        timings = render_cameras(scene, cams)
+        result['cameras'] = {name: round(t, 3) for name, t in timings.items()}
+        result['status'] = 'rendered'
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    print_result(result)
+    return 0 if result['status'] != 'failed' else 1
+
+
+def cli_render_plates(args):
+    result = {'status': 'failed'}
+    try:
+        register()
+        scene = bpy.data.scenes[args.scene] if args.scene else bpy.context.scene
+        plated, full = render_plates(scene, args.start, args.end)
+        result.update(status='done', plated=plated, full=full)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    print_result(result)
+    return 0 if result['status'] != 'failed' else 1
+
+
+def cli_farm(args):
+    scene = bpy.data.scenes[args.scene] if args.scene else bpy.context.scene
+    if not bpy.data.filepath:
+        print("Open a saved .blend file: blender -b shot.blend -P fuzzy_tools/__main__.py -- farm")
+        return 2
+
+    plan = {}
+    if args.static_reuse:
+        plan, reasons = static_frame_plan(scene)
+        write_render_plan(scene, plan, reasons)
+        print(f"Fuzzy Tools: {len(plan)} static frames reused")
+
+    changed = ()
+    if args.incremental:
+        changed, hashes = changed_frames(scene)
+        print(f"Fuzzy Tools: {len(changed)} changed frames")
+
+    plates = args.plates and scene.render.image_settings.file_format in PLATE_FORMATS
+    if args.plates and not plates:
+        print("Fuzzy Tools: plates need an image output format like PNG, rendering full frames")
+    if plates:
+        clear_plates(scene)
+
+    jobs, outputs = farm_jobs(scene, bpy.data.filepath, args.workers, args.chunk, plan, changed, plates)
+    frames = sum(len(paths) for paths in outputs.values())
+    print(f"Fuzzy Tools: rendering {frames} frames of {len(get_shots(scene))} shots "
+          f"in {len(jobs)} chunks with {args.workers} processes")
+
+    def on_done(result, done, total):
+        check_farm_result(result, outputs)
+        print_progress(result, done, total)
+
+    start = time.perf_counter()
+    results = sorted(run_blender_jobs(jobs, args.workers, on_done), key=lambda r: r['name'])
+    failed = [r for r in results if r['status'] != 'done']
+    linked = link_outputs(reuse_pairs(scene, plan)) if not failed else 0
+    if args.incremental:
+        write_manifest(manifest_path(scene), finished_hashes(hashes, results))
+    if args.report:
+        write_report(args.report, {
+            'file': bpy.data.filepath,
+            'scene': scene.name,
+            'seconds': round(time.perf_counter() - start, 3),
+            'frames': sum(r.get('frames', 0) for r in results),
+            'reused': linked,
+            'chunks': results,
+        })
+    print(f"{len(results) - len(failed)} chunks done, {len(failed)} failed")
+    return 1 if failed else 0
+
+
+def main(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="blender -b -P fuzzy_tools/__main__.py --",
+                                     description="Fuzzy Tools command line")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    sub = commands.add_parser('migrate', help="Upgrade all .blend files in a directory tree")
+    sub.add_argument('directory')
+    sub.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                     help="Number of background Blender processes")
+    sub.add_argument('--report', help="JSON report path (default: fuzzy_migration.json in directory)")
+    sub.add_argument('--timeout', type=float, default=None, help="Seconds per file")
+    sub.add_argument('--no-save', action='store_true', help="Migrate without saving (dry run)")
+    sub.set_defaults(func=cli_migrate)
+
+    sub = commands.add_parser('migrate-file', help="Upgrade the open file (used by 'migrate')")
+    sub.add_argument('--no-save', action='store_true')
+    sub.set_defaults(func=cli_migrate_file)
+
+    sub = commands.add_parser('build', help="Build scene parts in many .blend files")
+    sub.add_argument('files', nargs='+',
+                     help=".blend files or directories. Missing files are created")
+    sub.add_argument('--profile', choices=sorted(BUILD_PROFILES), default='all',
+                     help="Named set of parts to build")
+    sub.add_argument('--parts', help="Comma separated parts, overrides the profile: "
+                     + ",".join(part for part, _ in BUILD_PARTS))
+    sub.add_argument('--scene', action='append', help="Scene to build in, can be repeated "
+                     "(default: active scene of each file)")
+    sub.add_argument('--all-scenes', action='store_true', help="Build in every scene of each file")
+    sub.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                     help="Number of background Blender processes")
+    sub.add_argument('--report', help="JSON report path")
+    sub.add_argument('--timeout', type=float, default=None, help="Seconds per file")
+    sub.set_defaults(func=cli_build)
+
+    sub = commands.add_parser('build-file', help="Build parts in the open file (used by 'build')")
+    sub.add_argument('--parts', required=True)
+    sub.add_argument('--scene', action='append')
+    sub.add_argument('--all-scenes', action='store_true')
+    sub.add_argument('--output', required=True)
+    sub.set_defaults(func=cli_build_file)
+
+    sub = commands.add_parser('render-cameras',
+                              help="Render the open file for several cameras in one session")
+    sub.add_argument('--scene', help="Scene to render (default: active scene)")
+    sub.add_argument('--cameras', help="Comma separated camera names (default: all 'CAM.' cameras)")
+    sub.add_argument('--variants', help="Render this camera and its A, B, ... variants")
+    sub.set_defaults(func=cli_render_cameras)
+
+    sub = commands.add_parser('farm', help="Render the shots of camera markers of the open file "
+                              "in a pool of background Blender processes")
+    sub.add_argument('--scene', help="Scene to render (default: active scene)")
+    sub.add_argument('--workers', type=int, default=4, help="Number of background Blender processes")
+    sub.add_argument('--chunk', type=int, default=10, help="Maximum frames per process")
+    sub.add_argument('--static-reuse', action='store_true',
+                     help="Render static frames once and link their files")
+    sub.add_argument('--incremental', action='store_true',
+                     help="Render again only frames whose scene state changed")
+    sub.add_argument('--plates', action='store_true',
+                     help="Render static shots as one set plate plus characters per frame")
+    sub.add_argument('--report', help="JSON report path")
+    sub.set_defaults(func=cli_farm)
+
+    sub = commands.add_parser('render-plates',
+                              help="Render frames of the open file with plates (used by 'farm')")
+    sub.add_argument('--scene', help="Scene to render (default: active scene)")
+    sub.add_argument('--start', type=int, required=True)
+    sub.add_argument('--end', type=int, required=True)
+    sub.set_defaults(func=cli_render_plates)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import os
+import sys
+import json
+import atexit
+import inspect
+import functools
+import time
+import importlib.util
+
+
+# check blender version for Eevee Next
+def is_next_version(min_version=(4, 2, 0)):
+    current_version = bpy.app.version
+    return current_version >= min_version
+
+
+# absolute path of the rendered file of a frame
+def frame_output(scene, frame):
+    return bpy.path.abspath(scene.render.frame_path(frame=frame))
+
+
+# module that is imported on first attribute access, for imports like numpy
+# that only some tools need
+def lazy_import(name):
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return importlib.import_module(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# ------------------------------------------------------------------------
+#    PROFILING
+# ------------------------------------------------------------------------
+
+# opt-in timing of operators and handlers, with the add-on preference or the
+# environment variable FUZZY_PROFILE=1. FUZZY_PROFILE=/path/stats.json also
+# writes the stats when Blender quits, for background runs
+PROFILE_ENV = os.environ.get('FUZZY_PROFILE', '')
+profile_state = {'enabled': PROFILE_ENV not in {'', '0'}}
+# name: [calls, total seconds, max seconds]
+profile_stats = {}
+# seconds per step of the last register()
+register_timings = {}
+
+
+# time calls when profiling is on. Passes only the arguments func takes,
+# like Blender does for handlers
+def profiled(func, name=None):
+    name = name or func.__name__
+    code = func.__code__
+    count = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        args = args[:count]
+        if not profile_state['enabled']:
+            return func(*args)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            seconds = time.perf_counter() - start
+            stats = profile_stats.setdefault(name, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+    wrapper.fuzzy_profiled = True
+    return wrapper
+
+
+# profiled execute of an operator. register_class checks that execute takes
+# (self, context), so the wrapper can't use *args
+def profiled_execute(execute, name):
+    timed = profiled(execute, name)
+
+    @functools.wraps(execute)
+    def wrapper(self, context):
+        return timed(self, context)
+    wrapper.fuzzy_profiled = True
+    return wrapper
+
+
+# wrap execute of operators, operators are called by name from the class
+def profile_operators(classes):
+    for cls in classes:
+        execute = cls.__dict__.get('execute')
+        if execute and not getattr(execute, 'fuzzy_profiled', False):
+            cls.execute = profiled_execute(execute, cls.bl_idname)
+
+
+def profile_report():
+    return {name: {'calls': calls, 'total_ms': round(total * 1000, 3),
+                   'mean_ms': round(total / calls * 1000, 3), 'max_ms': round(peak * 1000, 3)}
+            for name, (calls, total, peak) in sorted(profile_stats.items(), key=lambda it: -it[1][1])}
+
+
+def write_profile(path):
+    with open(path, 'w') as f:
+        json.dump({'blender': bpy.app.version_string, 'file': bpy.data.filepath,
+                   'register_ms': {step: round(seconds * 1000, 3)
+                                   for step, seconds in register_timings.items()},
+                   'stats': profile_report()}, f, indent=1)
+
+
+if PROFILE_ENV.endswith('.json'):
+    atexit.register(lambda: profile_stats and write_profile(PROFILE_ENV))
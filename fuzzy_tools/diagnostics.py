@@ -0,0 +1,169 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import os
+import collections
+import time
+import tempfile
+
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+from .common import lazy_import, profile_stats, write_profile
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    FRAME CHANGE TRACER
+# ------------------------------------------------------------------------
+
+# diagnostic timing of every frame_change_pre/post handler, from any add-on
+TRACE_LISTS = ('frame_change_pre', 'frame_change_post')
+# histogram bucket upper bounds in ms, the last bucket is everything slower
+TRACE_BUCKETS = (0.1, 1.0, 4.0, 16.0, 33.0)
+# frames kept per handler
+TRACE_WINDOW = 240
+
+frame_trace = {'enabled': False}
+# (list, handler name): recent latencies in ms
+frame_trace_times = {}
+# (list, handler name): times the handler is in the list, when more than once
+frame_trace_duplicates = {}
+
+
+def handler_name(func):
+    return f"{getattr(func, '__module__', '?')}.{getattr(func, '__qualname__', repr(func))}"
+
+
+# time of the previous probe in the running frame change
+frame_trace_clock = {'last': None}
+# handler lists as the tracer last laid them out
+frame_trace_layout = {}
+
+
+# handler placed right after the traced handler, that records the time since the
+# previous probe. Other add-ons' entries stay as they are, so they can still remove them.
+# Without key it only starts the clock
+def trace_probe(key):
+    def probe(*args):
+        now = time.perf_counter()
+        last = frame_trace_clock['last']
+        if key is not None and last is not None:
+            times = frame_trace_times.get(key)
+            if times is None:
+                times = frame_trace_times[key] = collections.deque(maxlen=TRACE_WINDOW)
+            times.append((now - last) * 1000)
+        frame_trace_clock['last'] = now
+    probe.fuzzy_probe = key
+    return persistent(probe)
+
+
+def is_trace_handler(handler):
+    return handler is frame_trace_sync or hasattr(handler, 'fuzzy_probe')
+
+
+# put a probe after each handler added since the last frame and count duplicates.
+# Runs first in frame_change_pre while tracing. Persistent, so tracing
+# goes on in a newly loaded file
+@persistent
+def frame_trace_sync(*args):
+    frame_trace_duplicates.clear()
+    for list_name in TRACE_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name)
+        traced = [handler for handler in handlers if not is_trace_handler(handler)]
+        names = collections.Counter(handler_name(handler) for handler in traced)
+        for name, count in names.items():
+            if count > 1:
+                frame_trace_duplicates[(list_name, name)] = count
+
+        if frame_trace_layout.get(list_name) == list(handlers):
+            continue
+        layout = [frame_trace_sync if list_name == 'frame_change_pre' else trace_probe(None)]
+        for handler in traced:
+            layout += [handler, trace_probe((list_name, handler_name(handler)))]
+        handlers[:] = layout
+        frame_trace_layout[list_name] = layout
+    frame_trace_clock['last'] = time.perf_counter()
+
+
+def start_frame_trace():
+    frame_trace['enabled'] = True
+    frame_trace_times.clear()
+    frame_trace_layout.clear()
+    frame_trace_sync()
+
+
+def stop_frame_trace():
+    frame_trace['enabled'] = False
+    for list_name in TRACE_LISTS:
+        handlers = getattr(bpy.app.handlers, list_name)
+        handlers[:] = [handler for handler in handlers if not is_trace_handler(handler)]
+    frame_trace_layout.clear()
+    frame_trace_clock['last'] = None
+
+
+# mean, max and histogram counts per traced handler, slowest first
+def frame_trace_report():
+    report = {}
+    for key, times in frame_trace_times.items():
+        if not times:
+            continue
+        values = np.array(times)
+        counts = np.histogram(values, bins=(0.0, *TRACE_BUCKETS, np.inf))[0]
+        report[key] = {'frames': len(values), 'mean_ms': float(values.mean()),
+                       'max_ms': float(values.max()), 'histogram': counts.tolist(),
+                       'duplicates': frame_trace_duplicates.get(key, 1)}
+    return dict(sorted(report.items(), key=lambda it: -it[1]['mean_ms']))
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Profiling and Tracing
+# ------------------------------------------------------------------------
+
+class WM_OT_fuzzy_profile_save(Operator):
+    """Save timings of Fuzzy Tools operators and handlers as JSON next to the .blend file"""
+    bl_idname = "wm.fuzzy_profile_save"
+    bl_label = "Save Stats"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        folder = bpy.path.abspath('//') if bpy.data.filepath else tempfile.gettempdir()
+        path = os.path.join(folder, "fuzzy_profile.json")
+        write_profile(path)
+        self.report({'INFO'}, f"Saved {path}")
+        return {'FINISHED'}
+
+
+class WM_OT_fuzzy_profile_reset(Operator):
+    """Clear the collected timings"""
+    bl_idname = "wm.fuzzy_profile_reset"
+    bl_label = "Reset Stats"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        profile_stats.clear()
+        return {'FINISHED'}
+
+
+class WM_OT_fuzzy_frame_trace(Operator):
+    """Measure the time of every frame change handler per frame and find duplicates.
+Shows in Fuzzy View"""
+    bl_idname = "wm.fuzzy_frame_trace"
+    bl_label = "Trace Frame Change Handlers"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        if frame_trace['enabled']:
+            stop_frame_trace()
+        else:
+            start_frame_trace()
+        return {'FINISHED'}
+
+
+classes = [
+    WM_OT_fuzzy_profile_save,
+    WM_OT_fuzzy_profile_reset,
+    WM_OT_fuzzy_frame_trace,
+]
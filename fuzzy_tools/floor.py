@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+from .common import lazy_import, profiled
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    FLOOR FITTING
+# ------------------------------------------------------------------------
+
+# cameras to fit the floor to
+def fit_cameras(scene):
+    if scene.fuzzy_props.floor_fit_cameras == 'ACTIVE':
+        return [scene.camera] if scene.camera else []
+    return [ob for ob in scene.objects if ob.type == 'CAMERA' and ob.name.startswith('CAM.')]
+
+
+# XY points of the camera frustums on the ground plane, as (N * 4, 2) array.
+# Rays that miss the ground within max_distance end at that distance
+def camera_footprint(scene, cams, height=0.0, max_distance=100.0):
+    mats = np.array([cam.matrix_world for cam in cams], dtype=np.float64)
+    frames = np.array([[v[:] for v in cam.data.view_frame(scene=scene)] for cam in cams])
+    rot = mats[:, :3, :3]
+    loc = mats[:, :3, 3]
+
+    # perspective rays start at the camera and go through the frame corners
+    dirs = np.einsum('nij,nkj->nki', rot, frames)
+    origins = np.repeat(loc[:, None], 4, axis=1)
+    # orthographic rays start at the frame corners and go along the view axis
+    ortho = np.array([cam.data.type == 'ORTHO' for cam in cams])
+    if ortho.any():
+        flat = frames.copy()
+        flat[..., 2] = 0
+        origins[ortho] = (np.einsum('nij,nkj->nki', rot, flat) + loc[:, None])[ortho]
+        view = -rot[:, :, 2]
+        dirs[ortho] = np.repeat(view[:, None], 4, axis=1)[ortho]
+    dirs /= np.linalg.norm(dirs, axis=2, keepdims=True)
+
+    clip = np.array([min(cam.data.clip_end, max_distance) for cam in cams])[:, None]
+    dz = dirs[..., 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = (height - origins[..., 2]) / dz
+    hit = (dz < 0) & (t > 0) & (t <= clip)
+    t = np.where(hit, t, clip)
+    points = origins + dirs * t[..., None]
+    return points[..., :2].reshape(-1, 2)
+
+
+# size and place FuzzyFloor to the camera footprints plus margin.
+# Only writes when the fit changed, returns True if it did
+def fit_floor(scene):
+    prop = scene.fuzzy_props
+    floor = scene.objects.get('FuzzyFloor')
+    cams = fit_cameras(scene)
+    if floor is None or not cams:
+        return False
+
+    bounds = np.array([v[:] for v in floor.bound_box])
+    mesh_size = bounds.max(axis=0)[:2] - bounds.min(axis=0)[:2]
+    if (mesh_size <= 0).any():
+        return False
+
+    height = floor.matrix_world.translation.z
+    points = camera_footprint(scene, cams, height, prop.floor_fit_distance)
+    low = points.min(axis=0) - prop.floor_fit_margin
+    high = points.max(axis=0) + prop.floor_fit_margin
+    center = (low + high) / 2
+    scale = (high - low) / mesh_size
+
+    current = np.array([floor.location.x, floor.location.y, floor.scale.x, floor.scale.y])
+    fitted = np.concatenate((center, scale))
+    if np.allclose(current, fitted, atol=1e-4):
+        return False
+    floor.location.x, floor.location.y = center
+    floor.scale.x, floor.scale.y = scale
+    return True
+
+
+def update_floor_fit(self, context):
+    if self.floor_fit:
+        fit_floor(context.scene)
+
+
+# object space direction that the NormalDirection modifier gives all floor normals
+def floor_normal_direction(floor, target):
+    local = floor.matrix_world.inverted() @ target.matrix_world.translation
+    return local.normalized()
+
+
+# write the directional normals as custom normals and switch off the modifier,
+# so the floor no longer depends on FloorNormal. Only writes when the direction changed
+def bake_floor_normals(scene):
+    floor = scene.objects.get('FuzzyFloor')
+    target = scene.objects.get('FloorNormal')
+    if floor is None or target is None or floor.type != 'MESH':
+        return False
+
+    direction = floor_normal_direction(floor, target)
+    baked = tuple(round(v, 5) for v in direction)
+    if tuple(floor.get('fuzzy_baked_normal', ())) == baked:
+        return False
+
+    mesh = floor.data
+    ## custom normals need auto smooth before blender 4.1
+    try:
+        mesh.use_auto_smooth = True
+    except AttributeError:
+        pass
+    mesh.normals_split_custom_set_from_vertices([direction] * len(mesh.vertices))
+    floor['fuzzy_baked_normal'] = baked
+
+    mod = floor.modifiers.get('NormalDirection')
+    if mod is not None:
+        mod.show_viewport = False
+        mod.show_render = False
+        # no target, so FloorNormal and LightParent drop out of the floor evaluation
+        mod.target = None
+    return True
+
+
+def unbake_floor_normals(scene):
+    floor = scene.objects.get('FuzzyFloor')
+    if floor is None or floor.type != 'MESH':
+        return
+    if 'fuzzy_baked_normal' in floor:
+        # zero vectors reset custom normals to the default normals
+        mesh = floor.data
+        mesh.normals_split_custom_set_from_vertices([(0, 0, 0)] * len(mesh.vertices))
+        del floor['fuzzy_baked_normal']
+
+    mod = floor.modifiers.get('NormalDirection')
+    if mod is not None:
+        mod.target = scene.objects.get('FloorNormal')
+        mod.show_viewport = True
+        mod.show_render = True
+
+
+def update_floor_bake(self, context):
+    if self.floor_bake_normals:
+        bake_floor_normals(context.scene)
+    else:
+        unbake_floor_normals(context.scene)
+
+
+# switch between the full floor shader and a lean one without shadow and AO chain.
+# Muted, the switch only passes the Floor Alpha branch, so the viewport skips the rest.
+# Adds the switch to floors made before it existed
+def ensure_floor_switch(mat):
+    tree = mat.node_tree
+    if tree is None:
+        return None
+    nodes = tree.nodes
+    switch = nodes.get('Viewport Switch')
+    if switch is not None:
+        return switch
+
+    alpha = nodes.get('Floor Alpha')
+    if alpha is None:
+        return None
+    full = next((link.to_node for link in alpha.outputs[0].links
+                 if link.to_node.type == 'MIX_SHADER'), None)
+    if full is None:
+        return None
+    targets = [link.to_socket for link in full.outputs[0].links]
+
+    switch = nodes.new("ShaderNodeMixShader")
+    switch.name = "Viewport Switch"
+    switch.label = "Viewport Switch"
+    switch.location = (full.location.x + 100, full.location.y + 220)
+    switch.inputs[0].default_value = 1.0
+    tree.links.new(alpha.outputs[0], switch.inputs[1])
+    tree.links.new(full.outputs[0], switch.inputs[2])
+    for socket in targets:
+        tree.links.new(switch.outputs[0], socket)
+    return switch
+
+
+def set_floor_lean(lean):
+    mat = bpy.data.materials.get('floor_shadow')
+    if mat is None:
+        return
+    switch = ensure_floor_switch(mat)
+    if switch is not None and switch.mute != lean:
+        switch.mute = lean
+
+
+def update_floor_lean(self, context):
+    set_floor_lean(self.floor_lean_viewport)
+
+
+# full floor shader for final renders
+@persistent
+@profiled
+def floor_render_full(scene, _=None):
+    if scene.fuzzy_props.floor_lean_viewport:
+        set_floor_lean(False)
+
+
+# back to the lean floor shader after rendering
+@persistent
+@profiled
+def floor_render_lean(scene, _=None):
+    if scene.fuzzy_props.floor_lean_viewport:
+        set_floor_lean(True)
+
+
+# re-fit the floor when cameras move, and re-bake normals when FloorNormal moves,
+# by editing or animation
+@persistent
+@profiled
+def floor_update(scene, depsgraph=None):
+    prop = scene.fuzzy_props
+    if prop.floor_fit:
+        fit_floor(scene)
+    if prop.floor_bake_normals:
+        bake_floor_normals(scene)
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Fit Fuzzy Floor to cameras
+# ------------------------------------------------------------------------
+
+class MESH_OT_fit_floor(Operator):
+    """Size and place the floor to the footprint of the cameras, plus margin"""
+    bl_idname = "mesh.fit_floor"
+    bl_label = "Fit Floor"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return 'FuzzyFloor' in context.scene.objects
+
+    def execute(self, context):
+        scene = context.scene
+        if not fit_cameras(scene):
+            self.report({'WARNING'}, "No camera to fit the floor to")
+            return {'CANCELLED'}
+
+        fit_floor(scene)
+        floor = scene.objects['FuzzyFloor']
+        x, y = floor.dimensions.x, floor.dimensions.y
+        self.report({'INFO'}, f"'{floor.name}' fitted to {x:.1f} x {y:.1f} m")
+        return {'FINISHED'}
+
+
+classes = [
+    MESH_OT_fit_floor,
+]
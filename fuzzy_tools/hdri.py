@@ -0,0 +1,317 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+import bpy.utils.previews
+
+import os
+import hashlib
+import functools
+import importlib.util
+
+from bpy.types import Operator
+
+from .common import lazy_import
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    HDRI BROWSER
+# ------------------------------------------------------------------------
+
+HDRI_EXTENSIONS = ('.exr', '.hdr')
+HDRI_PREVIEW_SIZE = (128, 64)
+
+hdri_previews = {}
+hdri_jobs = {}
+hdri_library_cache = {}
+hdri_enum_items = []
+hdri_executor = None
+
+
+# folder for preview thumbnails, shared between blend files
+def hdri_cache_dir():
+    return bpy.utils.user_resource('DATAFILES', path="fuzzy_tools/hdri_previews", create=True)
+
+
+# list (path, name) of studio light HDRIs and HDRIs in the user folder
+def hdri_library(context):
+    addon = context.preferences.addons.get(__package__)
+    folder = addon.preferences.hdri_directory if addon else ""
+    folder = bpy.path.abspath(folder) if folder else ""
+
+    library = hdri_library_cache.get(folder)
+    if library is not None:
+        return library
+
+    library = []
+    for light in context.preferences.studio_lights:
+        if light.type == 'WORLD' and light.path.lower().endswith(HDRI_EXTENSIONS):
+            library.append((light.path, os.path.splitext(light.name)[0]))
+
+    if folder and os.path.isdir(folder):
+        for root, _dirs, files in os.walk(folder):
+            for file in sorted(files):
+                if file.lower().endswith(HDRI_EXTENSIONS):
+                    library.append((os.path.join(root, file), os.path.splitext(file)[0]))
+
+    hdri_library_cache.clear()
+    hdri_library_cache[folder] = library
+    return library
+
+
+# read a Radiance .hdr file without Blender, for when OpenImageIO is missing
+def read_radiance(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # header ends with an empty line, followed by the resolution line
+    pos = data.index(b'\n\n') + 2
+    end = data.index(b'\n', pos)
+    res = data[pos:end].split()
+    height, width = int(res[1]), int(res[3])
+    pos = end + 1
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    rgbe = np.empty((height, width, 4), dtype=np.uint8)
+    for y in range(height):
+        # flat scanline (old format)
+        if buf[pos] != 2 or buf[pos + 1] != 2 or buf[pos + 2] & 0x80:
+            rgbe[y] = buf[pos:pos + width * 4].reshape(width, 4)
+            pos += width * 4
+            continue
+        pos += 4
+        # run length encoded scanline, one channel after another
+        for c in range(4):
+            x = 0
+            while x < width:
+                count = int(buf[pos])
+                if count > 128:
+                    count -= 128
+                    rgbe[y, x:x + count, c] = buf[pos + 1]
+                    pos += 2
+                else:
+                    rgbe[y, x:x + count, c] = buf[pos + 1:pos + 1 + count]
+                    pos += count + 1
+                x += count
+
+    exponent = np.ldexp(1.0, rgbe[..., 3].astype(np.int32) - 136)
+    rgb = rgbe[..., :3].astype(np.float32) * exponent[..., None]
+    rgb[rgbe[..., 3] == 0] = 0.0
+    return rgb
+
+
+# read an HDRI as float RGB array (top row first)
+def read_hdri(path):
+    try:
+        import OpenImageIO as oiio
+    except ImportError:
+        oiio = None
+    if oiio is not None:
+        inp = oiio.ImageInput.open(path)
+        if inp is None:
+            raise OSError(f"Can't open '{path}'")
+        try:
+            spec = inp.spec()
+            pixels = inp.read_image(0, 0, 0, min(spec.nchannels, 3), 'float')
+        finally:
+            inp.close()
+        pixels = np.asarray(pixels, dtype=np.float32).reshape(spec.height, spec.width, -1)
+        if pixels.shape[2] == 1:
+            pixels = np.repeat(pixels, 3, axis=2)
+        return pixels
+    if path.lower().endswith('.hdr'):
+        return read_radiance(path)
+    raise OSError(f"No reader available for '{path}'")
+
+
+# average of count blocks along an axis. Block edges are spread evenly,
+# so sizes that aren't a multiple of count keep their last rows and columns
+def block_mean(pixels, count, axis):
+    edges = np.linspace(0, pixels.shape[axis], count + 1).astype(int)
+    sums = np.add.reduceat(pixels, edges[:-1], axis=axis)
+    shape = [1] * pixels.ndim
+    shape[axis] = count
+    return sums / np.diff(edges).reshape(shape)
+
+
+# downscale and tone map HDR pixels to an RGBA preview (bottom row first)
+def tonemap_preview(rgb, size=HDRI_PREVIEW_SIZE):
+    w, h = size
+    height, width = rgb.shape[:2]
+    h, w = min(h, height), min(width, w)
+    # box filter by averaging blocks
+    small = block_mean(block_mean(rgb, h, 0), w, 1)
+    small = np.nan_to_num(small, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Reinhard with the log-average luminance as key
+    lum = small @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)
+    key = np.exp(np.mean(np.log(lum + 1e-4)))
+    scaled = small * (0.18 / max(key, 1e-4))
+    mapped = np.clip(scaled / (1.0 + scaled), 0.0, 1.0) ** (1 / 2.2)
+
+    preview = np.ones((h, w, 4), dtype=np.float32)
+    preview[..., :3] = mapped
+    return np.ascontiguousarray(preview[::-1])
+
+
+# OpenImageIO comes with Blender 4.0 and newer. Without it only .hdr files get
+# a thumbnail, others show a plain icon
+@functools.lru_cache(maxsize=None)
+def oiio_available():
+    return importlib.util.find_spec('OpenImageIO') is not None
+
+
+def hdri_readable(path):
+    return path.lower().endswith('.hdr') or oiio_available()
+
+
+# preview from disk cache, or build and cache it. Runs in worker threads,
+# so the cache folder is resolved by the caller, no bpy here
+def hdri_preview_pixels(path, cache_dir):
+    stat = os.stat(path)
+    key = hashlib.sha1(f"{path}|{stat.st_mtime_ns}|{stat.st_size}".encode()).hexdigest()
+    cache_file = os.path.join(cache_dir, key + ".npy")
+    try:
+        return np.load(cache_file)
+    except (OSError, ValueError):
+        pass
+    preview = tonemap_preview(read_hdri(path))
+    tmp = cache_file + f".{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.save(f, preview)
+    os.replace(tmp, cache_file)
+    return preview
+
+
+def hdri_request_preview(path):
+    global hdri_executor
+    if path in hdri_jobs:
+        return
+    if hdri_executor is None:
+        import concurrent.futures
+
+        # the workers use numpy, load it here as lazy imports aren't thread safe
+        np.float32
+        workers = min(4, os.cpu_count() or 1)
+        hdri_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="fuzzy_hdri")
+    hdri_jobs[path] = hdri_executor.submit(hdri_preview_pixels, path, hdri_cache_dir())
+    if not bpy.app.timers.is_registered(hdri_poll_previews):
+        bpy.app.timers.register(hdri_poll_previews, first_interval=0.1)
+
+
+# move finished thumbnails into the preview collection on the main thread
+def hdri_poll_previews():
+    pcoll = hdri_previews.get('main')
+    if pcoll is None:
+        return None
+
+    pending = False
+    loaded = False
+    for path, job in hdri_jobs.items():
+        if path in pcoll or job is None:
+            continue
+        if not job.done():
+            pending = True
+            continue
+        try:
+            pixels = job.result()
+        except Exception as e:
+            print(f"Error creating HDRI preview: {e}")
+            hdri_jobs[path] = None
+            continue
+        h, w = pixels.shape[:2]
+        preview = pcoll.new(path)
+        preview.image_size = (w, h)
+        preview.image_pixels_float.foreach_set(pixels.ravel())
+        preview.icon_size = (w, h)
+        preview.icon_pixels_float.foreach_set(pixels.ravel())
+        loaded = True
+
+    if loaded:
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+    return 0.2 if pending else None
+
+
+def hdri_browser_items(self, context):
+    pcoll = hdri_previews.get('main')
+    hdri_enum_items.clear()
+    if pcoll is None or context is None:
+        return hdri_enum_items
+
+    for i, (path, name) in enumerate(hdri_library(context)):
+        preview = pcoll.get(path)
+        if preview is not None:
+            icon = preview.icon_id
+        elif hdri_jobs.get(path, 1) is None:
+            icon = 'ERROR'
+        elif not hdri_readable(path):
+            icon = 'WORLD'
+        else:
+            hdri_request_preview(path)
+            icon = 'TIME'
+        hdri_enum_items.append((path, name, path, icon, i))
+    return hdri_enum_items
+
+
+# load only the chosen HDRI into the blend file
+def load_hdri(self, context):
+    world = context.scene.world
+    if world is None or world.node_tree is None:
+        return
+    node = world.node_tree.nodes.get("World HDRI")
+    if node is None or not self.hdri_browser:
+        return
+    try:
+        node.image = bpy.data.images.load(self.hdri_browser, check_existing=True)
+    except RuntimeError as e:
+        print(f"Error loading HDRI: {e}")
+
+
+def hdri_previews_register():
+    hdri_previews['main'] = bpy.utils.previews.new()
+
+
+def hdri_previews_unregister():
+    global hdri_executor
+    if bpy.app.timers.is_registered(hdri_poll_previews):
+        bpy.app.timers.unregister(hdri_poll_previews)
+    if hdri_executor is not None:
+        hdri_executor.shutdown(wait=False, cancel_futures=True)
+        hdri_executor = None
+    hdri_jobs.clear()
+    hdri_library_cache.clear()
+    hdri_enum_items.clear()
+    for pcoll in hdri_previews.values():
+        bpy.utils.previews.remove(pcoll)
+    hdri_previews.clear()
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Refresh HDRI browser
+# ------------------------------------------------------------------------
+
+class WORLD_OT_hdri_refresh(Operator):
+    """Scan studio lights and the HDRI folder again for new HDRIs"""
+    bl_idname = "world.hdri_refresh"
+    bl_label = "Refresh HDRIs"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        hdri_library_cache.clear()
+        # retry previews that failed before
+        for path in [path for path, job in hdri_jobs.items() if job is None]:
+            del hdri_jobs[path]
+        if context.area:
+            context.area.tag_redraw()
+        return {'FINISHED'}
+
+
+classes = [
+    WORLD_OT_hdri_refresh,
+]
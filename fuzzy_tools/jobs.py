@@ -0,0 +1,125 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import os
+import json
+import time
+import threading
+
+
+# ------------------------------------------------------------------------
+#    BACKGROUND JOBS
+# ------------------------------------------------------------------------
+
+# Each job is a background Blender process. Processes running the command line
+# of Fuzzy Tools (cli.py) print their result as a line starting with RESULT_PREFIX
+RESULT_PREFIX = "FUZZY_RESULT "
+
+# script that runs the command line in a background Blender
+MAIN_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__main__.py")
+
+
+# command line for a background Blender process running Fuzzy Tools
+def blender_command(*args, blend=None):
+    cmd = [bpy.app.binary_path, '-b', '--factory-startup']
+    if blend:
+        cmd.append(blend)
+    cmd += ['-P', MAIN_SCRIPT, '--', *args]
+    return cmd
+
+
+# print the result of a background process for the dispatcher to read
+def print_result(result):
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+# set to stop queued jobs and terminate running ones
+blender_jobs_cancel = threading.Event()
+blender_processes = set()
+
+
+def run_blender_job(name, cmd, timeout=None):
+    import subprocess
+
+    start = time.perf_counter()
+    result = {'name': name, 'status': 'failed', 'seconds': 0.0}
+    if blender_jobs_cancel.is_set():
+        result['status'] = 'cancelled'
+        return result
+
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    blender_processes.add(proc)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.communicate()
+        result['error'] = f"timed out after {timeout} s"
+    else:
+        for line in reversed(stdout.splitlines()):
+            if line.startswith(RESULT_PREFIX):
+                result.update(json.loads(line[len(RESULT_PREFIX):]))
+                break
+        else:
+            # plain Blender command lines don't print a result
+            if proc.returncode == 0:
+                result['status'] = 'done'
+            else:
+                result['error'] = (stderr or stdout).strip()[-2000:]
+        if proc.returncode != 0 and result['status'] != 'failed':
+            result['status'] = 'failed'
+            result.setdefault('error', f"exit code {proc.returncode}")
+        if blender_jobs_cancel.is_set() and result['status'] == 'failed':
+            result['status'] = 'cancelled'
+    finally:
+        blender_processes.discard(proc)
+    result['seconds'] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def cancel_blender_jobs():
+    blender_jobs_cancel.set()
+    for proc in list(blender_processes):
+        proc.terminate()
+
+
+# run (name, command) jobs in a pool of background Blender processes
+def run_blender_jobs(jobs, workers, on_done=None):
+    import concurrent.futures
+
+    blender_jobs_cancel.clear()
+    results = []
+    if not jobs:
+        return results
+    workers = max(1, min(workers, len(jobs)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_blender_job, name, cmd, timeout) for name, cmd, timeout in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if on_done:
+                on_done(result, len(results), len(jobs))
+    return results
+
+
+def print_progress(result, done, total):
+    status = result['status']
+    print(f"[{done}/{total}] {status:<9} {result['seconds']:7.1f}s  {result['name']}", flush=True)
+    if status == 'failed':
+        print(f"    {result.get('error', '')}", flush=True)
+
+
+def write_report(path, report):
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to '{path}'")
+
+
+# absolute paths, the same as bpy.data.filepath in the processes opening them
+def find_blend_files(directory):
+    files = []
+    for root, dirs, names in os.walk(os.path.abspath(directory)):
+        dirs[:] = [d for d in dirs if not d.startswith('.')]
+        files += [os.path.join(root, name) for name in names if name.endswith('.blend')]
+    return sorted(files)
@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+from bpy.props import BoolProperty, IntProperty
+from bpy.types import Operator
+
+from .common import lazy_import
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    F-CURVES
+# ------------------------------------------------------------------------
+
+# F-curves of the active action, with slotted actions in Blender 4.4 and newer
+def action_fcurves(anim_data):
+    action = anim_data.action
+    if action is None:
+        return []
+    slot = getattr(anim_data, 'action_slot', None)
+    if slot is not None:
+        from bpy_extras.anim_utils import action_get_channelbag_for_slot
+        channelbag = action_get_channelbag_for_slot(action, slot)
+        return list(channelbag.fcurves) if channelbag else []
+    return list(action.fcurves)
+
+
+# F-curves of all slots of an action, also actions without users
+def action_all_fcurves(action):
+    layers = getattr(action, 'layers', None)
+    if layers:
+        return [fc for layer in layers for strip in layer.strips
+                for channelbag in strip.channelbags for fc in channelbag.fcurves]
+    return list(getattr(action, 'fcurves', ()))
+
+
+# write keyframes in bulk, replacing the F-curve of data_path
+def key_values(owner_id, data_path, frames, values, interpolation='CONSTANT'):
+    owner_id.keyframe_insert(data_path, frame=frames[0])
+    fc = next(fc for fc in action_fcurves(owner_id.animation_data) if fc.data_path == data_path)
+    points = fc.keyframe_points
+    points.clear()
+    points.add(len(frames))
+    co = np.column_stack([frames, values]).astype(np.float32)
+    points.foreach_set('co', co.ravel())
+    for point in points:
+        point.interpolation = interpolation
+    fc.update()
+    return fc
+
+
+def remove_fcurve(owner_id, data_path):
+    ad = owner_id.animation_data
+    if ad is None or ad.action is None:
+        return
+    for fc in action_fcurves(ad):
+        if fc.data_path == data_path:
+            slot = getattr(ad, 'action_slot', None)
+            if slot is not None:
+                from bpy_extras.anim_utils import action_get_channelbag_for_slot
+                action_get_channelbag_for_slot(ad.action, slot).fcurves.remove(fc)
+            else:
+                ad.action.fcurves.remove(fc)
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Move Keyframes and Markers
+# ------------------------------------------------------------------------
+
+class TRANSFORM_OT_keyframes_markers(Operator):
+    """Move keyframes and markers from current frame, regardless of selection or visibility"""
+    bl_idname = "transform.keyframes_markers"
+    bl_label = "Move Keyframes and Markers"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    frame_shift: IntProperty(
+        name="Frames",
+        description="Amount of frames to move",
+        default=0,
+        options={'SKIP_SAVE'}
+    )
+    
+    before_current: BoolProperty(
+        name="Before Current Frame",
+        description="Move before current frame instead of after",
+        default=False,
+        options={'SKIP_SAVE'}
+    )
+
+    keys: BoolProperty(
+        name="Keyframes",
+        description="Move Keyframes (NOT linked actions and locked curves)",
+        default=True
+    )
+    
+    markers: BoolProperty(
+        name="Markers",
+        description="Move Markers",
+        default=True
+    )
+    
+    fake_user: BoolProperty(
+        name="Fake User",
+        description="Include actions with Fake User",
+        default=False
+    )
+  
+    def execute(self, context):
+        scene = context.scene
+        fr = scene.frame_current
+        frames = self.frame_shift
+        a = bpy.data.actions
+        
+        if self.keys:
+            for action in a:
+                if not action.library and (self.fake_user or not action.use_fake_user):
+                    for curve in action_all_fcurves(action):
+                        if not curve.lock:  # Check if the curve is not locked
+                            kfp = curve.keyframe_points
+                            for point in kfp:
+                                if not self.before_current and point.co.x > fr:
+                                    point.co_ui.x += frames
+                                elif self.before_current and point.co.x < fr:
+                                    point.co_ui.x += frames
+        
+        if self.markers:
+            m = scene.timeline_markers
+            for marker in m:
+                if self.before_current == False:
+                    if marker.frame > fr:
+                        marker.frame += frames
+                else:
+                    if marker.frame < fr:
+                        marker.frame += frames
+        
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_popup(self, event)
+    
+    def draw(self, context):
+        layout = self.layout
+        layout.use_property_split = True
+        layout.prop(self, 'frame_shift')
+        layout.prop(self, 'before_current')
+        layout.separator(factor=0.5)
+        row = layout.row(heading="Target")
+        row.prop(self, 'keys')
+        row.prop(self, 'markers')
+        row = layout.row()
+        if not self.keys:
+            row.enabled = False
+        row.prop(self, 'fake_user')
+        layout.separator(factor=0.5)
+        layout.label(icon='INFO', text="Target is regardless of selection or visibility")
+
+
+classes = [
+    TRANSFORM_OT_keyframes_markers,
+]
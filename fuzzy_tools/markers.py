@@ -0,0 +1,337 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import json
+import time
+import bisect
+
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+from .common import is_next_version, profiled
+from .settings import apply_scene_settings
+
+
+# ------------------------------------------------------------------------
+#    MARKER RULES
+# ------------------------------------------------------------------------
+
+# Markers switch render settings from their frame on, until the next marker
+# that sets the same setting. Before the first marker, the first marker applies.
+#   'mblur_on 0.5' and 'mblur_off' switch motion blur
+#   'fz samples=16 res=50 simplify=1 hair=strip rt=off' set settings inline,
+#   keys are short names below or 'path.to.property' relative to the scene
+#   any other marker name that is a key in the 'Fuzzy Rules' text (JSON) sets its table:
+#   {"closeup": {"eevee.taa_render_samples": 128, "render.hair_type": "STRAND"}}
+RULES_TEXT = "Fuzzy Rules"
+
+RULE_KEYS = {
+    'samples': ('eevee.taa_render_samples', 'cycles.samples'),
+    'res': ('render.resolution_percentage',),
+    'hair': ('render.hair_type',),
+    'rt': ('eevee.use_raytracing', 'eevee.use_ssr'),
+    'rtres': ('eevee.ray_tracing_options.resolution_scale',),
+    'threshold': ('cycles.adaptive_threshold',),
+    'adaptive': ('cycles.use_adaptive_sampling',),
+    'shadow': ('eevee.shadow_resolution_scale', 'eevee.shadow_cube_size'),
+}
+
+
+def rule_value(text):
+    if text.lower() in {'on', 'true', 'yes'}:
+        return True
+    if text.lower() in {'off', 'false', 'no'}:
+        return False
+    for kind in (int, float):
+        try:
+            return kind(text)
+        except ValueError:
+            pass
+    return text
+
+
+# {'path': value} a marker sets, or None for markers that aren't rules
+def marker_rule(name, table):
+    if is_next_version():
+        mblur = 'render.'
+    else:
+        mblur = 'eevee.'
+    if name.startswith('mblur_on'):
+        settings = {mblur + 'use_motion_blur': True}
+        try:
+            settings[mblur + 'motion_blur_shutter'] = float(name[8:])
+        except ValueError:
+            pass
+        return settings
+    if name == 'mblur_off':
+        return {mblur + 'use_motion_blur': False}
+
+    if name.startswith('fz '):
+        settings = {}
+        for item in name[3:].split():
+            key, _, text = item.partition('=')
+            value = rule_value(text)
+            if key == 'simplify':
+                settings['render.use_simplify'] = value is not False
+                if not isinstance(value, bool):
+                    settings['render.simplify_subdivision_render'] = value
+                continue
+            if key == 'hair' and isinstance(value, str):
+                value = value.upper()
+            for path in RULE_KEYS.get(key, (key,)):
+                settings[path] = value
+        return settings or None
+
+    return table.get(name)
+
+
+def rules_table():
+    text = bpy.data.texts.get(RULES_TEXT)
+    if text is None:
+        return {}
+    try:
+        table = json.loads(text.as_string())
+    except ValueError as error:
+        print(f"Fuzzy Tools: '{RULES_TEXT}' is not valid JSON: {error}")
+        return {}
+    return {name: settings for name, settings in table.items() if isinstance(settings, dict)}
+
+
+def rule_markers(scene):
+    return any(m.name.startswith(('mblur', 'fz ')) for m in scene.timeline_markers) or \
+        (RULES_TEXT in bpy.data.texts and len(scene.timeline_markers) > 0)
+
+
+# seconds between full comparisons of markers and table when quick
+RULE_CHECK_INTERVAL = 0.5
+
+rule_cache = {'key': None, 'index': None, 'version': 0, 'quick': None, 'checked': 0.0}
+# segment last written per scene, so 'check' writes on transitions only
+rule_applied = {}
+
+
+# frame -> settings index: (transition frames, settings per segment).
+# Segment 0 holds what applies before the first marker. Cached on markers and table.
+# With quick, as on every frame change, markers and table are only compared in full
+# when the marker count changed or RULE_CHECK_INTERVAL passed
+def rule_index(scene, quick=False):
+    markers = scene.timeline_markers
+    text = bpy.data.texts.get(RULES_TEXT)
+    short_key = (scene.name, len(markers), text is not None)
+    now = time.monotonic()
+    if quick and rule_cache['quick'] == short_key and now - rule_cache['checked'] < RULE_CHECK_INTERVAL:
+        return rule_cache['index']
+    rule_cache['quick'] = short_key
+    rule_cache['checked'] = now
+
+    key = (scene.name, tuple((m.frame, m.name) for m in markers),
+           text.as_string() if text else None)
+    if rule_cache['key'] == key:
+        return rule_cache['index']
+
+    table = rules_table() if text else {}
+    rules = []
+    for m in sorted(scene.timeline_markers, key=lambda m: (m.frame, m.name)):
+        settings = marker_rule(m.name, table)
+        if settings:
+            rules.append((m.frame, settings))
+
+    state = {}
+    for _, settings in reversed(rules):
+        state.update(settings)
+    frames, states = [], [dict(state)]
+    for frame, settings in rules:
+        state.update(settings)
+        if frames and frames[-1] == frame:
+            states[-1] = dict(state)
+        else:
+            frames.append(frame)
+            states.append(dict(state))
+
+    rule_cache['key'] = key
+    rule_cache['index'] = (frames, states)
+    rule_cache['version'] += 1
+    return rule_cache['index']
+
+
+def rule_segment(index, frame):
+    return bisect.bisect_right(index[0], frame)
+
+
+# settings the markers set at a frame
+def rule_state(scene, frame):
+    index = rule_index(scene)
+    return index[1][rule_segment(index, frame)]
+
+
+# write the settings of the markers at a frame. Returns the number of properties written
+def apply_rules(scene, frame, force=False, quick=False):
+    index = rule_index(scene, quick)
+    segment = (rule_cache['version'], rule_segment(index, frame))
+    if not force and rule_applied.get(scene.name) == segment:
+        return 0
+    rule_applied[scene.name] = segment
+    return apply_scene_settings(scene, index[1][segment[1]])
+
+
+# shots from camera bound markers as (start, end, camera) within the frame range.
+# Frames before the first marker use its camera, like Blender does
+def get_shots(scene):
+    bound = {}
+    for marker in scene.timeline_markers:
+        if marker.camera:
+            bound[marker.frame] = marker.camera
+    if not bound:
+        return [(scene.frame_start, scene.frame_end, scene.camera)] if scene.camera else []
+
+    frames = sorted(bound)
+    shots = []
+    for i, frame in enumerate(frames):
+        start = scene.frame_start if i == 0 else max(frame, scene.frame_start)
+        end = frames[i + 1] - 1 if i + 1 < len(frames) else scene.frame_end
+        end = min(end, scene.frame_end)
+        if start <= end:
+            shots.append((start, end, bound[frame]))
+    return shots
+
+
+# motion blur (enabled, shutter) per frame from the marker rules, like 'check' does
+def motion_blur_schedule(scene, frames):
+    if is_next_version():
+        version, prefix = scene.render, 'render.'
+    else:
+        version, prefix = scene.eevee, 'eevee.'
+    schedule = {}
+    for frame in frames:
+        state = rule_state(scene, frame)
+        schedule[frame] = (state.get(prefix + 'use_motion_blur', version.use_motion_blur),
+                           round(state.get(prefix + 'motion_blur_shutter', version.motion_blur_shutter), 4))
+    return schedule
+
+
+@profiled
+def check(scene, depsgraph=None):
+    # check motion blur and other rule markers
+    apply_rules(scene, scene.frame_current, quick=True)
+
+
+# keeps exactly one 'check' in frame_change_post.
+# Also removes 'check' handlers left from an earlier load of the add-on
+def check_scene(self, context):
+    handlers = bpy.app.handlers.frame_change_post
+    current = None
+    for handler in [handler for handler in handlers if is_check_handler(handler)]:
+        if self.scene_animate and current is None and handler is check:
+            current = handler
+        else:
+            handlers.remove(handler)
+    if self.scene_animate:
+        rule_applied.clear()
+        if current is None:
+            handlers.append(check)
+
+
+# Fuzzy's own 'check' handler, also from an earlier load of the add-on
+def is_check_handler(handler):
+    func = getattr(handler, '__wrapped__', handler)
+    return getattr(func, '__name__', '') == 'check' and getattr(func, '__module__', '') == __name__
+
+
+# 'scene_animate' before a render, put back when the render ends
+animate_before_render = {}
+
+
+# handler initialized during render
+@persistent
+@profiled
+def auto_animate_scene(scene, context):
+    prop = bpy.context.scene.fuzzy_props
+    animate_before_render.setdefault(scene.name, prop.scene_animate)
+    prop.scene_animate = True
+
+
+# handler for removing previous handler during canceling or completing render
+@persistent
+@profiled
+def disable_animate_scene(scene, context):
+    prop = bpy.context.scene.fuzzy_props
+    # check_scene keeps a single 'check' handler, so this only puts the toggle back
+    prop.scene_animate = animate_before_render.pop(scene.name, False)
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - add Marker for Motion Blur
+# ------------------------------------------------------------------------
+
+class MARKER_OT_add_motionblur_marker(Operator):
+    """Add a marker to enable or disable motion blur at current frame"""
+    bl_idname = "marker.add_motionblur_marker"
+    bl_label = "Add Motion Blur Marker"
+    bl_options = {'UNDO', 'INTERNAL'}
+
+    blur: bpy.props.StringProperty()
+
+    def execute(self, context):
+        scene = context.scene
+        fr = scene.frame_current
+        marker = scene.timeline_markers
+
+        if is_next_version():
+            version = scene.render
+        else:
+            version = scene.eevee
+       
+        for m in marker:
+            if m.frame == fr and m.name.startswith("mblur"):
+                marker.remove(m)
+                break
+
+        if self.blur == 'on':
+            marker.new('mblur_on', frame=fr)
+            version.use_motion_blur = True
+        elif self.blur == 'off':
+            marker.new('mblur_off', frame=fr)
+            version.use_motion_blur = False
+
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Copy Shutter to Markers
+# ------------------------------------------------------------------------
+
+class MARKER_OT_shutter_to_markers(Operator):
+    """Copy current shutter time to selected 'mblur_on' markers"""
+    bl_idname = "marker.shutter_to_markers"
+    bl_label = "Copy Shutter to Markers"
+    bl_options = {'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        markers = scene.timeline_markers
+        count = 0
+
+        if is_next_version():
+            version = scene.render
+        else:
+            version = scene.eevee
+
+        for marker in markers:
+            if marker.select and marker.name.startswith("mblur_on"):
+                base_name = marker.name[:8]
+                v = round(version.motion_blur_shutter, 2)
+                marker.name = f"{base_name} {v}"
+                count += 1
+
+        if count == 0:
+            self.report({'WARNING'}, "Selection of 'mblur_on' marker required")
+            return {'CANCELLED'}
+
+        return {'FINISHED'}
+
+
+classes = [
+    MARKER_OT_add_motionblur_marker,
+    MARKER_OT_shutter_to_markers,
+]
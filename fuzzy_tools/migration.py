@@ -0,0 +1,223 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import time
+
+from bpy.app.handlers import persistent
+
+from .common import profiled
+
+
+# ------------------------------------------------------------------------
+#    FILE MIGRATION
+# ------------------------------------------------------------------------
+
+# Migration steps return True when they changed data
+
+# find HDRI studio light when used in Fuzzy World shader
+@profiled
+def reload_image():
+    world = bpy.data.worlds.get('Fuzzy World')
+    if world is None or world.node_tree is None:
+        return False
+    nodes = world.node_tree.nodes
+    node = nodes.get('World HDRI')
+    changed = False
+    if node is None: ## for files created with Fuzzy Tools 2.0.0 or older
+        node = nodes.get('Environment Texture')
+        if node is None:
+            return False
+        node.name = 'World HDRI'
+        changed = True
+    if node.image is None:
+        return changed
+    # remove suffix
+    name = node.image.name.rsplit('.')[0]
+    valid_names = {'city', 'courtyard', 'forest', 'interior', 'night', 'studio', 'sunrise', 'sunset'}
+    if name not in valid_names or node.image.file_format == 'OPEN_EXR':
+        return changed
+    node.image.name = name + "_old"
+    try:
+        hdri = bpy.data.images.load(
+            bpy.context.preferences.studio_lights[name + '.exr'].path, check_existing=True
+        )
+        node.image = hdri
+    except Exception as e:
+        print(f"Error loading HDRI: {e}")
+    return True
+
+
+# fix naming after upgrades in v3.0.2
+@profiled
+def name_fix():
+    objs = bpy.data.objects
+    changed = False
+    if 'Fuzzy floor' in objs:
+        floor = objs['Fuzzy floor']
+        floor.name = 'FuzzyFloor'
+        mods = floor.modifiers
+        if 'Normal Direction' in mods:
+            mods['Normal Direction'].name = 'NormalDirection'
+        changed = True
+    if 'floor normal' in objs:
+        objs['floor normal'].name = 'FloorNormal'
+        changed = True
+    return changed
+
+
+# floor and Fuzzy World made before Fuzzy Tools 3.0
+def floor_outdated(scene):
+    mat = bpy.data.materials.get('floor_shadow')
+    return scene.objects.get('FuzzyFloor') is not None and (
+        mat is None or mat.node_tree is None or 'Shadow Value' not in mat.node_tree.nodes)
+
+
+def world_outdated(scene):
+    world = scene.world
+    return (world is not None and world.name == 'Fuzzy World' and world.node_tree is not None
+            and 'BG Group' not in world.node_tree.nodes)
+
+
+def fuzzy_materials_outdated():
+    return any(floor_outdated(scene) or world_outdated(scene) for scene in bpy.data.scenes)
+
+
+# rebuild floor and Fuzzy World made before Fuzzy Tools 3.0.
+# Floor first, so the new world links its background group to the new floor material
+def rebuild_fuzzy_materials():
+    changed = False
+    for scene in bpy.data.scenes:
+        override = dict(scene=scene, view_layer=scene.view_layers[0])
+
+        floor = scene.objects.get('FuzzyFloor')
+        if floor_outdated(scene):
+            # keep placement of floor and FloorNormal
+            matrix = floor.matrix_world.copy()
+            normal = scene.objects.get('FloorNormal')
+            normal_parent = normal.parent if normal else None
+            normal_matrix = normal.matrix_world.copy() if normal else None
+
+            with bpy.context.temp_override(**override):
+                bpy.ops.mesh.fuzzy_floor()
+
+            floor = scene.objects['FuzzyFloor']
+            floor.matrix_world = matrix
+            normal = scene.objects['FloorNormal']
+            if normal_matrix is not None:
+                normal.parent = normal_parent
+                normal.matrix_world = normal_matrix
+            changed = True
+
+        world = scene.world
+        if world_outdated(scene):
+            # keep the HDRI and its rotation and strength
+            nodes = world.node_tree.nodes
+            hdri = nodes.get('World HDRI') or nodes.get('Environment Texture')
+            image = hdri.image if hdri else None
+            rot = nodes.get('HDRI Rotation')
+            rot_z = rot.inputs[2].default_value[2] if rot else None
+            strength = nodes.get('HDRI Strength')
+            strength = strength.inputs[1].default_value if strength else None
+
+            with bpy.context.temp_override(**override):
+                bpy.ops.world.fuzzy_sky()
+
+            nodes = scene.world.node_tree.nodes
+            if image is not None:
+                nodes['World HDRI'].image = image
+            if rot_z is not None:
+                nodes['HDRI Rotation'].inputs[2].default_value[2] = rot_z
+            if strength is not None:
+                nodes['HDRI Strength'].inputs[1].default_value = strength
+            changed = True
+    return changed
+
+
+# version stamped in every scene after a migration changed the file,
+# and in scenes Fuzzy builds from scratch. Raise it when adding a migration
+FUZZY_DATA_VERSION = 2
+
+# (data version, step, offline check) in order. A step runs for files stamped below its version.
+# Steps with an offline check only run from the command line. Files opened in the UI
+# stop below such a step when its check finds work for it, and skip it otherwise
+migrations = [
+    (1, reload_image, None),
+    (1, name_fix, None),
+    (2, rebuild_fuzzy_materials, fuzzy_materials_outdated),
+]
+
+# (step name, seconds) of the last migration
+migration_timings = []
+
+
+# lowest data version of all scenes in the file
+def file_data_version():
+    return min((scene.fuzzy_props.data_version for scene in bpy.data.scenes),
+               default=FUZZY_DATA_VERSION)
+
+
+# scene without Fuzzy floor or world, so anything Fuzzy builds in it is current data
+def fuzzy_scene_empty(scene):
+    objs = scene.objects
+    world = scene.world
+    return (not any(name in objs for name in ('FuzzyFloor', 'Fuzzy floor', 'FloorNormal', 'floor normal'))
+            and (world is None or world.name != 'Fuzzy World'))
+
+
+# stamp the current data version in a scene Fuzzy built from scratch,
+# so a new scene doesn't pull the file back into migrations on load
+def stamp_new_scene(scene):
+    prop = scene.fuzzy_props
+    prop.data_version = max(prop.data_version, FUZZY_DATA_VERSION)
+
+
+def migrate_file(offline=False):
+    version = file_data_version()
+    if version >= FUZZY_DATA_VERSION:
+        return False
+
+    # the version the file reaches, stamped in every scene when a step changed data
+    reached = FUZZY_DATA_VERSION
+    changed = False
+    migration_timings.clear()
+    for step_version, step, offline_check in migrations:
+        if step_version <= version:
+            continue
+        if offline_check is not None and not offline:
+            if offline_check():
+                reached = step_version - 1
+                break
+            continue
+        start = time.perf_counter()
+        changed |= bool(step())
+        migration_timings.append((step.__name__, time.perf_counter() - start))
+    if not changed:
+        return False
+
+    for scene in bpy.data.scenes:
+        prop = scene.fuzzy_props
+        prop.data_version = max(prop.data_version, reached)
+
+    total = sum(t for _, t in migration_timings) * 1000
+    steps_info = ", ".join(f"{name} {t * 1000:.1f} ms" for name, t in migration_timings)
+    print(f"Fuzzy Tools: file migrated from data version {version} to "
+          f"{reached} in {total:.1f} ms ({steps_info})")
+    return True
+
+
+# motion blur handler 'check' is not persistent and is gone after loading a file
+def sync_animate_scene():
+    for scene in bpy.data.scenes:
+        prop = scene.fuzzy_props
+        if prop.scene_animate:
+            # write the ID property directly to skip the update function
+            prop['scene_animate'] = False
+
+
+# single handler for opening files. Skips migration for files already up to date
+@persistent
+@profiled
+def fuzzy_load_post(_):
+    sync_animate_scene()
+    migrate_file()
@@ -0,0 +1,575 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+from bpy.types import Operator
+from math import radians
+
+from .common import is_next_version
+from .floor import bake_floor_normals, ensure_floor_switch, fit_floor
+from .migration import fuzzy_scene_empty, stamp_new_scene
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Fuzzy Floor (shadow only)
+# ------------------------------------------------------------------------
+
+class MESH_OT_fuzzy_floor(Operator):
+    """Place a floor with shadow only and replace the old one.
+Delete the default cube"""
+    bl_idname = "mesh.fuzzy_floor"
+    bl_label = "Build Floor"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        objects = scene.objects
+        new = fuzzy_scene_empty(scene)
+
+        # delete objects
+        for name in ["Cube", "FuzzyFloor", "FloorNormal"]:
+            if name in objects:
+                obj = bpy.data.objects[name]
+                if name == "Cube":
+                    if hasattr(obj.data, 'polygons') and len(obj.data.polygons) == 6:
+                        bpy.data.objects.remove(obj)
+                else:
+                    bpy.data.objects.remove(obj)
+
+        # add floor
+        bpy.ops.mesh.primitive_plane_add(size=60, location=(0, 0, 0))
+
+        # name new Plane 'FuzzyFloor'
+        floor = context.active_object
+        floor.name = "FuzzyFloor"
+
+        # create collection 'Set' if it doesn't exist yet
+        link_to_name = 'Set'
+        try:
+            link_to = scene.collection.children[link_to_name]
+        except KeyError:
+            link_to = bpy.data.collections.new(link_to_name)
+            scene.collection.children.link(link_to)
+
+        # link floor to collection 'Set'
+        oldcoll = floor.users_collection[0]
+        if oldcoll.name == 'Scene Collection':
+            context.collection.objects.unlink(floor)
+        else:
+            oldcoll.objects.unlink(floor)        
+        bpy.data.collections['Set'].objects.link(floor)
+
+        # create empty as Target for FloorNormal Edit modifier
+        bpy.ops.object.empty_add(location=(15, -20, 20))
+        empty = context.object
+        empty.name = "FloorNormal"
+        empty.empty_display_size = 6
+        empty.empty_display_type = 'SINGLE_ARROW'
+        link_to_name = 'Set'
+        track = empty.constraints.new('DAMPED_TRACK')
+        track.target = floor
+        track.track_axis = 'TRACK_Z'
+        
+        # link empty to collection 'Set'
+        oldcoll = empty.users_collection[0].name
+        if oldcoll == 'Scene Collection':
+            context.collection.objects.unlink(empty)
+        else:       
+            bpy.data.collections[oldcoll].objects.unlink(empty)
+        bpy.data.collections['Set'].objects.link(empty)
+
+        # objects settings ## error exception added for blender 4.1
+        try:
+            floor.data.use_auto_smooth = True
+        except AttributeError:
+            pass
+        
+        # create modifier 'Normal Edit' and set empty as Target
+        normal = floor.modifiers.new("NormalDirection", 'NORMAL_EDIT')
+        normal.mode = 'DIRECTIONAL'
+        normal.use_direction_parallel = True
+        normal.target = bpy.data.objects["FloorNormal"]
+        normal.no_polynors_fix = True
+
+        # object settings
+        floor.hide_select = True
+        floor.show_wire = True
+
+        # Get material
+        oldmat = bpy.data.materials.get("floor_shadow")
+        if oldmat is not None:
+            oldmat.name = "floor_shadow_old"
+
+        # create material
+        mat = bpy.data.materials.new(name="floor_shadow")
+        # Assign it to object
+        if floor.data.materials:
+            # assign to 1st material slot
+            floor.data.materials[0] = mat
+        else:
+            # no slots
+            floor.data.materials.append(mat)
+
+        mat.use_nodes = True
+
+        # build node shader
+        nodes = bpy.data.materials['floor_shadow'].node_tree.nodes
+        nodes.remove(nodes.get('Principled BSDF'))
+
+        matoutput = nodes.get("Material Output")
+        matoutput.location = (600, 80)
+        matoutput.target = 'EEVEE'
+
+        mixshader = nodes.new("ShaderNodeMixShader")
+        mixshader.location = (200, 60)
+
+        shadow = nodes.new("ShaderNodeBsdfDiffuse")
+        shadow.location = (0, 10)
+        shadow.inputs[0].default_value = (0, 0, 0, 1)
+
+        holdout = nodes.new("ShaderNodeHoldout")
+        holdout.location = (-200, -160)
+
+        clamp_shadow = nodes.new("ShaderNodeClamp")
+        clamp_shadow.location = (-200, 240)
+
+        mix_AO = nodes.new("ShaderNodeMixRGB")
+        mix_AO.location = (-570, 100)
+        mix_AO.inputs[0].default_value = 0.7
+        mix_AO.blend_type = 'MULTIPLY'
+        mix_AO.mute = True
+
+        shader_RGB = nodes.new("ShaderNodeShaderToRGB")
+        shader_RGB.location = (-770, 0)
+
+        diffuse = nodes.new("ShaderNodeBsdfDiffuse")
+        diffuse.location = (-970, -100)
+        diffuse.inputs[0].default_value = (1, 1, 1, 1)
+
+        dodge_floor = nodes.new("ShaderNodeMixRGB")
+        dodge_floor.location = (-380, 60)
+        dodge_floor.inputs[0].default_value = 1
+        dodge_floor.blend_type = 'DODGE'
+
+        power = nodes.new("ShaderNodeMath")
+        power.location = (0, 180)
+        power.operation = 'POWER'
+        power.use_clamp = True
+
+        value = nodes.new("ShaderNodeMath")
+        value.name = "Shadow Value"
+        value.location = (-200, 60)
+        value.operation = 'MULTIPLY_ADD'
+        value.inputs[0].default_value = 0
+        value.inputs[1].default_value = -1
+        value.inputs[2].default_value = 1
+
+        value_dodge = nodes.new("ShaderNodeMix")
+        value_dodge.name = "Dodge Value"
+        value_dodge.location = (-570, -150)
+        value_dodge.inputs[0].default_value = 0.1
+        value_dodge.inputs[3].default_value = 1
+
+        value_clamp = nodes.new("ShaderNodeMix")
+        value_clamp.name = "Clamp Value"
+        value_clamp.location = (-380, 260)
+        value_clamp.inputs[0].default_value = 0.1
+        value_clamp.inputs[3].default_value = 1
+
+        alpha_mix = nodes.new("ShaderNodeMixShader")
+        alpha_mix.name = "Floor Alpha"
+        alpha_mix.location = (0, -160)
+
+        BG_group = nodes.new("ShaderNodeGroup")
+        BG_group.name = "Floor Group"
+        BG_group.location = (-200, -260)
+
+        # check for Fuzzy BG node group
+        BG = 'Fuzzy BG'
+        groups = bpy.data.node_groups
+        if BG not in groups:
+            alpha_mix.inputs[0].default_value = 0.0
+        else:
+            alpha_mix.inputs[0].default_value = 1.0
+            BG_group.node_tree = groups[BG]
+
+        # link nodes
+        link = mat.node_tree.links.new
+        link(mixshader.outputs[0], matoutput.inputs[0])
+        link(shadow.outputs[0], mixshader.inputs[1])
+        link(holdout.outputs[0], alpha_mix.inputs[1])
+        link(alpha_mix.outputs[0], mixshader.inputs[2])
+        link(clamp_shadow.outputs[0], power.inputs[0])
+        link(mix_AO.outputs[0], dodge_floor.inputs[1])
+        link(value.outputs[0], power.inputs[1])
+        link(power.outputs[0], mixshader.inputs[0])
+        link(shader_RGB.outputs[0], mix_AO.inputs[1])
+        link(diffuse.outputs[0], shader_RGB.inputs[0])
+        link(dodge_floor.outputs[0], clamp_shadow.inputs[0])
+        link(value_dodge.outputs[0], dodge_floor.inputs[2])
+        link(value_clamp.outputs[0], clamp_shadow.inputs[1])
+        if BG in groups:
+            link(BG_group.outputs[0], alpha_mix.inputs[2])
+        
+        # material settings
+        mat.use_backface_culling = True
+        mat.blend_method = 'BLEND'
+
+        # cycles material nodes
+        matoutput2 = nodes.new("ShaderNodeOutputMaterial")
+        matoutput2.location = (400, -80)
+        matoutput2.target = 'CYCLES'
+        link(diffuse.outputs[0], matoutput2.inputs[0])
+        # cycles material settings
+        floor.is_shadow_catcher = True
+        floor.visible_diffuse = False
+        floor.visible_glossy = False
+        floor.visible_transmission = False
+
+        # viewport & outliner settings
+        screens = bpy.data.screens
+        for scr in screens:
+            for area in scr.areas:
+                if area.type == 'VIEW_3D':
+                    area.spaces[0].overlay.show_relationship_lines = False
+                    area.spaces[0].clip_start = 0.1
+                # elif area.type == 'OUTLINER':
+                #     area.spaces[0].show_restrict_column_viewport = True
+                #     area.spaces[0].show_restrict_column_select = True
+        
+        # 4.2 or above
+        if is_next_version():
+            mix_AO.mute = False
+            mix_AO.name = "AO Factor"
+            
+            AO = nodes.new("ShaderNodeAmbientOcclusion")
+            AO.name = "AO"
+            AO.location = (-770, 230)
+            AO.inputs[1].default_value = 1.6
+            link(AO.outputs[1], mix_AO.inputs[2])
+            
+            mixshader2 = nodes.new("ShaderNodeMixShader")
+            mixshader2.location = (400, 60)
+            link(mixshader.outputs[0], mixshader2.inputs[1])
+            link(mixshader2.outputs[0], matoutput.inputs[0])
+            
+            lightpath = nodes.new("ShaderNodeLightPath")
+            lightpath.location = (200, 140)
+            for output in lightpath.outputs:
+                output.hide = True
+            link(lightpath.outputs[1], mixshader2.inputs[0])
+            
+            transp = nodes.new("ShaderNodeBsdfTransparent")
+            transp.location = (200, -80)
+            link(transp.outputs[0], mixshader2.inputs[2])
+        else:
+            mat.shadow_method = 'NONE'
+
+        switch = ensure_floor_switch(mat)
+        switch.mute = scene.fuzzy_props.floor_lean_viewport
+
+        if scene.fuzzy_props.floor_fit:
+            fit_floor(scene)
+        if scene.fuzzy_props.floor_bake_normals:
+            bake_floor_normals(scene)
+        if new:
+            stamp_new_scene(scene)
+
+        self.report({'INFO'}, f"'{floor.name}' and '{empty.name}' added to scene")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - World (Sky)
+# ------------------------------------------------------------------------
+
+class WORLD_OT_fuzzy_sky(Operator):
+    """Create a new world and replace the active one"""
+    bl_idname = "world.fuzzy_sky"
+    bl_label = "New Fuzzy Sky"
+    bl_options = {'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def execute(self, context):
+        scene = context.scene
+        new = fuzzy_scene_empty(scene)
+        # rename "Fuzzy World" if it exists
+        if "Fuzzy World" in bpy.data.worlds:
+            bpy.data.worlds['Fuzzy World'].name = 'World_old'
+        else:
+            pass
+
+        # create "Fuzzy World", make it scene world & enable Use Nodes
+        bpy.data.worlds.new("Fuzzy World")
+        scene.world = bpy.data.worlds['Fuzzy World']
+        scene.world.use_nodes = True
+
+        # build node shader
+        nodes = scene.world.node_tree.nodes
+
+        nodes.remove(nodes.get('Background'))
+
+        # HDR nodes
+        worldoutput = nodes.get("World Output")
+        worldoutput.location = (900, 50)
+        
+        # dictionary
+        ref = {}
+        # list with ref_name, name, type, locx, locy
+        node_list = [
+            ('texcoord1', "Texture Coordinate", "TexCoord", -1000, 440), # row 1
+            ('mapskytex1',"HDRI Delta Rot", "Mapping", -800, 440), # row 2
+            ('mapskytex2',"HDRI Rotation", "Mapping", -600, 440), # row 3
+            ('clamprefl', "Clamp Reflection", "Value", -600, 60),
+            ('multiply', "Multiply", "Math", -600, -40),
+            ('skytex', "World HDRI", "TexEnvironment", -400, 400), # row 4
+            ('greater', "Greater Than", "Math", -400, 160),
+            ('lightpath', "Light Path", "LightPath", -400, -40),
+            ('sepHSV', "Separate Color", "SeparateColor", -100, 400), # row 5
+            ('darken', "Darken", "MixRGB", -100, 240),
+            ('mixrefl', "Mix Reflection", "MixRGB", 100, 400), #row6
+            ('comHSV', "Combine Color", "CombineColor", 300, 400), #row7
+            ('BG1', "HDRI Strength", "Background", 500, 160), #row8
+            ('BG2', "Background", "Background", 500, -100),
+            ('mixshader',"Mix Shader", "MixShader", 700, 60), #row9
+        ]
+
+        # create nodes
+        for ref_name, name, type, locx, locy in node_list:
+            node = nodes.new("ShaderNode"+type)
+            node.location = (locx, locy)
+            node.label = name
+            node.name = name
+        
+            # Save ref_name in dictionary
+            ref[ref_name] = node
+     
+        # extra node properties    
+        ref['mapskytex1'].inputs[2].default_value[2] = radians(90)
+        ref['clamprefl'].outputs[0].default_value = 2
+        ref['multiply'].operation = 'MULTIPLY'
+        ref['multiply'].inputs[1].default_value = 10
+        ref['greater'].operation = 'GREATER_THAN'
+        ref['greater'].inputs[1].default_value = 0
+        for output in ref['lightpath'].outputs:
+            output.hide = True
+        ref['sepHSV'].mode = 'HSV'
+        ref['darken'].blend_type = 'DARKEN'
+        ref['comHSV'].mode = 'HSV'
+
+        # connect nodes
+        link = scene.world.node_tree.links.new
+        link(ref['texcoord1'].outputs[0], ref['mapskytex1'].inputs[0])
+        link(ref['mapskytex1'].outputs[0], ref['mapskytex2'].inputs[0])
+        link(ref['mapskytex2'].outputs[0], ref['skytex'].inputs[0])
+        link(ref['clamprefl'].outputs[0], ref['multiply'].inputs[0])
+        link(ref['clamprefl'].outputs[0], ref['greater'].inputs[0])
+        link(ref['multiply'].outputs[0], ref['darken'].inputs[2])
+        link(ref['skytex'].outputs[0], ref['sepHSV'].inputs[0])
+        link(ref['greater'].outputs[0], ref['mixrefl'].inputs[0])
+        link(ref['lightpath'].outputs[3], ref['darken'].inputs[0])
+        link(ref['lightpath'].outputs[0], ref['mixshader'].inputs[0])
+        for i in range(2):
+            link(ref['sepHSV'].outputs[i], ref['comHSV'].inputs[i])
+        link(ref['sepHSV'].outputs[2], ref['darken'].inputs[1])
+        link(ref['sepHSV'].outputs[2], ref['mixrefl'].inputs[1])
+        link(ref['darken'].outputs[0], ref['mixrefl'].inputs[2])
+        link(ref['mixrefl'].outputs[0], ref['comHSV'].inputs[2])
+        link(ref['comHSV'].outputs[0], ref['BG1'].inputs[0])
+        link(ref['BG1'].outputs[0], ref['mixshader'].inputs[1])
+        link(ref['BG2'].outputs[0], ref['mixshader'].inputs[2])
+        link(ref['mixshader'].outputs[0], worldoutput.inputs[0])
+
+        # load the texture from Blender data folder
+        hdri = bpy.data.images.load(
+            context.preferences.studio_lights['sunset.exr'].path, check_existing=True)
+        ref['skytex'].image = hdri
+
+        # check for Fuzzy BG node group and remove
+        BG = 'Fuzzy BG'
+        groups = bpy.data.node_groups
+        if BG in groups:
+            groups.remove(groups[BG])
+
+        # create Fuzzy BG node group
+        BG_group = groups.new(BG, 'ShaderNodeTree')
+        if bpy.app.version_string.startswith('3'):
+            BG_group.outputs.new('NodeSocketColor', "Color")
+        else:
+            BG_group.interface.new_socket("Color", in_out='OUTPUT',
+                                          socket_type='NodeSocketColor')
+
+        # create empty group node and apply Fuzzy BG
+        group = nodes.new("ShaderNodeGroup")
+        group.location = (300, -100)
+        group.name = "BG Group"
+        group.node_tree = BG_group
+        
+        # BG group nodes
+        nodes = BG_group.nodes
+        
+        # dictionary
+        ref = {}
+        # list with ref_name, name, type, locx, locy
+        node_list = [
+            ('texcoord2', "Tex Coord", "TexCoord", -1860, -100), # row 1
+            ('gradscale', "Scale Gradient", "Mix", -1860, -500),
+            ('radialloc', "Radial Location", "VectorMath", -1650, 220), # row 2
+            ('radialscale', "Radial Scale", "VectorMath", -1650, -40),
+            ('vectrans', "", "VectorTransform", -1650, -300),
+            ('power', "", "Math", -1650, -480),
+            ('mapsphere', "", "Mapping", -1450, 50), # row 3
+            ('divide', "", "MixRGB", -1450, -350),
+            ('maplinear3d', "", "Mapping", -1250, -400), # row 4
+            ('maplinear', "", "Mapping", -1250, -30),
+            ('gradsphere', "", "TexGradient", -1050, -80), #row5
+            ('window3d', "Window to 3D", "MixRGB", -1050, -240),
+            ('invert', "", "Invert", -880, -80), #row6
+            ('gradlinear', "Gradient Linear", "TexGradient", -880, -240),
+            ('rampradial', "Radial Ease", "ValToRGB", -700, 20), #row7
+            ('ramplinear', "Linear Ease", "ValToRGB", -700, -200),
+            ('col1', "BG Color 1", "RGB", -680, -440),
+            ('col2', "BG Color 2", "RGB", -680, -640),
+            ('linear2ease', "Linear Ease", "Mix", -420, -200), #row8
+            ('swapcol1', "Swap Colors 1", "MixRGB", -420, -440),
+            ('swapcol2', "Swap Colors 2", "MixRGB", -420, -640),
+            ('radial2linear', "Radial to Linear", "MixRGB", -220, -80), #row9
+            ('colgradient', "Color Gradient", "MixRGB",-40, -300), #row10
+            ('flat2gradient', "Flat to Gradient", "MixRGB", 140, -100), #row11   
+        ]
+         
+        # create nodes
+        for ref_name, name, type, locx, locy in node_list:
+            node = nodes.new("ShaderNode"+type)
+            node.location = (locx, locy)
+            node.label = name
+            node.name = name
+            
+            # Save ref_name in dictionary
+            ref[ref_name] = node
+     
+        # extra node properties    
+        ref['radialloc'].inputs[1].default_value = (0.5, 0.5, 0)
+        ref['radialscale'].operation = 'MULTIPLY'
+        ref['radialscale'].inputs[0].default_value = (1, 1, 0)
+        ref['radialscale'].inputs[1].default_value = (0.71, 0.71, 1)
+        ref['divide'].blend_type = 'DIVIDE'
+        ref['divide'].inputs[0].default_value = 1
+        ref['gradscale'].inputs[2].default_value = 0.001
+        ref['gradscale'].inputs[3].default_value = 1
+        ref['gradsphere'].gradient_type = 'SPHERICAL'
+        ref['maplinear'].inputs[2].default_value[2] = 1.5708
+        ref['maplinear'].vector_type = 'TEXTURE'
+        ref['maplinear3d'].inputs[1].default_value[2] = -0.5
+        ref['maplinear3d'].inputs[2].default_value[1] = -1.5708
+        ref['maplinear3d'].vector_type = 'TEXTURE'
+        ref['mapsphere'].vector_type = 'TEXTURE'
+        ref['power'].inputs[1].default_value = 2
+        ref['power'].operation = 'POWER'
+        ref['ramplinear'].color_ramp.interpolation = "EASE"
+        ref['rampradial'].color_ramp.interpolation = "EASE"
+        ref['col1'].outputs[0].default_value = (0.09, 0.17, 1, 1)
+        ref['col2'].outputs[0].default_value = (0.02, 0.05, 0.40, 1)
+        ref['vectrans'].convert_from = 'CAMERA'
+        ref['vectrans'].convert_to = 'WORLD'
+        ref['vectrans'].vector_type = 'NORMAL'
+
+        # output node
+        output = nodes.new("NodeGroupOutput")
+        output.location = (340, -100)
+
+        switches = [
+            ("Color Swap", -880, -600, True),
+            ("Flat Gradient", -40, -100, True),
+            ("Radial Linear", -420, -40, False),
+            ("Window Global", -1450, -560, False),
+        ]
+        
+        for name, locx, locy, clamp in switches:
+            switch = nodes.new("ShaderNodeMix")
+            switch.location = (locx, locy)
+            switch.name = name
+            switch.label = name
+            switch.clamp_factor = clamp
+            switch.inputs[0].default_value = -1
+            switch.inputs[2].default_value = 1
+            switch.inputs[3].default_value = 2
+            for input in switch.inputs:
+                input.hide = True
+            
+        # connect nodes
+        link(group.outputs[0], scene.world.node_tree.nodes['Background'].inputs[0])
+        # connect group nodes
+        link = BG_group.links.new
+        node_links = {
+            'radialloc': [('mapsphere', 1)],
+            'radialscale': [('mapsphere', 3)],
+            'colgradient': [('flat2gradient', 2)],
+            'divide': [('maplinear3d', 0)],
+            'gradlinear': [('ramplinear', 0), ('linear2ease', 2)],
+            'gradsphere': [('invert', 1)],
+            'gradscale': [('power', 0)],
+            'invert': [('rampradial', 0)],
+            'linear2ease': [('radial2linear', 2)],
+            'maplinear': [('window3d', 1)],
+            'maplinear3d': [('window3d', 2)],
+            'mapsphere': [('gradsphere', 0)],
+            'power': [('divide', 2)],
+            'radial2linear': [('colgradient', 0)],
+            'ramplinear': [('linear2ease', 3)],
+            'rampradial': [('radial2linear', 1)],
+            'col1': [('swapcol1', 2), ('swapcol2', 1)],
+            'col2': [('swapcol1', 1), ('swapcol2', 2)],
+            'swapcol1': [('colgradient', 1), ('flat2gradient', 1)],
+            'swapcol2': [('colgradient', 2)],
+            'vectrans': [('divide', 1)],
+            'window3d': [('gradlinear', 0)],
+        }
+        
+        for name, targets in node_links.items():
+            for target, input_index in targets:
+                link(ref[name].outputs[0], ref[target].inputs[input_index])
+       
+        # remaining links
+        link(ref['flat2gradient'].outputs[0], output.inputs[0])
+        link(ref['texcoord2'].outputs[4], ref['vectrans'].inputs[0])
+        link(ref['texcoord2'].outputs[5], ref['mapsphere'].inputs[0])
+        link(ref['texcoord2'].outputs[5], ref['maplinear'].inputs[0])
+
+        switch_links = {
+            'Color Swap': ['swapcol1', 'swapcol2'],
+            'Flat Gradient': ['flat2gradient'],
+            'Radial Linear': ['radial2linear'],
+            'Window Global': ['linear2ease', 'window3d'],
+        }
+        for name, targets in switch_links.items():
+            for target in targets:
+                link(nodes[name].outputs[0], ref[target].inputs[0])
+        
+        # check for FuzzyFloor and set Fuzzy BG node group
+        obj = bpy.data.objects
+        if 'FuzzyFloor' in obj:
+            tree = bpy.data.materials['floor_shadow'].node_tree
+            floor_group = tree.nodes['Floor Group']
+            floor_alpha = tree.nodes['Floor Alpha']
+            floor_group.node_tree = BG_group
+            tree.links.new(floor_group.outputs[0], floor_alpha.inputs[2])
+            floor_alpha.inputs[0].default_value = 1.0
+        if new:
+            stamp_new_scene(scene)
+            
+        self.report({'INFO'}, "World 'Fuzzy World' created")
+        return {'FINISHED'}
+
+
+classes = [
+    MESH_OT_fuzzy_floor,
+    WORLD_OT_fuzzy_sky,
+]
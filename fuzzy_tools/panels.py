@@ -0,0 +1,750 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+from bpy.types import Panel
+
+from .common import is_next_version, profile_report, profile_state, profile_stats, register_timings
+from .settings import RENDER_PROFILE_ITEMS
+from .markers import get_shots, rule_markers
+from .diagnostics import TRACE_BUCKETS, frame_trace, frame_trace_duplicates, frame_trace_report
+from .render import farm_state
+from .render_log import read_render_log, render_log_path
+
+
+# ------------------------------------------------------------------------
+#    PANELS - Scene Builder
+# ------------------------------------------------------------------------
+
+class BuildScenePanel(Panel):
+    bl_label = "Scene Builder"
+    bl_idname = "VIEW3D_PT_build_scene"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Fuzzy'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_order = 0
+    
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT'
+
+    def draw(self, context):
+        pass
+
+
+class BuildSceneChild:
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = "VIEW3D_PT_build_scene"
+
+
+class BuildAllPanel(BuildSceneChild, Panel):
+    bl_label = "Build All"
+    bl_idname = "VIEW3D_PT_build_all"
+
+    def draw(self, context):
+        layout = self.layout
+
+        row = layout.row()
+        row.scale_y = 2
+        row.operator("scene.build_all", text='POP!', icon='SHADERFX')
+
+
+class BuildPartsPanel(BuildSceneChild, Panel):
+    bl_label = "Build in Parts"
+    bl_idname = "VIEW3D_PT_build_parts"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+
+        row = layout.row(align=True)
+        row.scale_y = 1.2
+        row.operator("object.fuzzy_camera", text='Camera', icon='CAMERA_DATA')
+        row.operator("mesh.fuzzy_floor", text="Floor", icon='GRID')
+
+        col = layout.column(align=True)
+        col.scale_y = 1.2
+        row = col.row(align=True)
+        row.operator("world.fuzzy_sky", text="Sky", icon='MAT_SPHERE_SKY')
+        row.operator("object.fuzzy_sun", text="Sun", icon='LIGHT_SUN')
+        col.operator("object.fuzzy_rimlight", text="Rim Light", icon='LIGHT')
+        row = col.row(align=True)
+        row.operator("scene.fuzzy_eevee", text="Optimize EEVEE", icon='CAMERA_STEREO')
+        row.operator("scene.fuzzy_cycles", text="Cycles", icon='SHADING_RENDERED')
+
+        current = context.scene.fuzzy_props.render_profile
+        row = layout.row(align=True)
+        for profile, name, _ in RENDER_PROFILE_ITEMS:
+            row.operator("scene.fuzzy_render_profile", text=name,
+                         depress=(profile == current)).profile = profile
+
+        row = layout.row(align=True)
+        row.prop(context.scene.fuzzy_props, 'frame_budget')
+        row.operator("scene.fuzzy_calibrate", text="Calibrate", icon='TIME')
+
+
+class BackgroundPanel(BuildSceneChild, Panel):
+    bl_label = "Background"
+    bl_idname = "VIEW3D_PT_background"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        scene = context.scene.world
+        if scene is not None:
+            return scene.name == "Fuzzy World"
+
+    def draw(self, context):
+        scene = context.scene
+        fuzzyprops = scene.fuzzy_props
+        group_node = scene.world.node_tree.nodes
+        node = group_node['BG Group'].node_tree.nodes
+
+        layout = self.layout
+        col = layout.column()
+        col.use_property_split = True
+        col.use_property_decorate = False
+        row = col.row(align=True)
+        row.prop(fuzzyprops, "fuzzy_color1", text='Palette')
+        row.prop(fuzzyprops, "fuzzy_color2", text='')
+        row.separator()
+        row.label(icon='BLANK1')
+        row = col.row(align=True)
+        swap = node.get('Color Swap')
+        if swap:
+            row.prop(node['BG Color 1' if swap.clamp_factor else 'BG Color 2'].outputs[0], 'default_value', text='Sky Colors')
+            row.prop(node['BG Color 2' if swap.clamp_factor else 'BG Color 1'].outputs[0], 'default_value', text='')
+            row.separator()
+            row.prop(swap, 'clamp_factor', icon='FILE_REFRESH', icon_only=True, emboss=False)
+        
+        flat_grad = node.get('Flat Gradient')
+        rad_lin = node.get('Radial Linear')
+        win_glob = node.get('Window Global')
+        if flat_grad and rad_lin and win_glob:
+            col = layout.column(align=True)
+            col.prop(flat_grad, 'clamp_factor', text='Gradient')
+            
+            col = col.column(align=True)
+            col.enabled = flat_grad.clamp_factor
+            row = col.row(align=True)
+            row.prop(rad_lin, 'clamp_factor', text='Radial', toggle=1, invert_checkbox=True)
+            row.prop(rad_lin, 'clamp_factor', text='Linear', toggle=1)
+            row = row.row(align=True)
+            row.enabled = rad_lin.clamp_factor
+            row.prop(win_glob, 'clamp_factor', text='', icon='WORLD')
+
+            col = col.column(align=True)
+            if rad_lin.clamp_factor and win_glob.clamp_factor:
+                scale_grad = node.get('Scale Gradient')
+                if scale_grad:
+                    col.separator(factor=0.5)
+                    col.prop(scale_grad.inputs[0], "default_value", text='Scale from Horizon')
+            elif not rad_lin.clamp_factor:
+                col.separator(factor=0.5)
+                col.use_property_split = True
+                col.use_property_decorate = False
+                
+                rad_loc = node.get('Radial Location')
+                if rad_loc:
+                    row = col.row(align=True)
+                    row.prop(rad_loc.inputs[0], "default_value", text="Loc XY", index=0)
+                    row.prop(rad_loc.inputs[0], "default_value", text="", index=1)
+                
+                rad_scale = node.get('Radial Scale')
+                if rad_scale:
+                    row = col.row(align=True)
+                    row.prop(rad_scale.inputs[0], "default_value", text="Scale XY", index=0)
+                    row.prop(rad_scale.inputs[0], "default_value", text="", index=1)
+        
+        layout.prop(scene.render, "film_transparent")
+        if scene.render.film_transparent:
+            row = layout.row(align=True)
+            row.operator('render.fuzzy_auto_border', icon='SELECT_SET')
+            row.operator('render.fuzzy_auto_border', text="", icon='X').clear = True
+        
+
+class HDRIPanel(BuildSceneChild, Panel):
+    bl_label = "Lighting"
+    bl_idname = "VIEW3D_PT_hdri"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        scene = context.scene.world
+        if scene is not None:
+            return scene.name == "Fuzzy World"
+
+    def draw(self, context):
+        scene = context.scene
+        objs = scene.objects
+        nodes = scene.world.node_tree.nodes
+
+        layout = self.layout
+        col = layout.column()
+        col.label(text="Light Parent", icon='LIGHT')
+        row = col.row(align=True)
+        row.scale_y = 1.2
+        parent = objs.get('LightParent')
+        if not parent:
+            row.operator('object.light_parent', text="Create", icon='SPHERE')
+        else:
+            row.operator('object.rotate_lighting', text="Rotate", icon='CON_ROTLIMIT').parent = True
+            row.separator(factor=0.5)
+            row.prop(parent, 'hide_viewport', text='', emboss=False)
+        
+        col = layout.column(align=True)
+        col.use_property_split = True
+        col.use_property_decorate = False
+        col.label(text="HDRI", icon='IMAGE_DATA')
+        HDRI_node = nodes.get("World HDRI")
+        if HDRI_node:
+            col.template_ID(HDRI_node, 'image', open='image.open', live_icon=True)
+            row = col.row(align=True)
+            row.template_icon_view(scene.fuzzy_props, 'hdri_browser', show_labels=True,
+                                   scale=5, scale_popup=5)
+            row.operator('world.hdri_refresh', text="", icon='FILE_REFRESH')
+            col.separator()
+
+        hdri_rot = nodes.get("HDRI Rotation")
+        hdri_delta_rot = nodes.get("HDRI Delta Rot")
+        hdri_str = nodes.get("HDRI Strength")
+        if hdri_rot:
+            row = col.row(align=True)
+            row.prop(hdri_rot.inputs[2], 'default_value', index=2, text='Rotation')
+            if hdri_delta_rot:
+                row.operator('object.rotate_lighting', text="", icon='CON_ROTLIMIT').hdri = True
+        if hdri_str:
+            col.prop(hdri_str.inputs[1], 'default_value', index=-1, text='Strength')
+
+        clamp_node = nodes.get("Clamp Reflection")
+        if clamp_node:
+            col.separator()
+            if context.engine == 'BLENDER_EEVEE_NEXT':
+                text = "Clamp"
+            else:
+                text = "Clamp Glossy"
+            col.prop(clamp_node.outputs[0], 'default_value', text=text)
+                
+
+class FloorPanel(BuildSceneChild, Panel):
+    bl_label = "Fuzzy Floor"
+    bl_idname = "VIEW3D_PT_floor"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        scene = context.scene
+        objects = scene.objects
+        engines = ['BLENDER_EEVEE', 'BLENDER_EEVEE_NEXT']
+        return 'FuzzyFloor' in objects and context.engine in engines
+
+    def draw(self, context):
+        scene = context.scene
+        layout = self.layout
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        floor = bpy.data.objects.get('FuzzyFloor')
+        if floor:
+            mod = floor.modifiers.get('NormalDirection')
+            mat = bpy.data.materials.get('floor_shadow')
+            if mat and mat.node_tree:
+                nodes = mat.node_tree.nodes
+                val = 'default_value'
+
+                # Check Blender version 4.2 or above
+                if is_next_version():
+                    col = layout.column(align=True)
+                    ao_node = nodes.get('AO')
+                    ao_factor_node = nodes.get('AO Factor')
+                    if ao_node:
+                        col.prop(ao_node.inputs[1], val, text="AO Distance")
+                    if ao_factor_node:
+                        col.prop(ao_factor_node.inputs[0], val, text="AO Factor")
+                    col.prop(mat, 'surface_render_method', text="Method")
+                    if mat.surface_render_method == 'DITHERED':
+                        col.prop(mat, 'use_raytrace_refraction')
+
+                clamp_node = nodes.get('Clamp Value')
+                dodge_node = nodes.get('Dodge Value')
+                shadow_node = nodes.get('Shadow Value')
+                col = layout.column(align=True)
+
+                if clamp_node:
+                    col.prop(clamp_node.inputs[0], val, text="Clamp Dark")
+                if dodge_node:
+                    col.prop(dodge_node.inputs[0], val, text="Dodge Bright")
+                if shadow_node:
+                    layout.prop(shadow_node.inputs[0], val, text="Value Fix")
+
+                if nodes.get('Floor Alpha'):
+                    layout.prop(scene.fuzzy_props, 'floor_lean_viewport')
+
+                fuzzy_bg = bpy.data.node_groups.get('Fuzzy BG')
+                if fuzzy_bg:
+                    col = layout.column(heading="Floor")
+                    floor_alpha_node = nodes.get('Floor Alpha')
+                    if floor_alpha_node:
+                        col.prop(floor_alpha_node, 'mute', text="Holdout")
+
+            fuzzyprops = scene.fuzzy_props
+            col = layout.column(heading="Fit")
+            row = col.row(align=True)
+            row.prop(fuzzyprops, 'floor_fit', text="Cameras")
+            row.operator('mesh.fit_floor', text="", icon='FULLSCREEN_ENTER')
+            if fuzzyprops.floor_fit:
+                col.prop(fuzzyprops, 'floor_fit_cameras', text="")
+                col.prop(fuzzyprops, 'floor_fit_margin')
+                col.prop(fuzzyprops, 'floor_fit_distance')
+
+            if mod:
+                split = layout.split(factor=0.4)
+                split.alignment = 'RIGHT'
+                split.label(text='Normal Edit')
+                row = split.row(align=True)
+                row.scale_x = 1.3
+                sub = row.row(align=True)
+                sub.enabled = not fuzzyprops.floor_bake_normals
+                sub.prop(mod, 'show_viewport', text="")
+                sub.prop(mod, 'show_render', text="")
+                row.prop(fuzzyprops, 'floor_bake_normals', text="Bake", toggle=True)
+
+
+# ------------------------------------------------------------------------
+#    PANELS - Fuzzy View
+# ------------------------------------------------------------------------
+
+class VIEW3D_PT_viewport(Panel):
+    bl_label = "Fuzzy View"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Fuzzy'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_order = 2
+
+    def draw_header_preset(self, context):
+        layout = self.layout
+        layout.scale_x = 0.92
+        layout.prop(context.space_data, "lens", text="")
+
+    def draw(self, context):
+        pass
+
+
+class ViewportChild:
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = 'VIEW3D_PT_viewport'
+
+ 
+class VIEW3D_PT_simplify(ViewportChild, Panel):
+    bl_label = "Simplify"
+
+    def draw_header(self, context):
+        rd = context.scene.render
+        self.layout.prop(rd, "use_simplify", text="")
+
+    def draw(self, context):
+        layout = self.layout
+        rd = context.scene.render
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+
+        layout.active = rd.use_simplify
+
+        flow = layout.grid_flow()
+
+        col = flow.column()
+        col.prop(rd, "simplify_subdivision", text="Subdivision")
+
+        col = flow.column()
+        col.prop(rd, "simplify_child_particles", text="Hair")
+
+        
+class VIEW3D_PT_hair(ViewportChild, Panel):
+    bl_label = "Hair"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+        rd = scene.render
+        
+        row = layout.row(align=True)
+        row.use_property_split = True
+        row.use_property_decorate = False
+        row.prop(rd, "hair_type", text = "Type", expand=True)
+
+        col = layout.column(align=True)
+        row = col.row(align=True)
+        row.label(text="Visibility")
+        row = col.row(align=True)
+        row.operator("object.hair_viewport", text="Show All", icon='HIDE_OFF').hide = False
+        row.operator("object.hair_viewport", text="Hide All", icon='HIDE_ON').hide = True
+        
+
+class VIEW3D_PT_profile(ViewportChild, Panel):
+    bl_label = "Profiling"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return profile_state['enabled']
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator('wm.fuzzy_profile_save', icon='EXPORT')
+        row.operator('wm.fuzzy_profile_reset', text="", icon='LOOP_BACK')
+        if register_timings:
+            layout.label(text=f"Register: {register_timings['total'] * 1000:.1f} ms")
+
+        if not profile_stats:
+            layout.label(text="No calls yet", icon='INFO')
+            return
+        col = layout.column(align=True)
+        for name, stats in list(profile_report().items())[:15]:
+            split = col.split(factor=0.55, align=True)
+            split.label(text=name)
+            split.label(text=f"{stats['calls']}x {stats['mean_ms']:.2f} ms, max {stats['max_ms']:.1f}")
+
+
+class VIEW3D_PT_frame_trace(ViewportChild, Panel):
+    bl_label = "Frame Change Handlers"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        if frame_trace['enabled']:
+            layout.operator('wm.fuzzy_frame_trace', text="Stop Tracing", icon='PAUSE')
+        else:
+            layout.operator('wm.fuzzy_frame_trace', text="Trace Handlers", icon='TIME')
+
+        for (list_name, name), count in frame_trace_duplicates.items():
+            layout.label(text=f"{name.rsplit('.', 1)[-1]} {count}x in {list_name}", icon='ERROR')
+
+        report = frame_trace_report()
+        if not report:
+            if frame_trace['enabled']:
+                layout.label(text="Change frames to measure", icon='INFO')
+            return
+        bounds = [f"<{b:g}" for b in TRACE_BUCKETS] + [f">{TRACE_BUCKETS[-1]:g}"]
+        col = layout.column(align=True)
+        for (list_name, name), stats in report.items():
+            box = col.box().column(align=True)
+            when = 'pre' if list_name.endswith('pre') else 'post'
+            box.label(text=f"{name.rsplit('.', 1)[-1]} ({when})",
+                      icon='ERROR' if stats['duplicates'] > 1 else 'NONE')
+            box.label(text=f"{stats['mean_ms']:.2f} ms mean, {stats['max_ms']:.1f} max, "
+                           f"{stats['frames']} frames")
+            hist = "  ".join(f"{b}:{n}" for b, n in zip(bounds, stats['histogram']) if n)
+            box.label(text=f"ms {hist}")
+
+
+class VIEW3D_PT_miscellaneous(ViewportChild, Panel):
+    bl_label = "Viewport Display"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        space = context.space_data
+        overlay = space.overlay
+        shade = space.shading
+        object = context.object
+        
+        layout = self.layout
+        split = layout.split(factor=0.25)
+        split.alignment = 'RIGHT'
+        split.label(text='Local')
+        col = split.column(align=True)
+        col.prop(overlay, "show_relationship_lines")
+        col.prop(shade, "show_backface_culling")
+        if object is not None:
+            split = layout.split(factor=0.25)
+            split.alignment = 'RIGHT'
+            split.label(text='Object')
+            split.prop(object, "show_in_front", text="Show in Front")
+
+
+# ------------------------------------------------------------------------
+#    PANELS - Camera Control
+# ------------------------------------------------------------------------
+
+class VIEW3D_PT_cameras(Panel):
+    bl_label = " Camera Control"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Fuzzy'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_order = 3
+
+    def draw_header_preset(self, context):
+        layout = self.layout
+        if context.space_data.lock_camera:
+            icon = 'LOCKED'
+        else:
+            icon = 'UNLOCKED'
+        row = layout.row(align=True)
+        if context.space_data.lock_camera == True:
+            row.alert = True
+        row.prop(context.space_data, 'lock_camera', text='', icon=icon, emboss=False)
+        
+        colls = bpy.data.collections
+        cam_coll = colls.get('Cameras')
+        if cam_coll:
+            row.separator(factor=0.5)
+            row.alert = False
+            row.prop(cam_coll, 'hide_viewport', text="", icon='RESTRICT_VIEW_OFF', emboss=False)
+            
+    def draw(self, context):
+        pass
+
+
+class VIEW3D_PT_camera_scene(Panel):
+    bl_label = "Scene"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = 'VIEW3D_PT_cameras'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw_header_preset(self, context):
+        layout = self.layout
+        scene = context.scene
+        active_obj = context.view_layer.objects.active
+           
+        if scene.camera and active_obj != scene.camera and context.mode == 'OBJECT':
+            if scene.camera.name not in context.view_layer.objects:
+                layout.enabled = False
+            layout.operator("object.select_camera", text="", 
+                                icon='RESTRICT_SELECT_OFF', emboss=False)
+        
+    def draw(self, context):
+        scene = context.scene
+        layout = self.layout
+
+        if context.mode == 'OBJECT':
+            col = layout.column()
+            col.scale_y = 1.2
+            col.operator("object.fuzzy_camera", text="Build", icon='CAMERA_DATA')
+
+        # subpanel for blender 4.1 or higher, else box
+        bl_version = bpy.app.version
+        if bl_version >= (4, 1, 0):
+            header, panel = layout.panel("VIEW3D_PT_camera_scene", default_closed=True)
+            row = header.row(align=True)
+            sub = panel
+        else:
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text='Active:')
+            row = col.row(align=True)
+            sub = box
+
+        row.prop(scene, "camera", text="", icon='CAMERA_DATA')
+        row.operator('view3d.view_camera', text='', icon='VIEWZOOM')
+        row.operator('view3d.camera_to_view', text='', icon='DECORATE_OVERRIDE')
+
+        if sub and scene.camera is not None:
+            container = panel if bl_version >= (4, 1, 0) else box
+            col = container.column(align=True)
+            # camera properties
+            cam = scene.camera.data
+            row = col.row(align=True)
+            row.prop(cam, 'lens')
+            row = col.row(align=True)
+            row.prop(cam, 'clip_start', text="Start")
+            row.prop(cam, 'clip_end', text="End")
+            col.separator()
+            row = col.row(align=True)
+            row.prop(cam, 'passepartout_alpha', text="Passepartout")
+            row.operator('object.copy_passepartout', text='', icon='DUPLICATE')
+
+        # Motion Blur - check render engine & blender version
+        if context.engine == 'BLENDER_EEVEE' and bpy.app.version < (5, 0, 0):
+            version = scene.eevee
+        else:
+            version = scene.render
+
+        col = layout.column(align=True, heading="Motion Blur")
+        col.use_property_split = True
+        col.use_property_decorate = False
+        col.prop(version, 'use_motion_blur', text="")
+        col.prop(version, 'motion_blur_shutter')
+
+        # Motion Blur Markers
+        col.separator(factor=0.5)
+        split = col.split(factor=0.4)
+        split.scale_y = 1.2
+        row = split.row()
+        row.scale_x = 1.1
+        row.alignment = 'RIGHT'
+        row.label(text="Marker")
+        # check for 'mblur' and other rule markers
+        if rule_markers(scene):
+            fuzzyprops = scene.fuzzy_props
+            row.prop(fuzzyprops, 'scene_animate', text="", icon='ACTION')
+        row = split.row(align=True)
+        row.operator('marker.add_motionblur_marker', text="On", icon='KEYFRAME_HLT').blur = 'on'
+        row.operator('marker.add_motionblur_marker', text="Off", icon='KEYFRAME').blur = 'off'
+        row.operator('marker.shutter_to_markers', text='', icon='MARKER_HLT')
+        row.operator('marker.motionblur_from_motion', text='', icon='AUTO')
+
+        layout.operator_menu_enum('render.fuzzy_cameras', 'cameras', icon='RENDER_ANIMATION')
+        
+        
+class VIEW3D_PT_render_farm(Panel):
+    bl_label = "Render Shots"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = 'VIEW3D_PT_cameras'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        scene = context.scene
+        fuzzyprops = scene.fuzzy_props
+        layout = self.layout
+
+        shots = get_shots(scene)
+        layout.label(text=f"{len(shots)} shots from camera markers", icon='MARKER_HLT')
+
+        col = layout.column(align=True)
+        col.use_property_split = True
+        col.use_property_decorate = False
+        col.prop(fuzzyprops, 'farm_workers')
+        col.prop(fuzzyprops, 'farm_chunk')
+        row = col.row(align=True)
+        row.prop(fuzzyprops, 'farm_static_reuse')
+        row.operator('render.fuzzy_static_frames', text="", icon='FILE_TICK')
+        row = col.row(align=True)
+        row.prop(fuzzyprops, 'farm_incremental')
+        row.operator('render.fuzzy_incremental', text="", icon='RENDER_STILL')
+        row = col.row(align=True)
+        row.prop(fuzzyprops, 'farm_plates')
+        row.operator('render.fuzzy_plates', text="", icon='IMAGE_BACKGROUND')
+
+        row = layout.row(align=True)
+        row.operator('render.fuzzy_cull_shots', icon='HIDE_ON')
+        row.operator('render.fuzzy_cull_shots', text="", icon='X').clear = True
+
+        row = layout.row(align=True)
+        row.scale_y = 1.2
+        if farm_state['running']:
+            row.label(text=f"Chunks {farm_state['done']}/{farm_state['jobs']}, "
+                      f"frames {farm_state['frames']}/{farm_state['total_frames']}")
+            row.operator('render.fuzzy_farm_cancel', text="", icon='CANCEL')
+        else:
+            row.operator('render.fuzzy_farm', icon='RENDER_ANIMATION')
+            if farm_state['jobs']:
+                col = layout.column(align=True)
+                col.label(text=f"Last: {farm_state['frames']}/{farm_state['total_frames']} frames")
+                if farm_state['failed']:
+                    col.label(text=f"{farm_state['failed']} chunks failed", icon='ERROR')
+
+
+class VIEW3D_PT_render_log(Panel):
+    bl_label = "Render Log"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = 'VIEW3D_PT_cameras'
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        scene = context.scene
+        layout = self.layout
+
+        summary = read_render_log(render_log_path(scene, 'csv'))
+        if not summary or not summary['frames']:
+            layout.label(text="Render to log frame times", icon='INFO')
+            return
+
+        row = layout.row()
+        row.label(text=f"{len(summary['frames'])} frames, {summary['seconds'] / 60:.1f} min",
+                  icon='TIME')
+        row.operator('render.fuzzy_render_log_clear', text="", icon='TRASH')
+
+        # most expensive first
+        for title, key in (("Shots", 'shots'), ("Cameras", 'cameras')):
+            col = layout.column(align=True)
+            col.label(text=title)
+            for name, group in list(summary[key].items())[:8]:
+                split = col.split(factor=0.4, align=True)
+                split.label(text=name or "-")
+                peak = f", {group['peak_mb']:.0f} MB" if group['peak_mb'] else ""
+                split.label(text=f"{group['per_frame']:.1f} s/fr, "
+                                 f"{group['seconds'] / 60:.1f} min{peak}")
+
+
+class VIEW3D_PT_camera_selected(Panel):
+    bl_label = ""
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = 'VIEW3D_PT_cameras'
+    bl_context = 'objectmode'
+    bl_options = {'DEFAULT_CLOSED'}
+    
+    @classmethod
+    def poll(cls, context):
+        return context.view_layer.objects.active is not None and context.object.type == 'CAMERA'
+
+    def draw_header(self, context):
+        active_obj = context.view_layer.objects.active
+        if active_obj and active_obj != context.scene.camera:
+            self.layout.operator('view3d.set_active_camera', text=active_obj.name, icon="CAMERA_DATA")
+        else:
+            self.layout.prop(active_obj, "name", text='', emboss=False, icon="VIEW_CAMERA")
+    
+    def draw(self, context):
+        layout = self.layout
+        object = context.object   
+        layout.use_property_split = True
+        layout.use_property_decorate = False
+        
+        row = layout.row(align=True)
+        row.scale_y = 1.2
+        row.operator('marker.camera_bind_new', text="Bind to Marker", icon='KEYFRAME_HLT')
+        row.separator(factor=0.5)
+        row.scale_x = 1.2
+        row.operator('object.rename_camera_alphabet', text='', icon='SORTALPHA') 
+        
+        layout.prop(object.data, "lens")
+        
+        col = layout.column(heading="Show", align=True)        
+        col.prop(object, "show_name", text="Name")
+        col.prop(object.data, "show_limits", text="Limits")
+        
+        col = layout.column(align=True)
+        col.prop(object.data, "clip_start", text="Clip Start")
+        col.prop(object.data, "clip_end", text="End")
+        
+        col = layout.column(heading="DoF")
+        col.prop(object.data.dof, "use_dof", text="")
+        if object.data.dof.use_dof:
+            col.prop(object.data.dof, "focus_object", text="Object")
+            row = col.row()
+            if object.data.dof.focus_object is not None:
+                row.enabled = False
+            row.prop(object.data.dof, "focus_distance", text="Distance")
+            row.operator('ui.eyedropper_depth', icon='EYEDROPPER', text="")
+            col.prop(object.data.dof, "aperture_fstop")
+
+
+classes = [
+    BuildScenePanel,
+    BuildAllPanel,
+    BuildPartsPanel,
+    BackgroundPanel,
+    FloorPanel,
+    HDRIPanel,
+    VIEW3D_PT_viewport,
+    VIEW3D_PT_simplify,
+    VIEW3D_PT_hair,
+    VIEW3D_PT_miscellaneous,
+    VIEW3D_PT_profile,
+    VIEW3D_PT_frame_trace,
+    VIEW3D_PT_cameras,
+    VIEW3D_PT_camera_scene,
+    VIEW3D_PT_render_farm,
+    VIEW3D_PT_render_log,
+    VIEW3D_PT_camera_selected,
+]
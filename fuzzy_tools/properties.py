@@ -0,0 +1,201 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+
+from bpy.props import (BoolProperty,
+                       FloatProperty,
+                       IntProperty,
+                       FloatVectorProperty,
+                       EnumProperty,
+                       StringProperty,
+                       )
+from bpy.types import PropertyGroup, AddonPreferences
+
+from .common import PROFILE_ENV, profile_state
+from .settings import RENDER_PROFILE_ITEMS
+from .markers import check_scene
+from .hdri import hdri_browser_items, load_hdri
+from .floor import update_floor_bake, update_floor_fit, update_floor_lean
+
+
+# ------------------------------------------------------------------------
+#    SCENE PROPERTIES
+# ------------------------------------------------------------------------
+
+class FuzzyProperties(PropertyGroup):
+
+    scene_animate: BoolProperty(
+        name='Update Marker Settings',
+        description="""Update motion blur and other render settings of markers in viewport.
+Enables automatically during rendering""",
+        default=False,
+        update=check_scene
+    )
+
+    fuzzy_color1: FloatVectorProperty(
+        name="Palette Color 1",
+        subtype='COLOR',
+        default=(0.09, 0.17, 1.0),
+        min=0.0, max=1.0,
+    )
+
+    fuzzy_color2: FloatVectorProperty(
+        name="Palette Color 2",
+        subtype='COLOR',
+        default=(0.02, 0.05, 0.40),
+        min=0.0, max=1.0,
+    )
+
+    data_version: IntProperty(
+        name="Fuzzy Data Version",
+        description="Version of Fuzzy Tools data in this file, used to skip migrations on load",
+        default=0,
+        options={'HIDDEN'},
+    )
+
+    floor_fit: BoolProperty(
+        name="Fit to Cameras",
+        description="Size and place the floor to what the cameras see, and fit again when they move",
+        default=False,
+        update=update_floor_fit,
+    )
+
+    floor_fit_cameras: EnumProperty(
+        name="Cameras",
+        description="Cameras to fit the floor to",
+        items=[
+            ('ALL', "All Cameras", "All cameras with 'CAM.' prefix"),
+            ('ACTIVE', "Active Camera", "Active camera of the current shot"),
+        ],
+        default='ALL',
+        update=update_floor_fit,
+    )
+
+    floor_fit_margin: FloatProperty(
+        name="Margin",
+        description="Extra floor around the camera footprints",
+        default=2.0,
+        min=0.0,
+        subtype='DISTANCE',
+        unit='LENGTH',
+        update=update_floor_fit,
+    )
+
+    floor_fit_distance: FloatProperty(
+        name="Max Distance",
+        description="Farthest floor distance from a camera, for views above the horizon",
+        default=100.0,
+        min=1.0,
+        subtype='DISTANCE',
+        unit='LENGTH',
+        update=update_floor_fit,
+    )
+
+    floor_bake_normals: BoolProperty(
+        name="Bake Normals",
+        description="""Store the floor normals once instead of evaluating the Normal Edit modifier.
+Bakes again only when FloorNormal moves""",
+        default=False,
+        update=update_floor_bake,
+    )
+
+    floor_lean_viewport: BoolProperty(
+        name="Lean Viewport",
+        description="""Skip shadow and AO nodes of the floor material in the viewport.
+The full material is used automatically while rendering""",
+        default=False,
+        update=update_floor_lean,
+    )
+
+    render_profile: EnumProperty(
+        name="Render Profile",
+        description="Last render settings profile applied to this scene",
+        items=RENDER_PROFILE_ITEMS + [
+            ('CUSTOM', "Custom", "Render settings not set by a profile"),
+        ],
+        default='CUSTOM',
+    )
+
+    farm_workers: IntProperty(
+        name="Processes",
+        description="Number of background Blender processes rendering at the same time",
+        default=4,
+        min=1, max=64,
+    )
+
+    farm_chunk: IntProperty(
+        name="Chunk",
+        description="Maximum number of frames per background render",
+        default=10,
+        min=1,
+    )
+
+    farm_static_reuse: BoolProperty(
+        name="Reuse Static Frames",
+        description="Render frames that look the same as the frame before only once, and link their files",
+        default=False,
+    )
+
+    farm_incremental: BoolProperty(
+        name="Only Changed Frames",
+        description="Render again only frames whose scene state changed since the last render",
+        default=False,
+    )
+
+    farm_plates: BoolProperty(
+        name="Background Plates",
+        description="""Render shots with a static camera and set as one plate of collection 'Set'
+plus characters per frame, composited. Needs an image output format like PNG""",
+        default=False,
+    )
+
+    frame_budget: FloatProperty(
+        name="Frame Budget",
+        description="Target render time per frame for Calibrate to Budget",
+        default=60.0,
+        min=0.1,
+        subtype='TIME_ABSOLUTE',
+        unit='TIME_ABSOLUTE',
+    )
+
+    hdri_browser: EnumProperty(
+        name="HDRI",
+        description="Studio light or user HDRI to use in Fuzzy World",
+        items=hdri_browser_items,
+        update=load_hdri,
+    )
+
+
+# ------------------------------------------------------------------------
+#    ADD-ON PREFERENCES
+# ------------------------------------------------------------------------
+
+def update_profile(self, context):
+    profile_state['enabled'] = self.profile or PROFILE_ENV not in {'', '0'}
+
+
+class FuzzyPreferences(AddonPreferences):
+    bl_idname = __package__
+
+    hdri_directory: StringProperty(
+        name="HDRI Folder",
+        description="Folder with .exr and .hdr files to show in the HDRI browser, including subfolders",
+        subtype='DIR_PATH',
+    )
+
+    profile: BoolProperty(
+        name="Profiling",
+        description="Time Fuzzy Tools operators and handlers, shown in Fuzzy View",
+        default=False,
+        update=update_profile,
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "hdri_directory")
+        layout.prop(self, "profile")
+
+
+classes = [
+    FuzzyProperties,
+    FuzzyPreferences,
+]
@@ -0,0 +1,923 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import bpy
+
+import math
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+
+from bpy.props import BoolProperty, EnumProperty
+from bpy.types import Operator
+
+from .common import frame_output, lazy_import
+from .settings import get_scene_setting, temporary_settings
+from .markers import apply_rules, get_shots, motion_blur_schedule, rule_index, rule_segment, rule_state
+from .keyframes import action_fcurves
+from .analysis import MOTION_TYPES, motion_points
+from .jobs import MAIN_SCRIPT, blender_jobs_cancel, cancel_blender_jobs, run_blender_jobs
+
+np = lazy_import('numpy')
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Render multiple cameras
+# ------------------------------------------------------------------------
+
+UPPERCASE = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
+# output path in a subfolder per camera: '//render/shot_' -> '//render/CAM.001/shot_'
+def camera_filepath(filepath, name):
+    head, tail = os.path.split(filepath)
+    return os.path.join(head, name, tail)
+
+
+# cameras named like the given camera with another or no variant letter
+def camera_variants(cam, objects):
+    base = cam.name.rstrip(UPPERCASE)
+    return [ob for ob in objects if ob.type == 'CAMERA' and ob.name.rstrip(UPPERCASE) == base]
+
+
+# render the frame range for each camera in one session. Camera binds on markers
+# are paused, persistent data keeps BVH and images between cameras.
+# Returns seconds per camera name
+def render_cameras(scene, cams):
+    render = scene.render
+    old_camera = scene.camera
+    old_filepath = render.filepath
+    old_persistent = render.use_persistent_data
+    bound = [(marker, marker.camera) for marker in scene.timeline_markers if marker.camera]
+
+    timings = {}
+    try:
+        for marker, _ in bound:
+            marker.camera = None
+        render.use_persistent_data = True
+
+        for cam in cams:
+            scene.camera = cam
+            render.filepath = camera_filepath(old_filepath, cam.name)
+            start = time.perf_counter()
+            bpy.ops.render.render(animation=True, scene=scene.name)
+            timings[cam.name] = time.perf_counter() - start
+            print(f"Fuzzy Tools: '{cam.name}' rendered in {timings[cam.name]:.1f} s")
+    finally:
+        for marker, cam in bound:
+            marker.camera = cam
+        scene.camera = old_camera
+        render.filepath = old_filepath
+        render.use_persistent_data = old_persistent
+    return timings
+
+
+class RENDER_OT_fuzzy_cameras(Operator):
+    """Render the frame range for several cameras in one session,
+each into its own subfolder of the output path"""
+    bl_idname = "render.fuzzy_cameras"
+    bl_label = "Render Cameras"
+
+    cameras: EnumProperty(
+        name="Cameras",
+        items=[
+            ('SELECTED', "Selected Cameras", "Render all selected cameras"),
+            ('VARIANTS', "Active Camera Variants", "Render the active camera and its A, B, ... variants"),
+            ('ALL', "All Cameras", "Render all cameras with 'CAM.' prefix"),
+        ],
+        default='SELECTED',
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        objects = scene.objects
+
+        if self.cameras == 'SELECTED':
+            cams = [ob for ob in context.selected_objects if ob.type == 'CAMERA']
+        elif self.cameras == 'VARIANTS':
+            cams = camera_variants(scene.camera, objects) if scene.camera else []
+        else:
+            cams = [ob for ob in objects if ob.type == 'CAMERA' and ob.name.startswith('CAM.')]
+        cams.sort(key=lambda ob: ob.name)
+
+        if not cams:
+            self.report({'WARNING'}, "No cameras to render")
+            return {'CANCELLED'}
+
+        timings = render_cameras(scene, cams)
+        total = sum(timings.values())
+        self.report({'INFO'}, f"{len(cams)} cameras rendered in {total:.1f} s")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Shot render farm
+# ------------------------------------------------------------------------
+
+# runs of consecutive frames, at most size frames long: [(first, last)]
+def frame_chunks(frames, size):
+    chunks = []
+    for frame in sorted(frames):
+        if chunks and frame == chunks[-1][1] + 1 and frame - chunks[-1][0] < size:
+            chunks[-1][1] = frame
+        else:
+            chunks.append([frame, frame])
+    return [tuple(chunk) for chunk in chunks]
+
+
+# background render jobs per chunk of each shot, for frames without output file
+# or in force, and not in skip. Returns jobs and the output files per job name
+def farm_jobs(scene, blend, workers, chunk_size, skip=(), force=(), plates=False):
+    threads = max(1, (os.cpu_count() or 1) // workers)
+    jobs = []
+    outputs = {}
+    for start, end, cam in get_shots(scene):
+        frames = [f for f in range(start, end + 1) if f not in skip
+                  and (f in force or not os.path.exists(frame_output(scene, f)))]
+        for first, last in frame_chunks(frames, chunk_size):
+            name = f"{cam.name} {first}-{last}"
+            if plates:
+                # factory startup like blender_command, the script registers Fuzzy Tools
+                cmd = [bpy.app.binary_path, '-b', '--factory-startup', blend, '-t', str(threads),
+                       '-P', MAIN_SCRIPT, '--', 'render-plates',
+                       '--scene', scene.name, '--start', str(first), '--end', str(last)]
+            else:
+                cmd = [bpy.app.binary_path, '-b', blend, '-S', scene.name, '-t', str(threads),
+                       '-s', str(first), '-e', str(last), '-a']
+            jobs.append((name, cmd, None))
+            outputs[name] = [frame_output(scene, f) for f in range(first, last + 1)]
+    return jobs, outputs
+
+
+# check the output files of a finished job. Runs in worker threads, so no bpy here
+def check_farm_result(result, outputs):
+    paths = outputs[result['name']]
+    missing = [path for path in paths if not os.path.exists(path)]
+    result['frames'] = len(paths) - len(missing)
+    if result['status'] == 'done' and missing:
+        result['status'] = 'failed'
+        result['error'] = f"{len(missing)} frames missing, first: {missing[0]}"
+
+
+farm_state = {
+    'running': False,
+    'jobs': 0,
+    'done': 0,
+    'failed': 0,
+    'frames': 0,
+    'total_frames': 0,
+}
+
+
+def farm_thread(jobs, outputs, workers, pairs, manifest=None):
+    def on_done(result, done, total):
+        check_farm_result(result, outputs)
+        farm_state['done'] = done
+        farm_state['frames'] += result.get('frames', 0)
+        if result['status'] == 'failed':
+            farm_state['failed'] += 1
+            print(f"Fuzzy Tools: chunk '{result['name']}' failed: {result.get('error', '')}")
+    try:
+        results = run_blender_jobs(jobs, workers, on_done)
+        if manifest:
+            path, hashes = manifest
+            write_manifest(path, finished_hashes(hashes, results))
+        if not blender_jobs_cancel.is_set():
+            farm_state['frames'] += link_outputs(pairs)
+    finally:
+        farm_state['running'] = False
+
+
+def farm_redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return 0.5 if farm_state['running'] else None
+
+
+class RENDER_OT_fuzzy_farm(Operator):
+    """Render the shots of camera bound markers in background Blender processes on this computer.
+Frames that already have an output file are skipped. Saves the file first"""
+    bl_idname = "render.fuzzy_farm"
+    bl_label = "Render Shots"
+
+    @classmethod
+    def poll(cls, context):
+        return not farm_state['running']
+
+    def execute(self, context):
+        scene = context.scene
+        props = scene.fuzzy_props
+        if not bpy.data.filepath:
+            self.report({'ERROR'}, "Save the file before rendering shots")
+            return {'CANCELLED'}
+        if bpy.data.is_dirty:
+            bpy.ops.wm.save_mainfile()
+
+        plan = {}
+        if props.farm_static_reuse:
+            plan, _ = static_frame_plan(scene)
+        pairs = reuse_pairs(scene, plan)
+
+        changed = ()
+        manifest = None
+        if props.farm_incremental:
+            changed, hashes = changed_frames(scene)
+            manifest = (manifest_path(scene), hashes)
+
+        plates = props.farm_plates and scene.render.image_settings.file_format in PLATE_FORMATS
+        if plates:
+            clear_plates(scene)
+
+        jobs, outputs = farm_jobs(scene, bpy.data.filepath, props.farm_workers, props.farm_chunk,
+                                  plan, changed, plates)
+        if not jobs and not plan:
+            self.report({'INFO'}, "All frames are rendered already")
+            return {'CANCELLED'}
+
+        farm_state.update(running=True, jobs=len(jobs), done=0, failed=0, frames=0,
+                          total_frames=sum(len(paths) for paths in outputs.values()) + len(pairs))
+        threading.Thread(target=farm_thread,
+                         args=(jobs, outputs, props.farm_workers, pairs, manifest),
+                         daemon=True).start()
+        bpy.app.timers.register(farm_redraw, first_interval=0.5)
+
+        self.report({'INFO'}, f"{len(jobs)} chunks sent to {props.farm_workers} processes")
+        return {'FINISHED'}
+
+
+class RENDER_OT_fuzzy_farm_cancel(Operator):
+    """Stop rendering shots. Frames that are done are kept"""
+    bl_idname = "render.fuzzy_farm_cancel"
+    bl_label = "Cancel Render Shots"
+    bl_options = {'INTERNAL'}
+
+    @classmethod
+    def poll(cls, context):
+        return farm_state['running']
+
+    def execute(self, context):
+        cancel_blender_jobs()
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Static frame reuse
+# ------------------------------------------------------------------------
+
+# modifiers that change over time without F-curves
+TIME_MODIFIERS = {'PARTICLE_SYSTEM', 'CLOTH', 'SOFT_BODY', 'FLUID', 'DYNAMIC_PAINT', 'NODES'}
+
+
+# data blocks whose animation can change what the scene renders
+def scene_anim_ids(scene):
+    ids = [scene]
+    if scene.world:
+        ids.append(scene.world)
+    for ob in scene.objects:
+        ids.append(ob)
+        data = ob.data
+        if data is not None:
+            ids.append(data)
+            if getattr(data, 'shape_keys', None):
+                ids.append(data.shape_keys)
+        ids += [slot.material for slot in ob.material_slots if slot.material]
+    ids += list(bpy.data.node_groups)
+    # node trees of materials and world have their own animation
+    ids += [id.node_tree for id in ids if getattr(id, 'node_tree', None)]
+    return list({id.as_pointer(): id for id in ids}.values())
+
+
+# F-curves that change value somewhere, and reasons why frames can't be checked.
+# Returns (fcurves, [(start, end, reason)])
+def scene_fcurves(scene):
+    fcurves = []
+    dynamic = []
+    everywhere = (scene.frame_start, scene.frame_end)
+
+    for id in scene_anim_ids(scene):
+        ad = getattr(id, 'animation_data', None)
+        if ad is None:
+            continue
+        fcurves += [fc for fc in action_fcurves(ad) if not fc.mute]
+        for track in ad.nla_tracks:
+            if track.mute:
+                continue
+            for strip in track.strips:
+                if not strip.mute:
+                    dynamic.append((int(strip.frame_start), int(math.ceil(strip.frame_end)),
+                                    f"NLA strip '{strip.name}' on '{id.name}'"))
+        for fc in ad.drivers:
+            if 'frame' in fc.driver.expression:
+                dynamic.append((*everywhere, f"driver '{fc.data_path}' on '{id.name}' uses frame"))
+
+    for ob in scene.objects:
+        for mod in ob.modifiers:
+            if mod.type in TIME_MODIFIERS and mod.show_render:
+                dynamic.append((*everywhere, f"'{mod.name}' modifier on '{ob.name}'"))
+    if scene.rigidbody_world and scene.rigidbody_world.enabled:
+        dynamic.append((*everywhere, "rigid body simulation"))
+    for image in bpy.data.images:
+        if image.source in {'SEQUENCE', 'MOVIE'} and image.users:
+            dynamic.append((*everywhere, f"image sequence or movie '{image.name}'"))
+
+    # skip curves that are flat everywhere
+    changing = []
+    for fc in fcurves:
+        points = fc.keyframe_points
+        count = len(points)
+        if count == 0:
+            continue
+        values = np.empty(count * 2 * 3, dtype=np.float32)
+        points.foreach_get('co', values[:count * 2])
+        points.foreach_get('handle_left', values[count * 2:count * 4])
+        points.foreach_get('handle_right', values[count * 4:])
+        y = values.reshape(-1, 2)[:, 1]
+        if len(fc.modifiers) or np.ptp(y) > 1e-6:
+            changing.append(fc)
+    return changing, dynamic
+
+
+# frames that render the same as the frame before, mapped to the first frame of their
+# static run: {frame: source frame}. Also returns the reasons for frames that can't be reused
+def static_frame_plan(scene, samples=4):
+    start, end = scene.frame_start, scene.frame_end
+    frames = range(start, end + 1)
+    fcurves, dynamic = scene_fcurves(scene)
+
+    # sample curves from start - 2 to end + 1, to also cover motion blur around the range
+    first = start - 2
+    count = end + 1 - first
+    times = first + np.arange(count * samples + 1) / samples
+    if fcurves:
+        values = np.array([[fc.evaluate(t) for t in times] for fc in fcurves], dtype=np.float64)
+        steps = (np.abs(np.diff(values, axis=1)) > 1e-6).any(axis=0)
+        # moves[i]: something changes between frame first + i and the next frame
+        moves = steps.reshape(count, samples).any(axis=1)
+    else:
+        moves = np.zeros(count, dtype=bool)
+
+    def moving(a, b):
+        return moves[a - first:b - first].any()
+
+    cameras = {}
+    for shot_start, shot_end, cam in get_shots(scene):
+        for frame in range(shot_start, shot_end + 1):
+            cameras[frame] = cam.name
+    blur = motion_blur_schedule(scene, range(start - 1, end + 1))
+    # all settings of the marker rules, 'fz samples=..' and tables too
+    index = rule_index(scene)
+    rules = {frame: index[1][rule_segment(index, frame)] for frame in range(start - 1, end + 1)}
+    blocked = np.zeros(end + 1 - start, dtype=bool)
+    for a, b, _ in dynamic:
+        blocked[max(a, start) - start:max(min(b, end) + 1 - start, 0)] = True
+
+    plan = {}
+    source = start
+    for frame in frames[1:]:
+        static = (not blocked[frame - start]
+                  and cameras.get(frame) == cameras.get(frame - 1)
+                  and blur[frame] == blur[frame - 1]
+                  and rules[frame] == rules[frame - 1]
+                  and not moving(frame - 1, frame))
+        # motion blur samples around the frame, so its neighbours must be still too
+        if static and (blur[frame][0] or blur[frame - 1][0]):
+            static = not moving(frame - 2, frame + 1)
+        if static:
+            plan[frame] = source
+        else:
+            source = frame
+    return plan, [reason for _, _, reason in dynamic]
+
+
+def render_plan_path(scene):
+    return os.path.join(os.path.dirname(frame_output(scene, scene.frame_start)),
+                        "fuzzy_render_plan.json")
+
+
+def write_render_plan(scene, plan, reasons):
+    path = render_plan_path(scene)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    with open(path, 'w') as f:
+        json.dump({
+            'scene': scene.name,
+            'render': [frame for frame in frames if frame not in plan],
+            'reuse': {str(frame): source for frame, source in plan.items()},
+            'dynamic': reasons,
+        }, f, indent=2)
+    return path
+
+
+# (source, target) output files for reused frames
+def reuse_pairs(scene, plan):
+    return [(frame_output(scene, source), frame_output(scene, frame)) for frame, source in plan.items()]
+
+
+# hardlink reused frames to their source output, or copy when linking isn't possible.
+# No bpy here, so it can run after background renders
+def link_outputs(pairs):
+    count = 0
+    for source, target in pairs:
+        if not os.path.exists(source):
+            continue
+        if os.path.lexists(target):
+            os.remove(target)
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copy2(source, target)
+        count += 1
+    return count
+
+
+# render one frame in this session and save it to its output file
+def render_frame(scene, frame):
+    scene.frame_set(frame)
+    apply_rules(scene, frame)
+    bpy.ops.render.render(scene=scene.name)
+    path = frame_output(scene, frame)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    bpy.data.images['Render Result'].save_render(filepath=path, scene=scene)
+
+
+class RENDER_OT_fuzzy_static_frames(Operator):
+    """Find frames that look the same as the frame before and write a render plan.
+Render renders the other frames and links the static frames to them"""
+    bl_idname = "render.fuzzy_static_frames"
+    bl_label = "Static Frames"
+
+    render: BoolProperty(
+        name="Render",
+        description="Render the plan after analysis",
+        default=False,
+        options={'SKIP_SAVE'},
+    )
+
+    def execute(self, context):
+        scene = context.scene
+        start = time.perf_counter()
+        plan, reasons = static_frame_plan(scene)
+        path = write_render_plan(scene, plan, reasons)
+        seconds = time.perf_counter() - start
+        for reason in reasons:
+            print(f"Fuzzy Tools: frames can't be reused: {reason}")
+
+        total = scene.frame_end - scene.frame_start + 1
+        if not self.render:
+            self.report({'INFO'}, f"{len(plan)} of {total} frames static ({seconds:.2f} s), "
+                        f"plan written to '{path}'")
+            return {'FINISHED'}
+
+        frame_current = scene.frame_current
+        try:
+            for frame in range(scene.frame_start, scene.frame_end + 1):
+                if frame not in plan:
+                    render_frame(scene, frame)
+        finally:
+            scene.frame_set(frame_current)
+        linked = link_outputs(reuse_pairs(scene, plan))
+        self.report({'INFO'}, f"{total - len(plan)} frames rendered, {linked} reused")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Incremental render
+# ------------------------------------------------------------------------
+
+MANIFEST_NAME = "fuzzy_manifest.json"
+
+# render settings that change the rendered image
+RENDER_STATE_PATHS = [
+    'render.engine',
+    'render.resolution_x',
+    'render.resolution_y',
+    'render.resolution_percentage',
+    'render.pixel_aspect_x',
+    'render.pixel_aspect_y',
+    'render.film_transparent',
+    'render.use_border',
+    'render.border_min_x',
+    'render.border_min_y',
+    'render.border_max_x',
+    'render.border_max_y',
+    'render.use_simplify',
+    'render.simplify_subdivision_render',
+    'render.simplify_child_particles_render',
+    'render.hair_type',
+    'render.motion_blur_position',
+    'eevee.taa_render_samples',
+    'eevee.ray_tracing_options.resolution_scale',
+    'eevee.shadow_cube_size',
+    'eevee.shadow_cascade_size',
+    'eevee.shadow_resolution_scale',
+    'cycles.samples',
+    'cycles.adaptive_threshold',
+    'view_settings.view_transform',
+    'view_settings.look',
+    'view_settings.exposure',
+    'view_settings.gamma',
+]
+
+
+# node settings of a node tree as bytes
+def tree_state(tree):
+    state = []
+    for node in sorted(tree.nodes, key=lambda n: n.name):
+        state.append((node.name, node.mute))
+        for socket in list(node.inputs) + list(node.outputs):
+            value = getattr(socket, 'default_value', None)
+            try:
+                value = tuple(value)
+            except TypeError:
+                pass
+            state.append(value)
+        image = getattr(node, 'image', None)
+        if image is not None:
+            state.append((image.name, image.filepath))
+        node_tree = getattr(node, 'node_tree', None)
+        if node_tree is not None:
+            state.append(node_tree.name)
+    return repr(state).encode()
+
+
+# Fuzzy World and floor material, which show in every frame
+def fuzzy_material_state(scene):
+    trees = []
+    if scene.world and scene.world.node_tree:
+        trees.append(scene.world.node_tree)
+    mat = bpy.data.materials.get('floor_shadow')
+    if mat and mat.node_tree:
+        trees.append(mat.node_tree)
+    group = bpy.data.node_groups.get('Fuzzy BG')
+    if group:
+        trees.append(group)
+    return b"".join(tree_state(tree) for tree in trees)
+
+
+def camera_state(cam):
+    if cam is None:
+        return b""
+    data = cam.data
+    dof = data.dof
+    return repr((
+        cam.name, data.type, data.lens, data.ortho_scale, data.clip_start, data.clip_end,
+        data.shift_x, data.shift_y, data.sensor_fit, data.sensor_width, data.sensor_height,
+        dof.use_dof, dof.focus_distance, dof.aperture_fstop,
+        dof.focus_object.name if dof.focus_object else None,
+    )).encode() + np.array(cam.matrix_world, dtype=np.float32).tobytes()
+
+
+# state that isn't animated: meshes and all materials of the scene
+def scene_static_state(scene):
+    h = hashlib.blake2b(digest_size=16)
+    meshes = {ob.data.name: ob.data for ob in scene.objects if ob.type == 'MESH'}
+    for name in sorted(meshes):
+        mesh = meshes[name]
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get('co', co)
+        h.update(name.encode())
+        h.update(co.tobytes())
+    materials = {slot.material.name: slot.material for ob in scene.objects
+                 for slot in ob.material_slots if slot.material}
+    for name in sorted(materials):
+        if materials[name].node_tree:
+            h.update(tree_state(materials[name].node_tree))
+    return h.digest()
+
+
+# hash per frame of what the frame renders: transforms and visibility of objects,
+# armature poses, animated values, active camera, render settings and Fuzzy materials.
+# Static state is hashed once and the animated values are sampled in one array.
+# Frames with simulations, NLA strips or time modifiers get None: they always render
+def frame_hashes(scene, frames):
+    frames = list(frames)
+    base = hashlib.blake2b(digest_size=16)
+    base.update(scene_static_state(scene))
+
+    fcurves, dynamic = scene_fcurves(scene)
+    values = np.array([[fc.evaluate(frame) for frame in frames] for fc in fcurves],
+                      dtype=np.float32).reshape(len(fcurves), len(frames))
+    blur = motion_blur_schedule(scene, frames)
+    objects = sorted(scene.objects, key=lambda ob: ob.name)
+    names = "\n".join(ob.name for ob in objects).encode()
+    armatures = [ob for ob in objects if ob.type == 'ARMATURE' and ob.pose]
+
+    hashes = {}
+    frame_current = scene.frame_current
+    try:
+        for i, frame in enumerate(frames):
+            scene.frame_set(frame)
+            h = base.copy()
+            h.update(values[:, i].tobytes())
+            h.update(names)
+            h.update(np.array([ob.matrix_world for ob in objects], dtype=np.float32).tobytes())
+            h.update(bytes(ob.hide_render for ob in objects))
+            for ob in armatures:
+                h.update(np.array([bone.matrix for bone in ob.pose.bones], dtype=np.float32).tobytes())
+            h.update(camera_state(scene.camera))
+            settings = [get_scene_setting(scene, path) for path in RENDER_STATE_PATHS]
+            rules = sorted(rule_state(scene, frame).items())
+            h.update(repr((settings, rules, blur[frame])).encode())
+            h.update(fuzzy_material_state(scene))
+            hashes[frame] = h.hexdigest()
+    finally:
+        scene.frame_set(frame_current)
+    for start, end, _ in dynamic:
+        for frame in frames:
+            if start <= frame <= end:
+                hashes[frame] = None
+    return hashes
+
+
+def manifest_path(scene):
+    return os.path.join(os.path.dirname(frame_output(scene, scene.frame_start)), MANIFEST_NAME)
+
+
+def read_manifest(scene):
+    try:
+        with open(manifest_path(scene)) as f:
+            return {int(frame): value for frame, value in json.load(f)['frames'].items()}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+# no bpy here, the farm writes the manifest from its thread when the chunks are done
+def write_manifest(path, hashes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'frames': {str(frame): value for frame, value in sorted(hashes.items())}},
+                  f, indent=1)
+    os.replace(tmp, path)
+
+
+# hashes without the frames of chunks that didn't finish, so they render again next time
+def finished_hashes(hashes, results):
+    hashes = dict(hashes)
+    for result in results:
+        if result['status'] != 'done':
+            first, last = map(int, result['name'].rsplit(' ', 1)[1].split('-'))
+            for frame in range(first, last + 1):
+                hashes.pop(frame, None)
+    return hashes
+
+
+# frames whose hash differs from the manifest, or that have no output file.
+# Returns (changed frames, new hashes)
+def changed_frames(scene):
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    hashes = frame_hashes(scene, frames)
+    old = read_manifest(scene)
+    changed = [frame for frame in frames if hashes[frame] is None or old.get(frame) != hashes[frame]
+               or not os.path.exists(frame_output(scene, frame))]
+    return changed, hashes
+
+
+class RENDER_OT_fuzzy_incremental(Operator):
+    """Render only frames that changed since the last incremental render,
+or that have no output file. A hash per frame is kept next to the output"""
+    bl_idname = "render.fuzzy_incremental"
+    bl_label = "Render Changed Frames"
+
+    def execute(self, context):
+        scene = context.scene
+        start = time.perf_counter()
+        changed, hashes = changed_frames(scene)
+        print(f"Fuzzy Tools: {len(changed)} changed frames found in {time.perf_counter() - start:.2f} s")
+
+        # keep hashes of unchanged frames, add the new ones as frames finish
+        manifest = {frame: value for frame, value in hashes.items() if frame not in changed}
+        frame_current = scene.frame_current
+        try:
+            for frame in changed:
+                render_frame(scene, frame)
+                manifest[frame] = hashes[frame]
+        finally:
+            write_manifest(manifest_path(scene), manifest)
+            scene.frame_set(frame_current)
+
+        total = len(hashes)
+        self.report({'INFO'}, f"{len(changed)} of {total} frames rendered")
+        return {'FINISHED'}
+
+
+# ------------------------------------------------------------------------
+#    OPERATOR - Background Plates
+# ------------------------------------------------------------------------
+
+PLATE_LAYER = "Fuzzy Plate"
+CHARACTER_LAYER = "Fuzzy Characters"
+# output formats the plate composite can write
+PLATE_FORMATS = {'PNG', 'JPEG', 'TIFF', 'TARGA', 'TARGA_RAW', 'BMP'}
+
+
+def plate_path(scene, start, end):
+    folder = os.path.dirname(frame_output(scene, start))
+    return os.path.join(folder, "plates", f"plate_{start:04d}-{end:04d}.png")
+
+
+def set_collection_objects(scene):
+    coll = bpy.data.collections.get('Set')
+    if coll is None:
+        return []
+    return sorted((ob for ob in coll.all_objects if ob.name in scene.objects), key=lambda ob: ob.name)
+
+
+# a shot gets a plate when camera, set, Fuzzy materials and marker rules
+# are the same on all of its frames
+def shot_is_static(scene, start, end, cam):
+    set_obs = set_collection_objects(scene)
+    geometry = [ob for ob in set_obs if ob.type in MOTION_TYPES]
+    states = set()
+    frame_current = scene.frame_current
+    try:
+        for frame in range(start, end + 1):
+            scene.frame_set(frame)
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            h = hashlib.blake2b(digest_size=16)
+            h.update(camera_state(cam))
+            h.update(np.array([ob.matrix_world for ob in set_obs], dtype=np.float32).tobytes())
+            h.update(bytes(ob.hide_render for ob in set_obs))
+            for ob in geometry:
+                h.update(motion_points(ob, depsgraph).astype(np.float32).tobytes())
+            h.update(fuzzy_material_state(scene))
+            h.update(repr(sorted(rule_state(scene, frame).items())).encode())
+            states.add(h.digest())
+            if len(states) > 1:
+                return False
+    finally:
+        scene.frame_set(frame_current)
+    return True
+
+
+# view layer 'Fuzzy Plate' with only collection 'Set', view layer 'Fuzzy Characters'
+# with all collections. Both are off for normal renders
+def ensure_plate_layers(scene):
+    set_coll = bpy.data.collections.get('Set')
+    layers = []
+    for name in (PLATE_LAYER, CHARACTER_LAYER):
+        layer = scene.view_layers.get(name)
+        if layer is None:
+            layer = scene.view_layers.new(name)
+            layer.use = False
+        layers.append(layer)
+    plate, chars = layers
+    for lc in plate.layer_collection.children:
+        exclude = lc.collection != set_coll
+        if lc.exclude != exclude:
+            lc.exclude = exclude
+    return plate, chars
+
+
+# render only this view layer, as PNG with alpha
+def layer_settings(scene, layer):
+    changes = [(vl, 'use', vl == layer) for vl in scene.view_layers]
+    changes += [
+        (scene.render, 'use_compositing', False),
+        (scene.render, 'use_sequencer', False),
+        (scene.render.image_settings, 'file_format', 'PNG'),
+        (scene.render.image_settings, 'color_mode', 'RGBA'),
+    ]
+    return changes
+
+
+# characters over transparent film. The set is held out and casts no shadows,
+# the floor only shows the shadows of the characters
+def character_settings(scene, layer):
+    changes = layer_settings(scene, layer)
+    changes.append((scene.render, 'film_transparent', True))
+    for ob in set_collection_objects(scene):
+        if ob.type in MOTION_TYPES and ob.name != 'FuzzyFloor':
+            changes += [(ob, 'is_holdout', True), (ob, 'visible_shadow', False)]
+    mat = bpy.data.materials.get('floor_shadow')
+    if mat and mat.node_tree and mat.node_tree.nodes.get('Floor Alpha'):
+        changes.append((mat.node_tree.nodes['Floor Alpha'], 'mute', True))
+    return changes
+
+
+def render_to(scene, path):
+    bpy.ops.render.render(scene=scene.name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    bpy.data.images['Render Result'].save_render(filepath=path, scene=scene)
+
+
+# (height, width, 4) float pixels of an image file
+def read_pixels(path):
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+    finally:
+        bpy.data.images.remove(image)
+    return pixels.reshape(height, width, 4)
+
+
+def write_pixels(scene, path, pixels):
+    height, width = pixels.shape[:2]
+    image = bpy.data.images.new("Fuzzy Composite", width, height, alpha=True)
+    try:
+        image.pixels.foreach_set(pixels.ravel())
+        image.filepath_raw = path
+        image.file_format = scene.render.image_settings.file_format
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        image.save()
+    finally:
+        bpy.data.images.remove(image)
+
+
+# render frames of a shot. Static shots render the set once as plate and the characters
+# per frame, composited over the plate. Shots with motion render full frames.
+# Returns True if the shot used a plate
+def render_shot_plates(scene, start, end, cam, frames):
+    if not shot_is_static(scene, start, end, cam):
+        for frame in frames:
+            render_frame(scene, frame)
+        return False
+
+    plate_layer, chars_layer = ensure_plate_layers(scene)
+    path = plate_path(scene, start, end)
+    if not os.path.exists(path):
+        scene.frame_set(start)
+        apply_rules(scene, start)
+        tmp = path + f".{os.getpid()}.png"
+        with temporary_settings(layer_settings(scene, plate_layer)):
+            render_to(scene, tmp)
+        os.replace(tmp, path)
+    plate = read_pixels(path)
+
+    for frame in frames:
+        scene.frame_set(frame)
+        apply_rules(scene, frame)
+        tmp = os.path.join(os.path.dirname(path), f"chars_{frame:04d}.png")
+        with temporary_settings(character_settings(scene, chars_layer)):
+            render_to(scene, tmp)
+        chars = read_pixels(tmp)
+        os.remove(tmp)
+        # image files hold straight alpha
+        alpha = chars[..., 3:]
+        out = np.empty_like(plate)
+        out[..., :3] = chars[..., :3] * alpha + plate[..., :3] * (1 - alpha)
+        out[..., 3:] = alpha + plate[..., 3:] * (1 - alpha)
+        write_pixels(scene, frame_output(scene, frame), out)
+    return True
+
+
+# render a frame range with plates, shot by shot. Returns (frames on plates, frames rendered full)
+def render_plates(scene, first, last):
+    plated = full = 0
+    frame_current = scene.frame_current
+    try:
+        for start, end, cam in get_shots(scene):
+            frames = range(max(start, first), min(end, last) + 1)
+            if not frames:
+                continue
+            if render_shot_plates(scene, start, end, cam, frames):
+                plated += len(frames)
+            else:
+                full += len(frames)
+    finally:
+        scene.frame_set(frame_current)
+    return plated, full
+
+
+def clear_plates(scene):
+    folder = os.path.dirname(plate_path(scene, scene.frame_start, scene.frame_end))
+    shutil.rmtree(folder, ignore_errors=True)
+
+
+class RENDER_OT_fuzzy_plates(Operator):
+    """Render shots with a static camera and set as one background plate plus characters per frame.
+Characters must be outside collection 'Set'. Shots with motion render full frames"""
+    bl_idname = "render.fuzzy_plates"
+    bl_label = "Render with Plates"
+
+    def execute(self, context):
+        scene = context.scene
+        if scene.render.image_settings.file_format not in PLATE_FORMATS:
+            self.report({'ERROR'}, "Plates need an image output format like PNG")
+            return {'CANCELLED'}
+        if 'Set' not in bpy.data.collections:
+            self.report({'ERROR'}, "Collection 'Set' not found")
+            return {'CANCELLED'}
+
+        clear_plates(scene)
+        start = time.perf_counter()
+        plated, full = render_plates(scene, scene.frame_start, scene.frame_end)
+        print(f"Fuzzy Tools: rendered with plates in {time.perf_counter() - start:.1f} s")
+        self.report({'INFO'}, f"{plated} frames on plates, {full} frames rendered full")
+        return {'FINISHED'}
+
+
+classes = [
+    RENDER_OT_fuzzy_cameras,
+    RENDER_OT_fuzzy_farm,
+    RENDER_OT_fuzzy_farm_cancel,
+    RENDER_OT_fuzzy_static_frames,
+    RENDER_OT_fuzzy_incremental,
+    RENDER_OT_fuzzy_plates,
+]
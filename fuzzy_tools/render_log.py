@@ -0,0 +1,190 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+
+import os
+import re
+import csv
+import json
+import time
+import contextlib
+
+from bpy.types import Operator
+from bpy.app.handlers import persistent
+
+from .common import frame_output, is_next_version, profiled
+from .markers import get_shots
+
+
+# ------------------------------------------------------------------------
+#    RENDER LOG
+# ------------------------------------------------------------------------
+
+RENDER_LOG_NAME = "fuzzy_render_log"
+RENDER_LOG_FIELDS = ['time', 'frame', 'shot', 'camera', 'seconds', 'peak_mb',
+                     'motion_blur', 'shutter', 'profile', 'engine']
+
+# frame being rendered: start time and peak memory from the render stats.
+# No rows are written while paused, by calibration and benchmark renders
+render_log_state = {'start': None, 'peak': None, 'paused': 0}
+# summary per log file, read again when the file changes
+render_log_cache = {}
+
+
+def render_log_path(scene, ext):
+    folder = os.path.dirname(frame_output(scene, scene.frame_start))
+    return os.path.join(folder, f"{RENDER_LOG_NAME}.{ext}")
+
+
+# renders inside don't count in the log, the peak memory is still measured
+@contextlib.contextmanager
+def render_log_paused():
+    render_log_state['paused'] += 1
+    try:
+        yield
+    finally:
+        render_log_state['paused'] -= 1
+
+
+def shot_of_frame(scene, frame):
+    for start, end, _ in get_shots(scene):
+        if start <= frame <= end:
+            return f"{start}-{end}"
+    return ""
+
+
+@persistent
+@profiled
+def render_log_pre(scene, _=None):
+    render_log_state['start'] = time.perf_counter()
+    render_log_state['peak'] = None
+
+
+# stats look like 'Fra:12 | Mem:120.5M (Peak 180.2M) | ...', the wording differs per engine
+@persistent
+@profiled
+def render_log_stats(stats):
+    match = re.search(r"Peak[: ]*([\d.]+)([MG])", stats)
+    if match:
+        peak = float(match.group(1)) * (1024 if match.group(2) == 'G' else 1)
+        render_log_state['peak'] = max(peak, render_log_state['peak'] or 0)
+
+
+# one CSV row per rendered frame, appended right away so a crash keeps the frames before
+@persistent
+@profiled
+def render_log_post(scene, _=None):
+    if render_log_state['start'] is None or render_log_state['paused']:
+        return
+    seconds = time.perf_counter() - render_log_state['start']
+    render_log_state['start'] = None
+    if is_next_version():
+        version = scene.render
+    else:
+        version = scene.eevee
+    frame = scene.frame_current
+    row = {
+        'time': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'frame': frame,
+        'shot': shot_of_frame(scene, frame),
+        'camera': scene.camera.name if scene.camera else "",
+        'seconds': round(seconds, 3),
+        'peak_mb': round(render_log_state['peak'], 1) if render_log_state['peak'] else "",
+        'motion_blur': int(version.use_motion_blur),
+        'shutter': round(version.motion_blur_shutter, 3),
+        'profile': scene.fuzzy_props.render_profile,
+        'engine': scene.render.engine,
+    }
+    path = render_log_path(scene, 'csv')
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        new = not os.path.exists(path)
+        with open(path, 'a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=RENDER_LOG_FIELDS)
+            if new:
+                writer.writeheader()
+            writer.writerow(row)
+    except OSError as error:
+        print(f"Fuzzy Tools: render log not written: {error}")
+
+
+# JSON summary of the whole CSV when a render ends. Farm processes share the CSV,
+# the last one to finish writes the full summary
+@persistent
+@profiled
+def render_log_done(scene, _=None):
+    if render_log_state['paused']:
+        return
+    summary = read_render_log(render_log_path(scene, 'csv'))
+    if summary is None:
+        return
+    path = render_log_path(scene, 'json')
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(summary, f, indent=1)
+        os.replace(tmp, path)
+    except OSError as error:
+        print(f"Fuzzy Tools: render log not written: {error}")
+
+
+def summarize_frames(rows, key):
+    groups = {}
+    for row in rows:
+        group = groups.setdefault(row[key], {'frames': 0, 'seconds': 0.0, 'peak_mb': 0.0})
+        group['frames'] += 1
+        group['seconds'] += row['seconds']
+        group['peak_mb'] = max(group['peak_mb'], row['peak_mb'] or 0.0)
+    for group in groups.values():
+        group['seconds'] = round(group['seconds'], 3)
+        group['per_frame'] = round(group['seconds'] / group['frames'], 3)
+    return dict(sorted(groups.items(), key=lambda it: -it[1]['seconds']))
+
+
+# frames of the log, the last render of each frame, with totals per shot and camera
+def read_render_log(path):
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+    cached = render_log_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    frames = {}
+    with open(path, newline='') as f:
+        for row in csv.DictReader(f):
+            try:
+                row['frame'] = int(row['frame'])
+                row['seconds'] = float(row['seconds'])
+                row['peak_mb'] = float(row['peak_mb']) if row['peak_mb'] else None
+            except (KeyError, ValueError):
+                continue
+            frames[row['frame']] = row
+    rows = [frames[frame] for frame in sorted(frames)]
+    summary = {
+        'frames': rows,
+        'seconds': round(sum(row['seconds'] for row in rows), 3),
+        'shots': summarize_frames(rows, 'shot'),
+        'cameras': summarize_frames(rows, 'camera'),
+    }
+    render_log_cache[path] = (mtime, summary)
+    return summary
+
+
+class RENDER_OT_fuzzy_render_log_clear(Operator):
+    """Delete the render log of this output folder"""
+    bl_idname = "render.fuzzy_render_log_clear"
+    bl_label = "Clear Render Log"
+    bl_options = {'INTERNAL'}
+
+    def execute(self, context):
+        for ext in ('csv', 'json'):
+            path = render_log_path(context.scene, ext)
+            if os.path.exists(path):
+                os.remove(path)
+        return {'FINISHED'}
+
+
+classes = [
+    RENDER_OT_fuzzy_render_log_clear,
+]
@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import contextlib
+
+
+# ------------------------------------------------------------------------
+#    RENDER PROFILES
+# ------------------------------------------------------------------------
+
+# owner and property name of a 'path.to.property' relative to the scene,
+# or None when this Blender version or render engine doesn't have it
+def resolve_scene_setting(scene, path):
+    *parents, name = path.split('.')
+    owner = scene
+    try:
+        for attr in parents:
+            owner = getattr(owner, attr)
+        getattr(owner, name)
+    except AttributeError:
+        return None
+    return owner, name
+
+
+def get_scene_setting(scene, path):
+    resolved = resolve_scene_setting(scene, path)
+    if resolved is None:
+        return None
+    value = getattr(*resolved)
+    if isinstance(value, str) or not hasattr(value, '__len__'):
+        return value
+    return tuple(value)
+
+
+# (path, value) pairs that failed to set, reported once
+setting_errors = set()
+
+
+# set 'path.to.property': value pairs relative to the scene. Only writes values that differ
+# and skips properties this Blender version or render engine doesn't have, and values
+# of the wrong type, like 'fz res=abc'. Returns the number of properties written
+def apply_scene_settings(scene, settings):
+    count = 0
+    for path, value in settings.items():
+        resolved = resolve_scene_setting(scene, path)
+        if resolved is None:
+            continue
+        current = getattr(*resolved)
+        # enum values like ray tracing resolution '2' can come in as numbers from markers
+        if isinstance(current, str) and not isinstance(value, str):
+            value = str(value)
+        try:
+            if isinstance(value, float) and abs(current - value) < 1e-6:
+                continue
+            if current == value:
+                continue
+            setattr(*resolved, value)
+        except (TypeError, ValueError, AttributeError) as error:
+            key = (path, repr(value))
+            if key not in setting_errors:
+                setting_errors.add(key)
+                print(f"Fuzzy Tools: can't set '{path}' to {value!r}: {error}")
+            continue
+        count += 1
+    return count
+
+
+RENDER_PROFILE_ITEMS = [
+    ('DRAFT', "Draft", "Half resolution, few samples and low shadow and ray tracing quality for review renders"),
+    ('PREVIEW', "Preview", "Full resolution with reduced samples, shadow and ray tracing quality"),
+    ('FINAL', "Final", "Full quality for delivery"),
+]
+
+# settings per profile. EEVEE Legacy and Next properties are mixed,
+# the ones missing in the running Blender version are skipped
+RENDER_PROFILES = {
+    'DRAFT': {
+        'render.resolution_percentage': 50,
+        'eevee.taa_render_samples': 16,
+        'cycles.samples': 32,
+        # legacy
+        'eevee.shadow_cube_size': '512',
+        'eevee.shadow_cascade_size': '1024',
+        'eevee.use_soft_shadows': False,
+        'eevee.use_ssr_halfres': True,
+        # next
+        'eevee.shadow_ray_count': 1,
+        'eevee.shadow_step_count': 2,
+        'eevee.shadow_resolution_scale': 0.25,
+        'eevee.ray_tracing_options.resolution_scale': '4',
+        'eevee.fast_gi_resolution': '4',
+    },
+    'PREVIEW': {
+        'render.resolution_percentage': 100,
+        'eevee.taa_render_samples': 32,
+        'cycles.samples': 128,
+        # legacy
+        'eevee.shadow_cube_size': '1024',
+        'eevee.shadow_cascade_size': '2048',
+        'eevee.use_soft_shadows': True,
+        'eevee.use_ssr_halfres': True,
+        # next
+        'eevee.shadow_ray_count': 1,
+        'eevee.shadow_step_count': 4,
+        'eevee.shadow_resolution_scale': 0.5,
+        'eevee.ray_tracing_options.resolution_scale': '2',
+        'eevee.fast_gi_resolution': '2',
+    },
+    'FINAL': {
+        'render.resolution_percentage': 100,
+        'eevee.taa_render_samples': 64,
+        'cycles.samples': 512,
+        # legacy
+        'eevee.shadow_cube_size': '2048',
+        'eevee.shadow_cascade_size': '4096',
+        'eevee.use_soft_shadows': True,
+        'eevee.use_ssr_halfres': False,
+        # next
+        'eevee.shadow_ray_count': 1,
+        'eevee.shadow_step_count': 6,
+        'eevee.shadow_resolution_scale': 1.0,
+        'eevee.ray_tracing_options.resolution_scale': '1',
+        'eevee.fast_gi_resolution': '1',
+    },
+}
+
+
+CYCLES_PRESET_ITEMS = [
+    ('PREVIEW', "Preview", "Fast CPU settings for look development and review renders"),
+    ('FINAL', "Final", "CPU settings for final frames"),
+]
+
+# Cycles settings for CPU render nodes. The floor is a shadow catcher that is invisible
+# to diffuse and glossy rays, and the Fuzzy World only lights through non-camera rays,
+# so few diffuse and glossy bounces are needed
+CYCLES_PRESETS = {
+    'PREVIEW': {
+        'cycles.device': 'CPU',
+        'cycles.samples': 128,
+        'cycles.use_adaptive_sampling': True,
+        'cycles.adaptive_threshold': 0.05,
+        'cycles.adaptive_min_samples': 0,
+        'cycles.use_denoising': True,
+        'cycles.denoiser': 'OPENIMAGEDENOISE',
+        'cycles.denoising_input_passes': 'RGB_ALBEDO_NORMAL',
+        'cycles.denoising_prefilter': 'FAST',
+        'cycles.use_light_tree': True,
+        'cycles.max_bounces': 4,
+        'cycles.diffuse_bounces': 2,
+        'cycles.glossy_bounces': 2,
+        'cycles.transmission_bounces': 4,
+        'cycles.volume_bounces': 0,
+        'cycles.transparent_max_bounces': 8,
+        'cycles.caustics_reflective': False,
+        'cycles.caustics_refractive': False,
+        'cycles.blur_glossy': 1.0,
+        'cycles.sample_clamp_indirect': 10.0,
+        'render.use_persistent_data': True,
+    },
+    'FINAL': {
+        'cycles.device': 'CPU',
+        'cycles.samples': 512,
+        'cycles.use_adaptive_sampling': True,
+        'cycles.adaptive_threshold': 0.01,
+        'cycles.adaptive_min_samples': 0,
+        'cycles.use_denoising': True,
+        'cycles.denoiser': 'OPENIMAGEDENOISE',
+        'cycles.denoising_input_passes': 'RGB_ALBEDO_NORMAL',
+        'cycles.denoising_prefilter': 'ACCURATE',
+        'cycles.use_light_tree': True,
+        'cycles.max_bounces': 8,
+        'cycles.diffuse_bounces': 3,
+        'cycles.glossy_bounces': 4,
+        'cycles.transmission_bounces': 8,
+        'cycles.volume_bounces': 0,
+        'cycles.transparent_max_bounces': 8,
+        'cycles.caustics_reflective': False,
+        'cycles.caustics_refractive': False,
+        'cycles.blur_glossy': 1.0,
+        'cycles.sample_clamp_indirect': 10.0,
+        'render.use_persistent_data': True,
+    },
+}
+
+
+# set (owner, property, value) changes and put the old values back afterwards
+@contextlib.contextmanager
+def temporary_settings(changes):
+    old = []
+    try:
+        for owner, name, value in changes:
+            if hasattr(owner, name):
+                old.append((owner, name, getattr(owner, name)))
+                setattr(owner, name, value)
+        yield
+    finally:
+        for owner, name, value in reversed(old):
+            setattr(owner, name, value)
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Numeric checks of the Cull Shots frustum, run with the bpy module: python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fuzzy_tools.analysis import clip_points, frustum_outside
+
+
+# camera at the origin looking down -Z, 90 degree field of view
+PERSPECTIVE = np.array([[1.0, 0.0, 0.0, 0.0],
+                        [0.0, 1.0, 0.0, 0.0],
+                        [0.0, 0.0, -1.0, -0.2],
+                        [0.0, 0.0, -1.0, 0.0]])
+
+ORTHOGRAPHIC = np.array([[0.5, 0.0, 0.0, 0.0],
+                         [0.0, 0.5, 0.0, 0.0],
+                         [0.0, 0.0, -0.01, -1.0],
+                         [0.0, 0.0, 0.0, 1.0]])
+
+
+def culled(matrix, point, margin=0.0, distance=0.0):
+    matrices = np.array([matrix])
+    clip = clip_points(matrices, np.array([[point]], dtype=np.float64))
+    return bool(frustum_outside(clip, matrices, margin, distance)[0, 0].any())
+
+
+def test_in_front_is_kept():
+    assert not culled(PERSPECTIVE, (0.0, 0.0, -5.0))
+    assert not culled(PERSPECTIVE, (4.9, 0.0, -5.0))
+
+
+def test_outside_of_side_plane_is_culled():
+    assert culled(PERSPECTIVE, (5.5, 0.0, -5.0))
+    assert not culled(PERSPECTIVE, (5.5, 0.0, -5.0), margin=0.2)
+
+
+def test_behind_within_distance_is_kept():
+    assert culled(PERSPECTIVE, (0.0, 0.0, 1.0))
+    assert not culled(PERSPECTIVE, (0.0, 0.0, 1.0), distance=2.0)
+    assert not culled(PERSPECTIVE, (0.5, 0.0, 1.0), distance=2.0)
+
+
+def test_behind_beyond_distance_is_culled():
+    assert culled(PERSPECTIVE, (0.0, 0.0, 3.0), distance=2.0)
+    # the side planes meet distance behind the camera
+    assert culled(PERSPECTIVE, (1.5, 0.0, 1.0), distance=2.0)
+
+
+def test_orthographic_distance_does_not_widen():
+    assert not culled(ORTHOGRAPHIC, (1.9, 0.0, -5.0), distance=2.0)
+    assert culled(ORTHOGRAPHIC, (2.1, 0.0, -5.0), distance=2.0)
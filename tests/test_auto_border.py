@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Auto Render Border on a moving object, run with the bpy module: python -m pytest tests
+
+import os
+import sys
+
+import bpy
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fuzzy_tools
+from fuzzy_tools.analysis import BORDER_PROP, auto_border_render
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=False)
+    fuzzy_tools.register()
+    scene = bpy.context.scene
+    scene.frame_start, scene.frame_end = 1, 10
+    cube = scene.objects['Cube']
+    cube.location = (-3.0, 0.0, 0.0)
+    cube.keyframe_insert('location', frame=1)
+    cube.location = (3.0, 0.0, 0.0)
+    cube.keyframe_insert('location', frame=10)
+    yield scene
+    fuzzy_tools.unregister()
+
+
+def test_border_follows_moving_object(scene):
+    render = scene.render
+    render.use_crop_to_border = True
+    assert bpy.ops.render.fuzzy_auto_border() == {'FINISHED'}
+    assert BORDER_PROP in scene
+    assert render.use_border and not render.use_crop_to_border
+
+    scene.frame_set(1)
+    first = (render.border_min_x, render.border_max_x)
+    scene.frame_set(10)
+    last = (render.border_min_x, render.border_max_x)
+    # the cube moves from left to right through the frame
+    assert first[1] < last[0]
+
+    # renders read the border once, so they get the border around all frames
+    auto_border_render(scene)
+    assert render.border_min_x == pytest.approx(first[0], abs=1e-4)
+    assert render.border_max_x == pytest.approx(last[1], abs=1e-4)
+
+
+def test_clear_restores_settings(scene):
+    scene.render.use_crop_to_border = True
+    bpy.ops.render.fuzzy_auto_border()
+    assert bpy.ops.render.fuzzy_auto_border(clear=True) == {'FINISHED'}
+    assert BORDER_PROP not in scene
+    assert not scene.render.use_border
+    assert scene.render.use_crop_to_border
@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# HDRI preview downscaling, run with the bpy module: python -m pytest tests
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fuzzy_tools.hdri import block_mean, tonemap_preview
+
+
+def test_block_mean_keeps_every_pixel():
+    pixels = np.arange(10, dtype=np.float32)[:, None, None] * np.ones((10, 1, 3), dtype=np.float32)
+    small = block_mean(pixels, 3, 0)
+    assert small.shape == (3, 1, 3)
+    # blocks of 3, 3 and 4 rows, the last row included
+    assert np.allclose(small[:, 0, 0], [1.0, 4.0, 7.5])
+
+
+def test_preview_keeps_edges_of_odd_sizes():
+    # 2:1 map one pixel wider and taller than a multiple of the preview
+    rgb = np.zeros((129, 257, 3), dtype=np.float32)
+    rgb[:, -1] = 10.0
+    rgb[-1, :] = 10.0
+    preview = tonemap_preview(rgb, (128, 64))
+    assert preview.shape == (64, 128, 4)
+    # bottom row first: the last image row is the first preview row
+    assert preview[0, :, 0].min() > 0.0
+    assert preview[:, -1, 0].min() > 0.0
+    assert preview[1:, :-1, 0].max() == 0.0
@@ -0,0 +1,35 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Skipping current files in the migrate command, run with the bpy module: python -m pytest tests
+
+import os
+import sys
+import json
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fuzzy_tools.cli import cli_migrate
+from fuzzy_tools.jobs import find_blend_files
+from fuzzy_tools.migration import FUZZY_DATA_VERSION
+
+
+def test_current_files_skipped_with_relative_directory(tmp_path, monkeypatch):
+    shots = tmp_path / "shots"
+    (shots / "seq").mkdir(parents=True)
+    for name in ("a.blend", "seq/b.blend"):
+        (shots / name).write_bytes(b"")
+    monkeypatch.chdir(tmp_path)
+
+    files = find_blend_files("shots")
+    assert files == [str(shots / "a.blend"), str(shots / "seq" / "b.blend")]
+
+    # report of an earlier run, as written with the paths of the processes
+    report = shots / "fuzzy_migration.json"
+    report.write_text(json.dumps({'files': [
+        {'name': path, 'status': 'migrated', 'version': FUZZY_DATA_VERSION,
+         'mtime': os.path.getmtime(path)} for path in files]}))
+
+    args = argparse.Namespace(directory="shots", report=None, no_save=False, timeout=None, workers=2)
+    assert cli_migrate(args) == 0
+    results = json.loads(report.read_text())
+    assert results['counts'] == {'current': 2}
@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# Data version stamping on load, run with the bpy module: python -m pytest tests
+
+import os
+import sys
+
+import bpy
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import fuzzy_tools
+from fuzzy_tools.migration import FUZZY_DATA_VERSION, file_data_version, migrate_file
+
+
+@pytest.fixture
+def scene():
+    bpy.ops.wm.read_factory_settings(use_empty=False)
+    fuzzy_tools.register()
+    yield bpy.context.scene
+    fuzzy_tools.unregister()
+
+
+def test_nothing_to_migrate_leaves_file_untouched(scene):
+    assert not migrate_file()
+    assert scene.fuzzy_props.data_version == 0
+
+
+def test_built_scene_is_current(scene):
+    bpy.ops.scene.build_all()
+    assert scene.fuzzy_props.data_version == FUZZY_DATA_VERSION
+    bpy.ops.scene.new(type='NEW')
+    bpy.ops.mesh.fuzzy_floor()
+    assert file_data_version() == FUZZY_DATA_VERSION
+
+
+def test_old_names_are_migrated(scene):
+    bpy.ops.mesh.fuzzy_floor()
+    scene.fuzzy_props.data_version = 0
+    scene.objects['FuzzyFloor'].name = 'Fuzzy floor'
+    assert migrate_file()
+    assert 'FuzzyFloor' in scene.objects
+    assert scene.fuzzy_props.data_version == FUZZY_DATA_VERSION